@@ -0,0 +1,92 @@
+"""
+@Description Benchmark du temps de démarrage à froid de chaque mode (imports mesurés dans un interpréteur neuf)
+
+Utilisation :
+  python -m benchmarks.bench_startup --runs 5
+"""
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+## Arguments passés à main.py et modules importés par chaque mode avant sa première saisie ou fenêtre
+MODES = {
+    "--help": (["--help"], []),
+    "--cli": (["--cli"], ["cli.console"]),
+    "--gui": (["--gui"], ["cli.interface"]),
+    "report": (["report", "--files", "data/Sales_April_2019.csv"], ["cli.report", "core.data_loader", "core.data_processor"]),
+}
+
+## Modules lourds dont la présence est signalée pour chaque mode
+HEAVY_MODULES = ["pandas", "numpy", "matplotlib", "tkinter"]
+
+## Script exécuté dans l'interpréteur neuf : analyse des arguments par main.py, puis imports du mode
+PROBE = """
+import importlib, json, sys, time
+start = time.perf_counter()
+import main
+arguments, modules, heavy = json.loads(sys.argv[1])
+parser = main.build_parser()
+if "--help" not in arguments:
+    parser.parse_args(arguments)
+for module in modules:
+    importlib.import_module(module)
+elapsed = time.perf_counter() - start
+print(json.dumps({"seconds": elapsed, "loaded": [name for name in heavy if name in sys.modules]}))
+"""
+
+
+def run_probe(arguments: list, modules: list) -> dict:
+    """
+    @Description Mesure les imports d'un mode dans un nouvel interpréteur
+
+    @Params {arguments} : list => Arguments de main.py
+    @Params {modules} : list => Modules importés par le mode
+    @Return: dict => Durée des imports (secondes) et modules lourds chargés
+    """
+    payload = json.dumps([arguments, modules, HEAVY_MODULES])
+    result = subprocess.run([sys.executable, "-c", PROBE, payload], cwd=ROOT, capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+def process_time(arguments: list) -> float:
+    """
+    @Description Mesure la durée totale d'un processus python (démarrage de l'interpréteur compris)
+
+    @Params {arguments} : list => Arguments passés à l'interpréteur
+    @Return: float => Durée en secondes
+    """
+    start = time.perf_counter()
+    subprocess.run([sys.executable] + arguments, cwd=ROOT, capture_output=True, check=True)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark du démarrage de l'application")
+    parser.add_argument("--runs", type=int, default=5, help="Nombre d'essais par mode (le meilleur est retenu)")
+    args = parser.parse_args()
+
+    ## Les premiers lancements remplissent le cache des fichiers .pyc et du système : ils ne sont pas comptés
+    run_probe(*MODES["report"])
+    run_probe(*MODES["--gui"])
+
+    interpreter = min(process_time(["-c", "pass"]) for _ in range(args.runs))
+    help_total = min(process_time(["main.py", "--help"]) for _ in range(args.runs))
+
+    print(f"\n=== Démarrage à froid ({args.runs} essais, meilleur temps) ===")
+    print(f"Interpréteur seul           : {interpreter * 1000:.1f} ms")
+    print(f"python main.py --help       : {help_total * 1000:.1f} ms (processus complet)")
+    print("\nImports par mode :")
+    for name, (arguments, modules) in MODES.items():
+        results = [run_probe(arguments, modules) for _ in range(args.runs)]
+        best = min(result["seconds"] for result in results)
+        loaded = ", ".join(results[0]["loaded"]) or "aucun"
+        print(f"  {name:<8} : {best * 1000:8.1f} ms  | modules lourds : {loaded}")
+
+
+if __name__ == "__main__":
+    main()
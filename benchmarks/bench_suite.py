@@ -0,0 +1,309 @@
+"""
+@Description Suite de benchmarks de DataLoader et DataProcessor sur des données synthétiques de taille croissante
+
+Chaque méthode publique est mesurée sur des données fraîchement préparées (la préparation n'est pas chronométrée) :
+temps (meilleur de --runs essais) et pic de mémoire allouée pendant l'appel (tracemalloc, essai séparé).
+Les résultats sont écrits en JSON, avec le commit courant, pour comparer deux versions (--compare).
+
+Utilisation :
+  python -m benchmarks.bench_suite --sizes 100000 1000000 10000000
+  python -m benchmarks.bench_suite --sizes 100000 --compare benchmarks/results/<commit>.json
+"""
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import argparse
+import contextlib
+import fnmatch
+import gc
+import io
+import json
+import platform
+import subprocess
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+import numpy as np
+import pandas as pd
+from core.cube import SalesCube
+from core.data_loader import REQUIRED_COLUMNS, DataLoader
+from core.data_processor import DataProcessor
+from core.indexes import SalesIndexes, normalize_order_id
+from benchmarks.synthetic_sales import write_sales_csv
+
+DEFAULT_SIZES = [100_000, 1_000_000, 10_000_000]
+## Nombre d'opérations des benchmarks d'ajout en lot et de rejeu du journal
+BATCH_SIZE = 1000
+
+## Cas de benchmark : (nom, préparation non chronométrée, appel chronométré)
+Case = Tuple[str, Callable[[], Any], Callable[[Any], Any]]
+
+
+def git_commit() -> Optional[str]:
+    """
+    @Description Retourne le commit courant (None hors d'un dépôt git)
+    """
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True)
+        return result.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def dataset_path(directory: Path, rows: int, seed: int) -> Path:
+    """
+    @Description Retourne le fichier synthétique d'une taille, généré au premier usage puis réutilisé
+
+    @Params {directory} : Path => Dossier des fichiers générés
+    @Params {rows} : int => Nombre de lignes
+    @Params {seed} : int => Graine du générateur
+    @Return: Path => Chemin du fichier CSV
+    """
+    path = directory / f"sales_{rows}_{seed}.csv"
+    if not path.exists():
+        start = time.perf_counter()
+        write_sales_csv(path, rows, seed)
+        print(f"Fichier généré : {path} ({time.perf_counter() - start:.1f} s)")
+    return path
+
+
+def _loader_with(df: pd.DataFrame) -> DataLoader:
+    """
+    @Description Prépare un DataLoader contenant déjà des données (index non construits)
+    """
+    loader = DataLoader()
+    loader.data = df
+    loader.indexes = SalesIndexes(df)
+    return loader
+
+
+def _ready_processor(df: pd.DataFrame, cube: SalesCube, copy: bool = False) -> DataProcessor:
+    """
+    @Description Prépare un DataProcessor dont les agrégats sont calculés | copy=True pour les méthodes qui modifient les données
+    """
+    if copy:
+        df = df.copy()
+        cube = SalesCube(cube.cells)
+    processor = DataProcessor(df, cube=cube)
+    processor.aggregates
+    return processor
+
+
+def _journal_entries(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """
+    @Description Construit des opérations de journal (moitié modifications, moitié ajouts) au format de EditJournal
+    """
+    sample = df[REQUIRED_COLUMNS].head(BATCH_SIZE // 2)
+    entries = [
+        {"op": "modify", "order_id": normalize_order_id(order_id), "line": None, "quantity": 2, "price": None}
+        for order_id in sample["Order ID"]
+    ]
+    for record in sample.to_dict(orient="records"):
+        record["Order Date"] = record["Order Date"].isoformat()
+        record["Quantity Ordered"] = int(record["Quantity Ordered"])
+        record["Price Each"] = float(record["Price Each"])
+        entries.append({"op": "add", "row": record})
+    return entries
+
+
+def _consume(chunks) -> int:
+    return sum(len(chunk) for chunk in chunks)
+
+
+def build_cases(path: Path, df: pd.DataFrame, cube: SalesCube) -> List[Case]:
+    """
+    @Description Liste les cas mesurés : toutes les méthodes publiques de DataLoader et DataProcessor
+
+    @Params {path} : Path => Fichier CSV synthétique
+    @Params {df} : pd.DataFrame => Données validées du fichier
+    @Params {cube} : SalesCube => Cube des données
+    @Return: List[Case] => Cas de benchmark
+    """
+    file = str(path)
+    product = df["Product"].mode().iloc[0]
+    day = df["Order Date"].iloc[len(df) // 2].strftime("%Y-%m-%d")
+    order_id = df["Order ID"].iloc[len(df) // 2]
+    ## Bornes au milieu d'une heure : chiffre d'affaires calculé avec les cellules du cube et les lignes en bordure
+    start, end = "2019-03-01 10:30", "2019-03-31 18:15"
+    new_row = df[REQUIRED_COLUMNS].head(1)
+    new_rows = df[REQUIRED_COLUMNS].head(BATCH_SIZE)
+    entries = _journal_entries(df)
+
+    new_loader = DataLoader
+    loaded = lambda: _loader_with(df)
+    ready = lambda: _ready_processor(df, cube)
+    writable = lambda: _ready_processor(df, cube, copy=True)
+
+    return [
+        ("DataLoader.load_csv", new_loader, lambda loader: loader.load_csv(file, use_cache=False, replay_journal=False)),
+        ("DataLoader.load_csv[cache]", new_loader, lambda loader: loader.load_csv(file, replay_journal=False)),
+        ("DataLoader.load_csv[cache,compact]", new_loader, lambda loader: loader.load_csv(file, compact=True, replay_journal=False)),
+        ("DataLoader.load_files", new_loader, lambda loader: loader.load_files([file], max_workers=1)),
+        ("DataLoader.load_directory", new_loader, lambda loader: loader.load_directory(str(path.parent), path.name, max_workers=1)),
+        ("DataLoader.iter_csv", new_loader, lambda loader: _consume(loader.iter_csv(file))),
+        ("DataLoader.stream_aggregates", new_loader, lambda loader: loader.stream_aggregates(file)),
+        ("DataLoader.compact", loaded, lambda loader: loader.compact()),
+        ("DataLoader.memory_report", loaded, lambda loader: loader.memory_report()),
+        ("DataLoader.get_unique_products", loaded, lambda loader: loader.get_unique_products()),
+        ("DataLoader.filter_by_product", loaded, lambda loader: loader.filter_by_product(product)),
+        ("DataLoader.filter_by_date", loaded, lambda loader: loader.filter_by_date(day)),
+
+        ("DataProcessor.__init__", lambda: None, lambda _: DataProcessor(df)),
+        ("DataProcessor.aggregates[rows]", lambda: DataProcessor(df), lambda processor: processor.aggregates),
+        ("DataProcessor.aggregates[cube]", lambda: DataProcessor(df, cube=cube), lambda processor: processor.aggregates),
+        ("DataProcessor.cube", lambda: DataProcessor(df), lambda processor: processor.cube),
+        ("DataProcessor.get_sales_summary", ready, lambda processor: processor.get_sales_summary()),
+        ("DataProcessor.get_best_selling_product", ready, lambda processor: processor.get_best_selling_product()),
+        ("DataProcessor.get_sales_trends", ready, lambda processor: processor.get_sales_trends()),
+        ("DataProcessor.get_sales_by_city", ready, lambda processor: processor.get_sales_by_city()),
+        ("DataProcessor.get_sales_by_state", ready, lambda processor: processor.get_sales_by_state()),
+        ("DataProcessor.get_sales_by_threshold", ready, lambda processor: processor.get_sales_by_threshold(min_quantity=2, max_price=100)),
+        ("DataProcessor.get_threshold_positions", ready, lambda processor: processor.get_threshold_positions(min_quantity=2, max_price=100)),
+        ("DataProcessor.calculate_total_revenue", ready, lambda processor: processor.calculate_total_revenue(start, end)),
+        ("DataProcessor.get_view", ready, lambda processor: processor.get_view(start, end, product=product)),
+        ("DataProcessor.get_filter_positions", ready, lambda processor: processor.get_filter_positions(day, product)),
+        ("DataProcessor.get_filtered_view", ready, lambda processor: processor.get_filtered_view(day, product)),
+        ("DataProcessor.filter_by_date", ready, lambda processor: processor.filter_by_date(day)),
+        ("DataProcessor.get_unique_products", ready, lambda processor: processor.get_unique_products()),
+        ("DataProcessor.filter_by_product", ready, lambda processor: processor.filter_by_product(product)),
+        ("DataProcessor.find_order", ready, lambda processor: processor.find_order(order_id)),
+        ("DataProcessor.modify_sales_entry", writable, lambda processor: processor.modify_sales_entry(order_id, new_quantity=3)),
+        ("DataProcessor.add_sales_entry", writable, lambda processor: processor.add_sales_entry(new_row)),
+        ("DataProcessor.add_sales_entries", writable, lambda processor: processor.add_sales_entries(new_rows)),
+        ("DataProcessor.apply_journal", writable, lambda processor: processor.apply_journal(entries)),
+        ("DataProcessor.compact_data", writable, lambda processor: Path(processor.compact_data(file)).unlink()),
+    ]
+
+
+def _result_rows(result: Any) -> Optional[int]:
+    """
+    @Description Nombre de lignes produites par un appel (None si le résultat n'est pas tabulaire)
+    """
+    if isinstance(result, (pd.DataFrame, pd.Series, np.ndarray)):
+        return len(result)
+    if isinstance(result, int) and not isinstance(result, bool):
+        return result
+    return None
+
+
+def measure(setup: Callable[[], Any], run: Callable[[Any], Any], runs: int, memory: bool) -> Dict[str, Any]:
+    """
+    @Description Mesure un cas : meilleur temps sur plusieurs essais, puis pic de mémoire sur un essai séparé (tracemalloc ralentit l'appel)
+
+    @Params {setup} : Callable => Préparation appelée avant chaque essai, non mesurée
+    @Params {run} : Callable => Appel mesuré, reçoit le résultat de setup
+    @Params {runs} : int => Nombre d'essais chronométrés
+    @Params {memory} : bool => Mesurer aussi le pic de mémoire
+    @Return: Dict[str, Any] => seconds, timings, peak_memory_bytes et rows_out
+    """
+    timings, rows_out = [], None
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(runs):
+            state = setup()
+            gc.collect()
+            start = time.perf_counter()
+            result = run(state)
+            timings.append(time.perf_counter() - start)
+            rows_out = _result_rows(result)
+            del state, result
+
+        peak = None
+        if memory:
+            state = setup()
+            gc.collect()
+            tracemalloc.start()
+            result = run(state)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            del state, result
+
+    return {"seconds": min(timings), "timings": timings, "peak_memory_bytes": peak, "rows_out": rows_out}
+
+
+def run_suite(sizes: List[int], data_dir: Path, seed: int, runs: int, memory: bool, only: List[str] = None) -> Dict[str, Any]:
+    """
+    @Description Exécute tous les cas pour chaque taille de données
+
+    @Params {sizes} : List[int] => Nombres de lignes des fichiers synthétiques
+    @Params {data_dir} : Path => Dossier des fichiers générés
+    @Params {seed} : int => Graine du générateur
+    @Params {runs} : int => Nombre d'essais chronométrés par cas
+    @Params {memory} : bool => Mesurer le pic de mémoire
+    @Params {only} : List[str] => Motifs des cas à exécuter (ex: "DataProcessor.get_*"), tous par défaut
+    @Return: Dict[str, Any] => Contexte d'exécution et résultats
+    """
+    report = {
+        "commit": git_commit(),
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "seed": seed,
+        "runs": runs,
+        "results": [],
+    }
+
+    for rows in sizes:
+        path = dataset_path(data_dir, rows, seed)
+        ## Premier chargement : remplit le cache et le cube du fichier, et fournit les données des autres cas
+        loader = DataLoader()
+        with contextlib.redirect_stdout(io.StringIO()):
+            df = loader.load_csv(str(path), replay_journal=False)
+        print(f"\n=== {rows} lignes ({len(df)} valides) ===")
+
+        for name, setup, run in build_cases(path, df, loader.cube):
+            if only and not any(fnmatch.fnmatch(name, pattern) for pattern in only):
+                continue
+            result = measure(setup, run, runs, memory)
+            report["results"].append({"rows": rows, "valid_rows": len(df), "case": name, **result})
+            peak = "" if result["peak_memory_bytes"] is None else f"  | pic {result['peak_memory_bytes'] / 1e6:9.1f} Mo"
+            print(f"  {name:<40} {result['seconds'] * 1000:10.1f} ms{peak}")
+
+        del loader, df
+        gc.collect()
+    return report
+
+
+def compare(report: Dict[str, Any], previous: Dict[str, Any]) -> None:
+    """
+    @Description Affiche le rapport des temps entre deux exécutions de la suite (> 1 : plus lent qu'avant)
+
+    @Params {report} : Dict[str, Any] => Résultats courants
+    @Params {previous} : Dict[str, Any] => Résultats de référence (ex: commit précédent)
+    """
+    reference = {(result["rows"], result["case"]): result for result in previous["results"]}
+    print(f"\n=== Comparaison avec {previous.get('commit') or 'la référence'} (temps actuel / temps de référence) ===")
+    for result in report["results"]:
+        before = reference.get((result["rows"], result["case"]))
+        if before is None:
+            continue
+        ratio = result["seconds"] / before["seconds"] if before["seconds"] else float("inf")
+        flag = "  <- régression" if ratio > 1.2 else ""
+        print(f"  {result['rows']:>9} {result['case']:<40} x{ratio:.2f}{flag}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Suite de benchmarks sur données synthétiques")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Nombres de lignes (100000 1000000 10000000 par défaut)")
+    parser.add_argument("--runs", type=int, default=3, help="Nombre d'essais chronométrés par cas (le meilleur est retenu)")
+    parser.add_argument("--seed", type=int, default=0, help="Graine du générateur de données")
+    parser.add_argument("--data-dir", default="benchmarks/data", help="Dossier des fichiers synthétiques (réutilisés d'une exécution à l'autre)")
+    parser.add_argument("--only", nargs="+", help="Motifs des cas à exécuter (ex: 'DataProcessor.get_*')")
+    parser.add_argument("--no-memory", action="store_true", help="Ne pas mesurer le pic de mémoire")
+    parser.add_argument("--output", help="Fichier JSON des résultats (benchmarks/results/<commit>.json par défaut)")
+    parser.add_argument("--compare", help="Fichier JSON d'une exécution précédente à comparer")
+    args = parser.parse_args()
+
+    report = run_suite(args.sizes, Path(args.data_dir), args.seed, args.runs, not args.no_memory, args.only)
+
+    output = Path(args.output or f"benchmarks/results/{report['commit'] or 'results'}.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"\nRésultats écrits dans {output}")
+
+    if args.compare:
+        compare(report, json.loads(Path(args.compare).read_text(encoding="utf-8")))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+@Description Benchmark de DataProcessor.get_sales_trends comparé à l'ancienne implémentation (lambdas par groupe)
+
+Utilisation :
+  python -m benchmarks.bench_trends --file data/Sales_April_2019.csv --repeat 10
+"""
+import argparse
+import time
+import pandas as pd
+from core.data_loader import DataLoader
+from core.data_processor import DataProcessor
+
+
+def legacy_sales_trends(data: pd.DataFrame) -> dict:
+    """
+    @Description Ancienne implémentation de get_sales_trends, conservée comme référence de performance
+    """
+    df = data.copy()
+    df['Year'] = df['Order Date'].dt.year
+    df['Month'] = df['Order Date'].dt.month
+    df['Day'] = df['Order Date'].dt.day
+    df['Hour'] = df['Order Date'].dt.hour
+
+    monthly_trends = df.groupby(['Year', 'Month']).agg({
+        'Order ID': 'count',
+        'Quantity Ordered': 'sum',
+        'Price Each': lambda x: (x * df.loc[x.index, 'Quantity Ordered']).sum()
+    }).round(2).reset_index()
+    monthly_trends.columns = ['Year', 'Month', 'number_of_orders', 'total_quantity', 'total_revenue']
+
+    hourly_trends = df.groupby('Hour').agg({
+        'Order ID': 'count',
+        'Quantity Ordered': 'sum',
+        'Price Each': lambda x: (x * df.loc[x.index, 'Quantity Ordered']).sum()
+    }).round(2).reset_index()
+    hourly_trends.columns = ['Hour', 'number_of_orders', 'total_quantity', 'total_revenue']
+
+    product_monthly_trends = df.groupby(['Year', 'Month', 'Product'], observed=True).agg({
+        'Quantity Ordered': 'sum',
+        'Price Each': lambda x: (x * df.loc[x.index, 'Quantity Ordered']).sum()
+    }).round(2)
+    product_monthly_trends.columns = ['total_quantity', 'total_revenue']
+
+    return {'monthly': monthly_trends, 'hourly': hourly_trends, 'product_monthly': product_monthly_trends}
+
+
+def best_time(function, runs: int) -> float:
+    """
+    @Description Retourne le meilleur temps d'exécution (en secondes) sur plusieurs essais
+    """
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark des tendances de ventes")
+    parser.add_argument("--file", default="data/Sales_April_2019.csv", help="Fichier CSV de référence")
+    parser.add_argument("--repeat", type=int, default=10, help="Nombre de copies du fichier concaténées")
+    parser.add_argument("--runs", type=int, default=3, help="Nombre d'essais par implémentation")
+    args = parser.parse_args()
+
+    data = DataLoader().load_csv(args.file)
+    data = pd.concat([data] * args.repeat, ignore_index=True)
+
+    ## Les deux implémentations doivent produire les mêmes résultats
+    expected = legacy_sales_trends(data)
+    actual = DataProcessor(data).get_sales_trends()
+    for key in expected:
+        pd.testing.assert_frame_equal(actual[key], expected[key], check_index_type=False, check_exact=False)
+
+    legacy = best_time(lambda: legacy_sales_trends(data), args.runs)
+    current = best_time(lambda: DataProcessor(data).get_sales_trends(), args.runs)
+    processor = DataProcessor(data)
+    processor.get_sales_trends()
+    warm = best_time(processor.get_sales_trends, args.runs)
+
+    print(f"\n=== Tendances de ventes ({len(data)} lignes) ===")
+    print(f"Ancienne implémentation : {legacy * 1000:.1f} ms")
+    print(f"Implémentation actuelle : {current * 1000:.1f} ms")
+    print(f"Accélération            : x{legacy / current:.1f}")
+    print(f"Appels suivants         : {warm * 1000:.1f} ms (agrégats déjà calculés)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""
+@Description Générateur de données de ventes synthétiques au format des exports réels (Sales_<Mois>_2019.csv)
+
+Utilisation :
+  python -m benchmarks.synthetic_sales --rows 1000000 --output benchmarks/data/sales_1000000.csv
+"""
+from typing import Optional
+import argparse
+import time
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+COLUMNS = ["Order ID", "Product", "Quantity Ordered", "Price Each", "Order Date", "Purchase Address"]
+
+## Produits, prix (tels qu'écrits dans les exports) et nombre de lignes observées dans Sales_April_2019.csv
+PRODUCTS = [
+    ("Lightning Charging Cable", "14.95", 2201),
+    ("USB-C Charging Cable", "11.95", 2079),
+    ("AA Batteries (4-pack)", "3.84", 2063),
+    ("AAA Batteries (4-pack)", "2.99", 1989),
+    ("Wired Headphones", "11.99", 1890),
+    ("Apple Airpods Headphones", "150", 1515),
+    ("Bose SoundSport Headphones", "99.99", 1280),
+    ("27in FHD Monitor", "149.99", 734),
+    ("iPhone", "700", 693),
+    ("34in Ultrawide Monitor", "379.99", 650),
+    ("Google Phone", "600", 581),
+    ("27in 4K Gaming Monitor", "389.99", 563),
+    ("Flatscreen TV", "300", 458),
+    ("Macbook Pro Laptop", "1700", 453),
+    ("ThinkPad Laptop", "999.99", 392),
+    ("20in Monitor", "109.99", 390),
+    ("Vareebadd Phone", "400", 220),
+    ("LG Dryer", "600.0", 77),
+    ("LG Washing Machine", "600.0", 61),
+]
+
+## Villes (avec état et code postal uniques par ville) et nombre de lignes observées
+CITIES = [
+    ("San Francisco, CA 94016", 4437),
+    ("Los Angeles, CA 90001", 3026),
+    ("New York City, NY 10001", 2434),
+    ("Boston, MA 02215", 1918),
+    ("Atlanta, GA 30301", 1472),
+    ("Seattle, WA 98101", 1442),
+    ("Dallas, TX 75001", 1350),
+    ("Portland, OR 97035", 994),
+    ("Austin, TX 73301", 973),
+    ("Portland, ME 04101", 243),
+]
+
+STREETS = [
+    "12th St", "Hill St", "Lincoln St", "Center St", "Hickory St", "7th St", "Sunset St", "5th St", "Main St", "10th St",
+    "Cherry St", "South St", "13th St", "Madison St", "Cedar St", "14th St", "Johnson St", "Chestnut St", "Highland St", "Adams St",
+    "Dogwood St", "Elm St", "1st St", "Wilson St", "Willow St", "6th St", "4th St", "Jackson St", "9th St", "Maple St",
+    "Pine St", "Park St", "Ridge St", "Spruce St", "West St", "North St", "Lake St", "Washington St", "Meadow St", "Forest St",
+    "Jefferson St", "Church St", "River St", "Walnut St", "2nd St", "3rd St", "8th St", "11th St", "15th St", "Lakeview St",
+]
+
+## Répartition des quantités par ligne et des commandes par heure observées dans Sales_April_2019.csv
+QUANTITIES = [16558, 1328, 299, 72, 24, 7, 1]
+HOURS = [378, 244, 132, 85, 84, 143, 254, 384, 643, 869, 1134, 1201, 1201, 1192, 1112, 986, 1054, 1013, 1227, 1286, 1201, 1018, 849, 599]
+
+## Part des lignes qui prolongent la commande précédente (même Order ID, date et adresse)
+MULTI_LINE_RATE = 0.04
+## Lignes parasites des exports : lignes vides, en-têtes répétés et lignes mal formées
+BLANK_RATE = 0.003
+HEADER_RATE = 0.002
+MALFORMED_RATE = 0.0005
+
+FIRST_ORDER_ID = 100000
+
+
+def _weights(counts) -> np.ndarray:
+    """
+    @Description Convertit des effectifs en probabilités de tirage
+    """
+    counts = np.asarray(counts, dtype=np.float64)
+    return counts / counts.sum()
+
+
+def _minute_labels(start: pd.Timestamp, days: int) -> np.ndarray:
+    """
+    @Description Précalcule le libellé de chaque minute de la période (MM/DD/YY HH:MM) : formater une date revient ensuite à lire un tableau
+    """
+    dates = pd.date_range(start, periods=days, freq="D").strftime("%m/%d/%y ").to_numpy(dtype=object)
+    times = np.array([f"{hour:02d}:{minute:02d}" for hour in range(24) for minute in range(60)], dtype=object)
+    return (dates[:, None] + times[None, :]).ravel()
+
+
+def _malformed_rows(rng: np.random.Generator, count: int, labels: np.ndarray) -> pd.DataFrame:
+    """
+    @Description Construit des lignes mal formées : produit absent, quantité ou prix non numérique, date invalide
+    """
+    frame = _clean_rows(rng, count, FIRST_ORDER_ID, labels).astype(object)
+    kinds = rng.integers(0, 4, count)
+    frame.loc[kinds == 0, "Product"] = ""
+    frame.loc[kinds == 1, "Quantity Ordered"] = "deux"
+    frame.loc[kinds == 2, "Price Each"] = "N/A"
+    frame.loc[kinds == 3, "Order Date"] = "13/45/19 25:61"
+    return frame
+
+
+def _clean_rows(rng: np.random.Generator, count: int, first_order_id: int, labels: np.ndarray) -> pd.DataFrame:
+    """
+    @Description Tire des lignes de ventes valides (produits, quantités, heures et villes selon les répartitions observées)
+    """
+    ## Une part MULTI_LINE_RATE des lignes prolonge la commande précédente : même Order ID, date et adresse
+    new_order = rng.random(count) >= MULTI_LINE_RATE
+    new_order[0] = True
+    order_index = np.cumsum(new_order) - 1
+    orders = int(order_index[-1]) + 1
+
+    days = len(labels) // (24 * 60)
+    minute = (rng.integers(0, days, orders) * 24 + rng.choice(24, orders, p=_weights(HOURS))) * 60 + rng.integers(0, 60, orders)
+    combos = np.array([f" {street}, {city}" for street in STREETS for city, _ in CITIES], dtype=object)
+    city = rng.choice(len(CITIES), orders, p=_weights([weight for _, weight in CITIES]))
+    street = rng.integers(0, len(STREETS), orders)
+    numbers = np.array([str(number) for number in range(1000)], dtype=object)
+    addresses = numbers[rng.integers(1, 1000, orders)] + combos[street * len(CITIES) + city]
+
+    product = rng.choice(len(PRODUCTS), count, p=_weights([weight for _, _, weight in PRODUCTS]))
+    names = np.array([name for name, _, _ in PRODUCTS], dtype=object)
+    prices = np.array([price for _, price, _ in PRODUCTS], dtype=object)
+    return pd.DataFrame({
+        "Order ID": (first_order_id + order_index).astype(str).astype(object),
+        "Product": names[product],
+        "Quantity Ordered": (rng.choice(len(QUANTITIES), count, p=_weights(QUANTITIES)) + 1).astype(str).astype(object),
+        "Price Each": prices[product],
+        "Order Date": labels[minute[order_index]],
+        "Purchase Address": addresses[order_index],
+    })
+
+
+def generate_sales(rows: int, seed: int = 0, start: str = "2019-01-01", days: int = 365,
+                   first_order_id: int = FIRST_ORDER_ID, labels: Optional[np.ndarray] = None) -> pd.DataFrame:
+    """
+    @Description Génère des lignes brutes (texte) au format des exports, lignes vides, en-têtes répétés et lignes mal formées compris
+
+    @Params {rows} : int => Nombre de lignes de données (lignes parasites comprises)
+    @Params {seed} : int => Graine du générateur aléatoire (mêmes paramètres => mêmes lignes)
+    @Params {start} : str => Premier jour de la période des commandes
+    @Params {days} : int => Nombre de jours de la période
+    @Params {first_order_id} : int => Premier Order ID
+    @Params {labels} : np.ndarray => Libellés des minutes de la période, déjà calculés (optionnel)
+    @Return: pd.DataFrame => Lignes brutes, toutes les colonnes en texte
+    """
+    rng = np.random.default_rng(seed)
+    if labels is None:
+        labels = _minute_labels(pd.Timestamp(start), days)
+
+    blank, header, malformed = (int(rng.binomial(rows, rate)) for rate in (BLANK_RATE, HEADER_RATE, MALFORMED_RATE))
+    noise = blank + header + malformed
+    clean = _clean_rows(rng, max(rows - noise, 1), first_order_id, labels)
+    if noise == 0:
+        return clean
+
+    parasites = pd.concat([
+        pd.DataFrame([[""] * len(COLUMNS)] * blank, columns=COLUMNS),
+        pd.DataFrame([COLUMNS] * header, columns=COLUMNS),
+        _malformed_rows(rng, malformed, labels) if malformed else None,
+    ], ignore_index=True)
+
+    ## Lignes parasites insérées à des positions aléatoires, l'ordre des lignes valides est conservé
+    total = len(clean) + noise
+    is_noise = np.zeros(total, dtype=bool)
+    is_noise[rng.choice(total, noise, replace=False)] = True
+    order = np.empty(total, dtype=np.int64)
+    order[~is_noise] = np.arange(len(clean))
+    order[is_noise] = len(clean) + rng.permutation(noise)
+    return pd.concat([clean, parasites], ignore_index=True).take(order).reset_index(drop=True)
+
+
+def write_sales_csv(path: str, rows: int, seed: int = 0, chunk_size: int = 500_000, start: str = "2019-01-01", days: int = 365) -> Path:
+    """
+    @Description Écrit un fichier CSV synthétique par morceaux (la mémoire utilisée dépend de chunk_size, pas de rows)
+
+    @Params {path} : str => Fichier à créer
+    @Params {rows} : int => Nombre de lignes de données
+    @Params {seed} : int => Graine du générateur aléatoire
+    @Params {chunk_size} : int => Nombre de lignes générées par morceau
+    @Params {start} : str => Premier jour de la période des commandes
+    @Params {days} : int => Nombre de jours de la période
+    @Return: Path => Chemin du fichier écrit
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    labels = _minute_labels(pd.Timestamp(start), days)
+
+    order_id = FIRST_ORDER_ID
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        for number, offset in enumerate(range(0, rows, chunk_size)):
+            chunk = generate_sales(min(chunk_size, rows - offset), seed=seed * 1_000_003 + number, first_order_id=order_id, labels=labels)
+            chunk.to_csv(f, index=False, header=number == 0)
+            ## Order ID suivants : au-delà du plus grand identifiant valide du morceau
+            order_id = int(pd.to_numeric(chunk["Order ID"], errors="coerce").max()) + 1
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Générer un fichier de ventes synthétique")
+    parser.add_argument("--rows", type=int, default=100_000, help="Nombre de lignes de données")
+    parser.add_argument("--output", help="Fichier CSV à créer (benchmarks/data/sales_<rows>.csv par défaut)")
+    parser.add_argument("--seed", type=int, default=0, help="Graine du générateur aléatoire")
+    args = parser.parse_args()
+
+    output = args.output or f"benchmarks/data/sales_{args.rows}.csv"
+    start = time.perf_counter()
+    path = write_sales_csv(output, args.rows, args.seed)
+    print(f"{args.rows} lignes écrites dans {path} ({path.stat().st_size / 1e6:.1f} Mo) en {time.perf_counter() - start:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
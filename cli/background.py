@@ -0,0 +1,94 @@
+import queue
+import threading
+from typing import Any, Callable, Iterator, Tuple
+
+
+class OperationCancelled(Exception):
+    """
+    @Description Levée dans une tâche de fond lorsque l'utilisateur l'a annulée
+    """
+
+
+class BackgroundTask:
+    """
+    @Description Exécute une fonction dans un thread et transmet ses événements (progression, résultats) par une file | L'interface lit la file depuis son propre thread, ex: avec window.after.
+    """
+
+    ## Événements qui terminent la tâche
+    FINAL_EVENTS = ("done", "cancelled", "error")
+
+    def __init__(self, target: Callable, *args: Any):
+        """
+        @Description Prépare la tâche sans la démarrer
+
+        @Params {target} : Callable => Fonction exécutée en arrière-plan, appelée avec (tâche, *args)
+        @Params {args} : Any => Arguments supplémentaires de la fonction
+        """
+        self.events = queue.Queue()
+        self._cancelled = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(target, args), daemon=True)
+
+    def start(self) -> "BackgroundTask":
+        """
+        @Description Démarre la tâche dans son thread
+
+        @Return: BackgroundTask => La tâche elle-même
+        """
+        self._thread.start()
+        return self
+
+    def _run(self, target: Callable, args: tuple) -> None:
+        """
+        @Description Corps du thread : exécute la fonction et signale sa fin, son annulation ou son erreur
+        """
+        try:
+            target(self, *args)
+            self.post("done")
+        except OperationCancelled:
+            self.post("cancelled")
+        except Exception as e:
+            self.post("error", str(e))
+
+    def post(self, kind: str, payload: Any = None) -> None:
+        """
+        @Description Envoie un événement à l'interface (appelé depuis le thread de la tâche)
+
+        @Params {kind} : str => Type d'événement (ex: progress, summary)
+        @Params {payload} : Any => Données associées
+        """
+        self.events.put((kind, payload))
+
+    def progress(self, value: float, text: str) -> None:
+        """
+        @Description Signale l'avancement de la tâche, après avoir vérifié qu'elle n'a pas été annulée
+
+        @Params {value} : float => Avancement en pourcentage
+        @Params {text} : str => Étape en cours
+        """
+        self.check()
+        self.post("progress", (value, text))
+
+    def check(self) -> None:
+        """
+        @Description Interrompt la tâche si une annulation a été demandée (à appeler entre deux étapes)
+        """
+        if self._cancelled.is_set():
+            raise OperationCancelled()
+
+    def cancel(self) -> None:
+        """
+        @Description Demande l'annulation de la tâche (prise en compte à la prochaine étape)
+        """
+        self._cancelled.set()
+
+    def poll(self) -> Iterator[Tuple[str, Any]]:
+        """
+        @Description Retourne les événements en attente sans bloquer
+
+        @Return: Iterator[Tuple[str, Any]] => Couples (type d'événement, données)
+        """
+        while True:
+            try:
+                yield self.events.get_nowait()
+            except queue.Empty:
+                return
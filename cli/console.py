@@ -2,6 +2,9 @@
 from typing import Any
 from core.data_loader import DataLoader
 from core.data_processor import DataProcessor
+from core.instrumentation import instrumentation
+from core.journal import EditJournal
+from cli.pager import Pager
 import os
 from datetime import datetime
 import pandas as pd
@@ -39,6 +42,9 @@ class CLI:
         print("[8] Ajouter une nouvelle vente")
         print("[9] Analyser les tendances de ventes")
         print("[0] Sauvegarder les modifications")
+        print("[C] Compacter les modifications dans le fichier chargé (vide le journal)")
+        print("[V] Ventes par ville et par état")
+        print("[P] Profil d'exécution (durée, lignes et mémoire par étape)")
         print("[E] Quitter")
 
     def export_analysis_to_file(self, analysis_type: str, data: Any) -> str:
@@ -133,14 +139,26 @@ class CLI:
 
         for i, file in enumerate(data_files, 1):
             print(f"{i}. {file}")
+        print("T. Tous les fichiers Sales_*.csv, hors *_updated.csv (chargement parallèle)")
 
         choice = input("\nChoisissez un fichier (numéro) : ")
+        if choice.strip().upper() == "T":
+            try:
+                self.data_loader.load_directory("data")
+                self.data_processor = DataProcessor(self.data_loader.data, cube=self.data_loader.cube)
+                self.current_file = os.path.join("data", "Sales_all.csv")
+                print("\nTous les fichiers ont été chargés avec succès!")
+            except Exception as e:
+                print(f"\nErreur: {str(e)}")
+            return
+
         try:
             file_index = int(choice) - 1
             if 0 <= file_index < len(data_files):
                 file_path = os.path.join("data", data_files[file_index])
                 self.data_loader.load_csv(file_path)
-                self.data_processor = DataProcessor(self.data_loader.data)
+                self.data_processor = DataProcessor(self.data_loader.data, cube=self.data_loader.cube)
+                self.data_processor.attach_journal(EditJournal.for_csv(file_path))
                 self.current_file = file_path
                 print(f"\nFichier {data_files[file_index]} chargé avec succès!")
             else:
@@ -155,14 +173,17 @@ class CLI:
         if not self._check_data_loaded():
             return
 
-        date_str = input("\nEntrez la date (YYYY-MM-DD) : ")
+        date_str = input("\nEntrez la date (YYYY-MM-DD) : ").strip()
+        if not date_str:
+            print("\nErreur: Veuillez entrer une date.")
+            return
         try:
-            filtered_data = self.data_loader.filter_by_date(date_str)
-            if filtered_data.empty:
+            ## Positions des ventes du jour : seules les lignes de la page affichée sont extraites
+            pager = Pager(self.data_processor.data, self.data_processor.get_filter_positions(date=date_str))
+            if pager.total == 0:
                 print("\nAucune vente trouvée pour cette date.")
             else:
-                print("\n=== Ventes pour la date", date_str, "===")
-                print(filtered_data.to_string())
+                pager.run(f"Ventes pour la date {date_str}")
         except Exception as e:
             print(f"\nErreur: {str(e)}")
 
@@ -173,7 +194,7 @@ class CLI:
         if not self._check_data_loaded():
             return
 
-        products = self.data_loader.get_unique_products()
+        products = self.data_processor.get_unique_products()
         print("\n=== Produits disponibles ===")
         for i, product in enumerate(products, 1):
             print(f"{i}. {product}")
@@ -183,9 +204,8 @@ class CLI:
             product_index = int(choice) - 1
             if 0 <= product_index < len(products):
                 product = products[product_index]
-                filtered_data = self.data_loader.data[self.data_loader.data["Product"] == product]
-                print(f"\n=== Ventes pour {product} ===")
-                print(filtered_data.to_string())
+                pager = Pager(self.data_processor.data, self.data_processor.get_filter_positions(product=product))
+                pager.run(f"Ventes pour {product}")
             else:
                 print("\nNuméro de produit invalide!")
         except ValueError:
@@ -204,18 +224,18 @@ class CLI:
             min_price = input("Prix minimum (Enter pour ignorer) : ")
             max_price = input("Prix maximum (Enter pour ignorer) : ")
 
-            filtered_data = self.data_processor.get_sales_by_threshold(
+            positions = self.data_processor.get_threshold_positions(
                 min_quantity=int(min_qty) if min_qty else None,
                 max_quantity=int(max_qty) if max_qty else None,
                 min_price=float(min_price) if min_price else None,
                 max_price=float(max_price) if max_price else None
             )
 
-            if filtered_data.empty:
+            pager = Pager(self.data_processor.data, positions)
+            if pager.total == 0:
                 print("\nAucune vente ne correspond aux critères.")
             else:
-                print("\n=== Résultats de la recherche ===")
-                print(filtered_data.to_string())
+                pager.run("Résultats de la recherche")
         except ValueError:
             print("\nErreur: Veuillez entrer des nombres valides.")
 
@@ -239,6 +259,9 @@ class CLI:
 
         print("\n=== Détails du produit le plus vendu ===")
         best_product = self.data_processor.get_best_selling_product()
+        if best_product is None:
+            print("Aucune vente enregistrée.")
+            return
         print(f"Produit: {best_product['product']}")
         print(f"Quantité totale vendue: {best_product['total_quantity']}")
         print(f"Nombre de commandes: {best_product['number_of_orders']}")
@@ -262,6 +285,36 @@ class CLI:
 
         print(f"\nChiffre d'affaires: {revenue:.2f} €")
 
+    def display_sales_by_location(self) -> None:
+        """
+        @Description Affiche les ventes par état puis par ville
+        """
+        if not self._check_data_loaded():
+            return
+
+        print("\n=== Ventes par état ===")
+        print(self.data_processor.get_sales_by_state().to_string())
+        print("\n=== Ventes par ville ===")
+        print(self.data_processor.get_sales_by_city().to_string())
+
+    def display_profile(self) -> None:
+        """
+        @Description Affiche les mesures de l'instrumentation, ou l'active si elle ne l'est pas encore
+        """
+        if not instrumentation.enabled:
+            choice = input("\nL'instrumentation est désactivée. L'activer pour les prochaines opérations ? (o/n) : ")
+            if choice.strip().lower() == "o":
+                instrumentation.enable()
+                print("\nInstrumentation activée : les prochains chargements et analyses seront mesurés.")
+            return
+
+        print("\n=== Profil d'exécution ===")
+        print(instrumentation.format_summary())
+        if instrumentation.trace_path is not None:
+            print(f"\nTrace détaillée : {instrumentation.trace_path}")
+        if input("\nRéinitialiser les mesures ? (o/n) : ").strip().lower() == "o":
+            instrumentation.reset()
+
     def modify_entry(self) -> None:
         """
         @Description Modifie une entrée existante avec gestion des Order ID en double
@@ -270,7 +323,7 @@ class CLI:
             return
 
         order_id = input("\nEntrez l'Order ID à modifier : ")
-        entries = self.data_loader.data[self.data_loader.data["Order ID"] == order_id]
+        entries = self.data_processor.find_order(order_id)
 
         if entries.empty:
             print("\nOrder ID non trouvé!")
@@ -324,7 +377,7 @@ class CLI:
 
             # Afficher l'entrée mise à jour
             print("\nEntrée mise à jour :")
-            print(self.data_loader.data.loc[selected_index].to_frame().T.to_string())
+            print(self.data_processor.data.loc[selected_index].to_frame().T.to_string())
 
         except ValueError:
             print("\nErreur: Valeurs invalides!")
@@ -341,7 +394,7 @@ class CLI:
             order_id = f"{datetime.now().strftime('%Y%m%d%H%M%S')}"
 
             # Affichage des produits existants
-            products = self.data_loader.get_unique_products()
+            products = self.data_processor.get_unique_products()
             print("\nProduits disponibles:")
             idx = 0
             for i, product in enumerate(products, 1):
@@ -387,7 +440,7 @@ class CLI:
 
     def save_modifications(self) -> None:
         """
-        @Description Sauvegarde les modifications dans un fichier *_updated.csv
+        @Description Sauvegarde les modifications (journal des modifications, ou fichier *_updated.csv sans journal)
         """
         if not self._check_data_loaded():
             return
@@ -398,6 +451,19 @@ class CLI:
         except Exception as e:
             print(f"\nErreur lors de la sauvegarde: {str(e)}")
 
+    def compact_modifications(self) -> None:
+        """
+        @Description Fusionne le journal des modifications dans le fichier chargé (fichier *_updated.csv si plusieurs fichiers sont chargés)
+        """
+        if not self._check_data_loaded():
+            return
+
+        try:
+            saved_file = self.data_processor.compact_data(self.current_file)
+            print(f"\nDonnées fusionnées dans : {saved_file}")
+        except Exception as e:
+            print(f"\nErreur lors de la compaction: {str(e)}")
+
     def _check_data_loaded(self) -> bool:
         """
         @Description Vérifie si les données sont chargées
@@ -415,7 +481,7 @@ class CLI:
         """
         while True:
             self.display_menu()
-            choice = input("\nChoisissez une option (0-9) : ")
+            choice = input("\nChoisissez une option (0-9, C, V, P ou E) : ").strip().upper()
 
             if choice == "E":
                 print("\nAu revoir!")
@@ -440,5 +506,11 @@ class CLI:
                 self.analyze_sales_trends()
             elif choice == "0":
                 self.save_modifications()
+            elif choice == "C":
+                self.compact_modifications()
+            elif choice == "V":
+                self.display_sales_by_location()
+            elif choice == "P":
+                self.display_profile()
             else:
-                print("\nOption invalide! Veuillez choisir une option entre 0 et 9.")
+                print("\nOption invalide! Veuillez choisir un chiffre entre 0 et 9, C, V, P ou E.")
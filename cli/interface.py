@@ -2,13 +2,15 @@ import tkinter as tk
 import os
 import webbrowser
 import pandas as pd
-import matplotlib.pyplot as plt
 from datetime import datetime
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from tkinter import ttk, messagebox, filedialog
 from core.data_loader import DataLoader
 from core.data_processor import DataProcessor
+from core.indexes import take_rows
+from cli.background import BackgroundTask
+from cli.virtual_table import VirtualTable
 
 class ModernFrame(ttk.Frame):
     """
@@ -24,6 +26,9 @@ class GUI:
     """
     @Description: Interface graphique moderne pour l'application ESMEMarket
     """
+    ## Délai (ms) après la dernière saisie avant d'appliquer les filtres
+    FILTER_DELAY_MS = 300
+
     def __init__(self):
         self.window = tk.Tk()
         self.window.title("ESMEMarket - Tableau de Bord")
@@ -34,11 +39,21 @@ class GUI:
         # Initialisation des classes de données
         self.data_loader = DataLoader()
         self.data_processor = None
+        ## Source des analyses affichées : le processeur, ou une vue du cube si des filtres sont actifs
+        self.analysis = None
         self.current_df = None
+        ## Tâche de fond en cours (chargement et analyses), None si aucune
+        self.task = None
 
         # Variables pour les filtres
         self.date_var = tk.StringVar()
         self.product_var = tk.StringVar()
+        ## Filtrage en direct : chaque saisie repousse l'application des filtres
+        self.filter_job = None
+        ## Vrai pendant une remise à zéro des filtres par le programme : aucune saisie à filtrer
+        self.filters_muted = False
+        self.date_var.trace_add("write", self._schedule_filters)
+        self.product_var.trace_add("write", self._schedule_filters)
 
         # Configuration du style
         self._configure_styles()
@@ -111,9 +126,20 @@ class GUI:
         btn_frame = ttk.Frame(header)
         btn_frame.grid(row=0, column=1, rowspan=2, sticky="e")
 
-        ttk.Button(btn_frame, text="Charger CSV", command=self._load_csv).pack(side=tk.LEFT, padx=5)
+        self.load_button = ttk.Button(btn_frame, text="Charger CSV", command=self._load_csv)
+        self.load_button.pack(side=tk.LEFT, padx=5)
         ttk.Button(btn_frame, text="Exporter Analyse", command=self._export_analysis).pack(side=tk.LEFT, padx=5)
 
+        # Progression des tâches de fond
+        progress_frame = ttk.Frame(header)
+        progress_frame.grid(row=2, column=0, columnspan=2, sticky="ew", pady=(5, 0))
+        self.progress_bar = ttk.Progressbar(progress_frame, mode='determinate', maximum=100, length=300)
+        self.progress_bar.pack(side=tk.LEFT, padx=5)
+        self.progress_label = ttk.Label(progress_frame, text="", style='Stats.TLabel')
+        self.progress_label.pack(side=tk.LEFT, padx=5)
+        self.cancel_button = ttk.Button(progress_frame, text="Annuler", command=self._cancel_task, state=tk.DISABLED)
+        self.cancel_button.pack(side=tk.LEFT, padx=5)
+
     def _create_filters(self):
         """
         @Description: Crée la section des filtres
@@ -149,17 +175,9 @@ class GUI:
         # Titre de la section
         ttk.Label(data_frame, text="Données", style='Header.TLabel').grid(row=0, column=0, sticky="w", pady=(0, 5))
 
-        # Tableau de données
-        self.tree = ttk.Treeview(data_frame, selectmode='browse', height=20)
-        self.tree.grid(row=1, column=0, sticky="nsew")
-
-        # Scrollbars
-        vsb = ttk.Scrollbar(data_frame, orient="vertical", command=self.tree.yview)
-        vsb.grid(row=1, column=1, sticky="ns")
-        hsb = ttk.Scrollbar(data_frame, orient="horizontal", command=self.tree.xview)
-        hsb.grid(row=2, column=0, sticky="ew")
-
-        self.tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+        # Tableau de données (défilement virtuel : toutes les lignes sont accessibles)
+        self.table = VirtualTable(data_frame, height=20)
+        self.table.grid(row=1, column=0, sticky="nsew")
 
     def _create_analysis_section(self):
         """
@@ -201,30 +219,121 @@ class GUI:
         self.trends_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         self.products_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
 
+        ## Axes et tracés créés une fois, puis mis à jour (hauteurs des barres, données de la courbe)
+        self.summary_ax = self.summary_fig.add_subplot(111)
+        self.trends_ax = self.trends_fig.add_subplot(111)
+        self.products_ax = self.products_fig.add_subplot(111)
+        self.summary_bars = None
+        self.trends_line = None
+
+        ## Rendu différé : un onglet n'est redessiné que lorsqu'il est visible et que ses données ont changé
+        self.chart_tabs = {str(self.summary_tab): "summary", str(self.trends_tab): "trends", str(self.products_tab): "products"}
+        self.chart_data = {}
+        self.dirty_charts = set()
+        self.notebook.bind("<<NotebookTabChanged>>", self._render_visible_chart)
+
     def _load_csv(self):
         """
-        @Description: Charge un fichier CSV et met à jour l'interface
+        @Description: Demande un fichier CSV et lance son chargement en arrière-plan
         """
-        try:
-            filename = filedialog.askopenfilename(
-                title="Sélectionner un fichier CSV",
-                filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
-            )
+        if self.task is not None:
+            messagebox.showwarning("Attention", "Un chargement est déjà en cours")
+            return
 
-            if filename:
-                # Chargement des données
-                df = self.data_loader.load_csv(filename)
-                self.data_processor = DataProcessor(df)
+        filename = filedialog.askopenfilename(
+            title="Sélectionner un fichier CSV",
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+        )
 
-                # Mise à jour de l'interface
-                self._update_file_info(filename)
-                self._update_data_table(df)
-                self._update_analysis()
+        if filename:
+            self._start_task(self._load_pipeline, filename)
 
-                messagebox.showinfo("Succès", f"Fichier chargé avec succès\n{len(df)} lignes valides")
+    @staticmethod
+    def _load_pipeline(task, filename):
+        """
+        @Description: Chargement et analyses exécutés dans le thread de la tâche | Chaque résultat est envoyé dès qu'il est prêt, sans toucher aux widgets.
+        """
+        task.progress(5, "Lecture du fichier...")
+        ## Nouveau chargeur : les données affichées restent utilisables jusqu'à la fin du chargement
+        data_loader = DataLoader()
+        df = data_loader.load_csv(filename)
 
-        except Exception as e:
-            messagebox.showerror("Erreur", f"Erreur lors du chargement: {str(e)}")
+        task.progress(50, "Préparation des analyses...")
+        data_processor = DataProcessor(df, cube=data_loader.cube)
+        task.post("loaded", (filename, data_loader, data_processor))
+
+        task.progress(60, "Résumé des ventes...")
+        task.post("summary", data_processor.get_sales_summary())
+
+        task.progress(80, "Tendances des ventes...")
+        task.post("trends", data_processor.get_sales_trends())
+        task.progress(100, "Terminé")
+
+    def _start_task(self, target, *args):
+        """
+        @Description: Démarre une tâche de fond et la surveillance de ses événements
+        """
+        self.task = BackgroundTask(target, *args).start()
+        self.progress_bar['value'] = 0
+        self.load_button.config(state=tk.DISABLED)
+        self.cancel_button.config(state=tk.NORMAL)
+        self.window.after(50, self._poll_task)
+
+    def _cancel_task(self):
+        """
+        @Description: Demande l'annulation de la tâche en cours
+        """
+        if self.task is not None:
+            self.task.cancel()
+            self.progress_label.config(text="Annulation...")
+
+    def _poll_task(self):
+        """
+        @Description: Traite les événements de la tâche de fond dans le thread de l'interface
+        """
+        task = self.task
+        for kind, payload in task.poll():
+            if kind == "progress":
+                value, text = payload
+                self.progress_bar['value'] = value
+                self.progress_label.config(text=text)
+            elif kind == "loaded":
+                filename, self.data_loader, self.data_processor = payload
+                self.analysis = self.data_processor
+                self.current_df = self.data_processor.data
+                self._update_filters()
+                self._update_file_info(filename)
+                self._update_data_table(self.current_df)
+                ## Les graphiques attendent les résultats calculés par la tâche
+                self.chart_data.clear()
+                self.dirty_charts = set(self.chart_tabs.values())
+            elif kind == "summary":
+                self._set_chart_data("summary", payload)
+                self._set_chart_data("products", payload)
+            elif kind == "trends":
+                self._set_chart_data("trends", payload)
+            elif kind in BackgroundTask.FINAL_EVENTS:
+                self._finish_task(kind, payload)
+                return
+        self.window.after(50, self._poll_task)
+
+    def _finish_task(self, kind, payload):
+        """
+        @Description: Réactive l'interface à la fin d'une tâche et affiche son résultat
+        """
+        self.task = None
+        self.load_button.config(state=tk.NORMAL)
+        self.cancel_button.config(state=tk.DISABLED)
+        if kind == "done":
+            self.progress_label.config(text="")
+            messagebox.showinfo("Succès", f"Fichier chargé avec succès\n{len(self.current_df)} lignes valides")
+        elif kind == "cancelled":
+            self.progress_bar['value'] = 0
+            self.progress_label.config(text="Opération annulée")
+        else:
+            self.progress_bar['value'] = 0
+            self.progress_label.config(text="")
+            messagebox.showerror("Erreur", f"Erreur lors du chargement: {payload}")
 
     def _update_file_info(self, filename):
         """
@@ -237,67 +346,74 @@ class GUI:
         """
         @Description: Met à jour le tableau de données
         """
-        # Réinitialiser le tableau
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-
-        # Configurer les colonnes
-        self.tree['columns'] = list(df.columns)
-        self.tree['show'] = 'headings'
-
-        for column in df.columns:
-            self.tree.heading(column, text=column)
-            self.tree.column(column, width=100)
-
-        # Ajouter les données
-        for _, row in df.head(1000).iterrows():  # Limiter à 1000 lignes pour la performance
-            self.tree.insert("", "end", values=list(row))
+        ## Seules les lignes visibles sont créées ; les autres sont lues à la demande lors du défilement
+        self.table.set_data(df)
 
     def _update_analysis(self):
         """
-        @Description: Met à jour les analyses et graphiques
+        @Description: Signale que la source des analyses a changé : seul l'onglet visible est redessiné, les autres le seront à leur affichage
         """
-        if self.data_processor:
-            # Récupérer les données d'analyse
-            sales_summary = self.data_processor.get_sales_summary()
-            best_seller = self.data_processor.get_best_selling_product()
-            trends = self.data_processor.get_sales_trends()
+        if self.analysis:
+            self.chart_data.clear()
+            self.dirty_charts = set(self.chart_tabs.values())
+            self._render_visible_chart()
 
-            # Mettre à jour les graphiques
-            self._update_summary_graph(sales_summary)
-            self._update_trends_graph(trends)
-            self._update_products_analysis(sales_summary)
+    def _set_chart_data(self, name, data):
+        """
+        @Description: Fournit les données d'un graphique (ex: calculées par une tâche de fond) et le redessine s'il est visible
+        """
+        self.chart_data[name] = data
+        self.dirty_charts.add(name)
+        self._render_visible_chart()
 
-    def _update_analysis(self):
+    def _render_visible_chart(self, event=None):
         """
-        @Description: Met à jour les analyses et graphiques
+        @Description: Redessine le graphique de l'onglet visible si ses données ont changé
         """
-        if self.data_processor:
-            # Récupérer les données d'analyse
-            sales_summary = self.data_processor.get_sales_summary()
-            trends = self.data_processor.get_sales_trends()
+        name = self.chart_tabs.get(str(self.notebook.select()))
+        if name not in self.dirty_charts:
+            return
+
+        data = self.chart_data.get(name)
+        if data is None:
+            if self.task is not None or not self.analysis:
+                ## Résultat pas encore prêt : le graphique sera dessiné à son arrivée
+                return
+            data = self.analysis.get_sales_trends() if name == "trends" else self.analysis.get_sales_summary()
+            self.chart_data[name] = data
 
-            # Mettre à jour les graphiques
-            self._update_summary_graph(sales_summary)
-            self._update_trends_graph()
-            self._update_products_graph(sales_summary)
+        self.dirty_charts.discard(name)
+        if name == "summary":
+            self._update_summary_graph(data)
+        elif name == "trends":
+            self._update_trends_graph(data)
+        else:
+            self._update_products_graph(data)
 
     def _update_summary_graph(self, sales_summary):
         """
         @Description: Met à jour le graphique de résumé
         """
-        self.summary_fig.clear()
-        ax = self.summary_fig.add_subplot(111)
-
-        # Créer un graphique à barres des meilleures ventes
-        sales_summary.head(10)['total_quantity'].plot(kind='bar', ax=ax)
-        ax.set_title('Top 10 des Produits les Plus Vendus')
-        ax.set_xlabel('Produit')
-        ax.set_ylabel('Quantité Vendue')
-        plt.xticks(rotation=45)
-
+        ax = self.summary_ax
+        top_products = sales_summary.head(10)['total_quantity']
+
+        if self.summary_bars is not None and len(self.summary_bars) == len(top_products):
+            ## Même nombre de produits : seules les hauteurs et les libellés changent
+            for bar, height in zip(self.summary_bars, top_products):
+                bar.set_height(height)
+        else:
+            # Créer un graphique à barres des meilleures ventes
+            ax.clear()
+            self.summary_bars = ax.bar(range(len(top_products)), top_products.to_numpy())
+            ax.set_xticks(range(len(top_products)))
+            ax.set_title('Top 10 des Produits les Plus Vendus')
+            ax.set_xlabel('Produit')
+            ax.set_ylabel('Quantité Vendue')
+
+        ax.set_xticklabels(top_products.index, rotation=45, ha='right')
+        ax.set_ylim(0, max(top_products.max(), 1) * 1.05 if len(top_products) else 1)
         self.summary_fig.tight_layout()
-        self.summary_canvas.draw()
+        self.summary_canvas.draw_idle()
 
     def _update_filters(self):
         """
@@ -305,98 +421,117 @@ class GUI:
         """
         if self.current_df is not None:
             # Mise à jour des produits disponibles
-            products = self.current_df['Product'].unique().tolist()
+            products = self.data_loader.get_unique_products()
             self.product_combo['values'] = [''] + products
 
             # Réinitialisation des valeurs
+            self._clear_filter_vars()
+
+    def _clear_filter_vars(self):
+        """
+        @Description: Vide les champs de filtre sans programmer de filtrage (le tableau affiché et son tri sont conservés)
+        """
+        self.filters_muted = True
+        try:
             self.date_var.set('')
             self.product_var.set('')
+        finally:
+            self.filters_muted = False
 
-    def _apply_filters(self):
+    def _schedule_filters(self, *args):
         """
-        @Description: Applique les filtres sélectionnés
+        @Description: Programme l'application des filtres après un court délai sans nouvelle saisie
         """
-        if self.current_df is None:
+        if self.filters_muted:
             return
+        if self.filter_job is not None:
+            self.window.after_cancel(self.filter_job)
+        self.filter_job = self.window.after(self.FILTER_DELAY_MS, lambda: self._apply_filters(live=True))
 
-        filtered_df = self.current_df.copy()
+    def _apply_filters(self, live=False):
+        """
+        @Description: Applique les filtres sélectionnés | En filtrage en direct, une date incomplète ou invalide est ignorée sans message.
+        """
+        if self.filter_job is not None and not live:
+            self.window.after_cancel(self.filter_job)
+        self.filter_job = None
+        if self.current_df is None or self.task is not None:
+            return
 
-        # Filtre par date
-        date_filter = self.date_var.get()
+        date_filter = self.date_var.get().strip()
+        product_filter = self.product_var.get()
         if date_filter:
             try:
-                date = pd.to_datetime(date_filter).date()
-                filtered_df = filtered_df[filtered_df['Order Date'].dt.date == date]
+                ## Seule une date complète est appliquée (ex: "2019-04" désignerait le 1er avril)
+                datetime.strptime(date_filter, "%Y-%m-%d")
             except ValueError:
-                messagebox.showerror("Erreur", "Format de date invalide")
+                if not live:
+                    messagebox.showerror("Erreur", "Format de date invalide")
                 return
+        if live and product_filter and product_filter not in self.data_processor.indexes.products:
+            ## Nom de produit en cours de saisie
+            return
 
-        # Filtre par produit
-        product_filter = self.product_var.get()
-        if product_filter:
-            filtered_df = filtered_df[filtered_df['Product'] == product_filter]
-
-        # Mise à jour de l'affichage
-        self._update_data_table(filtered_df)
-        self.data_processor = DataProcessor(filtered_df)
+        if not date_filter and not product_filter:
+            self._update_data_table(self.current_df)
+            self.analysis = self.data_processor
+        else:
+            ## Positions et analyses mémorisées par le processeur pour chaque couple (date, produit)
+            positions = self.data_processor.get_filter_positions(date_filter, product_filter)
+            self._update_data_table(take_rows(self.data_processor.data, positions))
+            self.analysis = self.data_processor.get_filtered_view(date_filter, product_filter)
         self._update_analysis()
 
     def _reset_filters(self):
         """
         @Description: Réinitialise tous les filtres
         """
-        self.date_var.set('')
-        self.product_var.set('')
-        if self.current_df is not None:
-            self._update_data_table(self.current_df)
-            self.data_processor = DataProcessor(self.current_df)
-            self._update_analysis()
+        self._clear_filter_vars()
+        self._apply_filters()
 
-    def _update_trends_graph(self, event=None):
+    def _update_trends_graph(self, trends):
         """
         @Description: Met à jour le graphique des tendances
         """
-        self.trends_fig.clear()
-        ax = self.trends_fig.add_subplot(111)
-        trends = self.data_processor.get_sales_trends()
-        monthly_trends = trends['monthly']
+        ax = self.trends_ax
+        monthly_trends = trends['monthly'].sort_values(by=['Year', 'Month'])
+        dates = pd.to_datetime(monthly_trends[['Year', 'Month']].assign(DAY=1))
 
-        monthly_trends = monthly_trends.sort_values(by=['Year', 'Month'])
-        monthly_trends['Date'] = pd.to_datetime(
-            monthly_trends[['Year', 'Month']].assign(DAY=1)
-        )
+        if self.trends_line is None:
+            self.trends_line, = ax.plot(dates, monthly_trends['total_revenue'], marker='o', linestyle='-')
+            ax.set_title('Tendances Mensuelles des Ventes')
+            ax.set_xlabel('Mois')
+            ax.set_ylabel('Revenu Total')
+            self.trends_fig.tight_layout()
+        else:
+            ## Mise à jour des données de la courbe existante
+            self.trends_line.set_data(dates, monthly_trends['total_revenue'])
+            ax.relim()
+            ax.autoscale_view()
 
-        ax.plot(monthly_trends['Date'], monthly_trends['total_revenue'], marker='o', linestyle='-')
-        ax.set_title('Tendances Mensuelles des Ventes')
-        ax.set_xlabel('Mois')
-        ax.set_ylabel('Revenu Total')
-
-        self.trends_fig.tight_layout()
-        self.trends_canvas.draw()
+        self.trends_canvas.draw_idle()
 
     def _update_products_graph(self, sales_summary):
         """
         @Description: Met à jour le graphique des produits
         """
-        self.products_fig.clear()
-        ax = self.products_fig.add_subplot(111)
-
-        # Créer un camembert des parts de marché basé sur le revenu total
-        sales_summary['market_share'] = sales_summary['total_revenue'] / sales_summary['total_revenue'].sum() * 100
-        top_5_products = sales_summary.head(5)
-
-        wedges, texts, autotexts = ax.pie(top_5_products['market_share'], labels=top_5_products.index, autopct='%1.1f%%', startangle=90)
+        # Camembert des parts de marché basé sur le revenu total (les secteurs d'un camembert ne se mettent pas à jour : seul cet axe est refait)
+        ax = self.products_ax
+        ax.clear()
+        market_share = sales_summary['total_revenue'] / sales_summary['total_revenue'].sum() * 100
+        top_5_products = market_share.head(5)
 
+        if top_5_products.sum() > 0:
+            ax.pie(top_5_products, labels=top_5_products.index, autopct='%1.1f%%', startangle=90)
         ax.set_title('Part de Marché des 5 Meilleurs Produits')
 
-        self.products_fig.tight_layout()
-        self.products_canvas.draw()
+        self.products_canvas.draw_idle()
 
     def _export_analysis(self):
         """
         @Description: Exporte l'analyse actuelle dans un fichier texte
         """
-        if not self.data_processor:
+        if not self.analysis:
             messagebox.showwarning("Attention", "Aucune donnée n'est chargée")
             return
 
@@ -413,20 +548,23 @@ class GUI:
             if filename:
                 with open(filename, 'w', encoding='utf-8') as f:
                     # Résumé des ventes
-                    sales_summary = self.data_processor.get_sales_summary()
+                    sales_summary = self.analysis.get_sales_summary()
                     f.write("=== Résumé des Ventes ===\n\n")
                     f.write(sales_summary.to_string())
                     f.write("\n\n")
 
                     # Meilleur produit
-                    best_seller = self.data_processor.get_best_selling_product()
+                    best_seller = self.analysis.get_best_selling_product()
                     f.write("=== Meilleur Produit ===\n\n")
-                    for key, value in best_seller.items():
-                        f.write(f"{key}: {value}\n")
+                    if best_seller is None:
+                        f.write("Aucune vente pour les filtres sélectionnés\n")
+                    else:
+                        for key, value in best_seller.items():
+                            f.write(f"{key}: {value}\n")
                     f.write("\n")
 
                     # Tendances
-                    trends = self.data_processor.get_sales_trends()
+                    trends = self.analysis.get_sales_trends()
                     f.write("=== Tendances Mensuelles ===\n\n")
                     f.write(trends['monthly'].to_string())
 
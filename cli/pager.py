@@ -0,0 +1,101 @@
+from typing import Callable
+import pandas as pd
+from core.indexes import Positions, take_rows
+
+## Nombre de lignes affichées par page
+PAGE_SIZE = 20
+
+
+class Pager:
+    """
+    @Description Affichage page par page de lignes sélectionnées par position | Seules les lignes de la page affichée sont extraites et mises en forme.
+    """
+
+    def __init__(self, data: pd.DataFrame, positions: Positions = None, page_size: int = PAGE_SIZE):
+        """
+        @Description Prépare l'affichage sans extraire de lignes
+
+        @Params {data} : pd.DataFrame => Données complètes
+        @Params {positions} : Positions => Positions des lignes à afficher (optionnel, toutes les lignes par défaut)
+        @Params {page_size} : int => Nombre de lignes par page
+        """
+        self.data = data
+        ## Une tranche devient un range : découpage et longueur sans matérialiser les positions
+        if positions is None:
+            positions = slice(0, len(data))
+        self.positions = range(*positions.indices(len(data))) if isinstance(positions, slice) else positions
+        self.page_size = max(1, page_size)
+        self.page = 0
+
+    @property
+    def total(self) -> int:
+        """
+        @Description Nombre total de lignes à afficher
+        """
+        return len(self.positions)
+
+    @property
+    def page_count(self) -> int:
+        """
+        @Description Nombre de pages (au moins une)
+        """
+        return max(1, -(-self.total // self.page_size))
+
+    def page_rows(self, page: int) -> pd.DataFrame:
+        """
+        @Description Extrait les lignes d'une page
+
+        @Params {page} : int => Numéro de page (à partir de 0)
+        @Return: pd.DataFrame => Lignes de la page
+        """
+        start = page * self.page_size
+        positions = self.positions[start:start + self.page_size]
+        if isinstance(positions, range):
+            positions = slice(positions.start, positions.stop)
+        return take_rows(self.data, positions)
+
+    def format_page(self, page: int) -> str:
+        """
+        @Description Met en forme une page avec sa position dans les résultats
+
+        @Params {page} : int => Numéro de page (à partir de 0)
+        @Return: str => Texte de la page
+        """
+        start = page * self.page_size
+        end = min(start + self.page_size, self.total)
+        return f"Lignes {start + 1}-{end} sur {self.total} (page {page + 1}/{self.page_count})\n{self.page_rows(page).to_string()}"
+
+    def go_to(self, page: int) -> None:
+        """
+        @Description Change de page (le numéro est ramené entre la première et la dernière page)
+
+        @Params {page} : int => Numéro de page (à partir de 0)
+        """
+        self.page = max(0, min(page, self.page_count - 1))
+
+    def run(self, title: str, read: Callable[[str], str] = input) -> None:
+        """
+        @Description Affiche les pages et lit les commandes : Entrée ou s (suivante), p (précédente), numéro (aller à la page), q (quitter)
+
+        @Params {title} : str => Titre affiché avec le nombre total de lignes
+        @Params {read} : Callable => Lecture d'une commande (input par défaut)
+        """
+        print(f"\n=== {title} : {self.total} lignes ===")
+        while True:
+            print(self.format_page(self.page))
+            if self.page_count == 1:
+                return
+
+            command = read("\n[Entrée/s] suivante, [p] précédente, [numéro] aller à la page, [q] quitter : ").strip().lower()
+            if command == "q":
+                return
+            if command in ("", "s"):
+                if self.page == self.page_count - 1:
+                    return
+                self.go_to(self.page + 1)
+            elif command == "p":
+                self.go_to(self.page - 1)
+            elif command.isdigit():
+                self.go_to(int(command) - 1)
+            else:
+                print("\nCommande invalide!")
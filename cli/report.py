@@ -0,0 +1,228 @@
+## cli/report.py
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+import contextlib
+import glob
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+## pandas, NumPy et core ne sont importés qu'à l'exécution du rapport : déclarer la sous-commande
+## (ex: python main.py --help) reste instantané
+if TYPE_CHECKING:
+    import pandas as pd
+    from core.data_processor import DataProcessor
+
+REPORT_FORMATS = ["text", "json", "csv"]
+
+
+def add_report_parser(subparsers, parents: List[Any] = None) -> None:
+    """
+    @Description Déclare la sous-commande "report" (rapports sans interaction, ex: tâches cron)
+
+    @Params {subparsers} : Any => Sous-parseurs retournés par ArgumentParser.add_subparsers
+    @Params {parents} : List[argparse.ArgumentParser] => Parseurs dont les options sont aussi acceptées après "report" (optionnel, ex: --profile)
+    """
+    parser = subparsers.add_parser("report", help="Générer des rapports sans interface (ex: tâches planifiées)", parents=parents or [])
+    parser.add_argument("--files", nargs="+", required=True, help="Fichiers CSV ou motifs glob (ex: data/Sales_*.csv)")
+    parser.add_argument("--summary", action="store_true", help="Résumé des ventes par produit")
+    parser.add_argument("--best", action="store_true", help="Produit le plus vendu")
+    parser.add_argument("--trends", action="store_true", help="Tendances mensuelles, horaires et par produit")
+    parser.add_argument("--revenue", action="append", metavar="DEBUT:FIN", help="Chiffre d'affaires sur une période YYYY-MM-DD:YYYY-MM-DD (bornes optionnelles, répétable)")
+    parser.add_argument("--cities", action="store_true", help="Ventes par ville")
+    parser.add_argument("--states", action="store_true", help="Ventes par état")
+    parser.add_argument("--format", choices=REPORT_FORMATS, default="text", help="Format de sortie (text par défaut)")
+    parser.add_argument("--output", help="Fichier de sortie (sortie standard par défaut ; en csv, un fichier par section)")
+
+
+def parse_period(value: str) -> Tuple[str, str]:
+    """
+    @Description Découpe une période "DEBUT:FIN" (chaque borne peut être vide)
+
+    @Params {value} : str => Période saisie, ex: 2019-04-01:2019-04-30
+    @Return: Tuple[str, str] => Date de début et date de fin (None si absente)
+    """
+    start, separator, end = value.partition(":")
+    if not separator:
+        raise ValueError(f"Période invalide : {value} (format attendu DEBUT:FIN)")
+    import pandas as pd
+    for date in (start, end):
+        if date:
+            pd.Timestamp(date)
+    return start or None, end or None
+
+
+def expand_files(patterns: List[str]) -> List[str]:
+    """
+    @Description Développe les motifs glob (utile quand le shell ne les développe pas, ex: crontab) | Comme DataLoader.load_directory, un motif ne retient pas les fichiers *_updated.csv, copies compactées de leur fichier d'origine.
+
+    @Params {patterns} : List[str] => Chemins ou motifs (un fichier *_updated.csv nommé explicitement est conservé)
+    @Return: List[str] => Chemins des fichiers, sans doublons
+    """
+    files = []
+    for pattern in patterns:
+        if glob.has_magic(pattern):
+            matches = sorted(match for match in glob.glob(pattern) if not Path(match).stem.endswith("_updated"))
+        else:
+            matches = [pattern]
+        files.extend(match for match in matches if match not in files)
+    return files
+
+
+def build_report(processor: "DataProcessor", summary: bool = False, best: bool = False, trends: bool = False,
+                 periods: List[Tuple[str, str]] = None, cities: bool = False, states: bool = False) -> Dict[str, Any]:
+    """
+    @Description Calcule les rapports demandés | Toutes les analyses lisent les mêmes agrégats, calculés une seule fois.
+
+    @Params {processor} : DataProcessor => Processeur des données chargées
+    @Params {summary} : bool => Inclure le résumé par produit
+    @Params {best} : bool => Inclure le produit le plus vendu
+    @Params {trends} : bool => Inclure les tendances
+    @Params {periods} : List[Tuple[str, str]] => Périodes du chiffre d'affaires
+    @Params {cities} : bool => Inclure les ventes par ville
+    @Params {states} : bool => Inclure les ventes par état
+    @Return: Dict[str, Any] => Section -> DataFrame ou dictionnaire
+    """
+    import pandas as pd
+    report = {}
+    if summary:
+        report["summary"] = processor.get_sales_summary()
+    if best:
+        ## Aucune vente (ex: fichiers vides) : section vide plutôt qu'une erreur
+        report["best_selling_product"] = processor.get_best_selling_product() or {}
+    if trends:
+        for name, frame in processor.get_sales_trends().items():
+            report[f"trends_{name}"] = frame
+    if periods:
+        report["revenue"] = pd.DataFrame([
+            {"start": start, "end": end, "revenue": processor.calculate_total_revenue(start, end)}
+            for start, end in periods
+        ])
+    if cities:
+        report["sales_by_city"] = processor.get_sales_by_city()
+    if states:
+        report["sales_by_state"] = processor.get_sales_by_state()
+    return report
+
+
+def _as_frame(value: Any) -> "pd.DataFrame":
+    """
+    @Description Convertit une section en DataFrame (un dictionnaire devient une ligne)
+    """
+    import pandas as pd
+    if isinstance(value, pd.DataFrame):
+        ## Index nommé (ex: Product) conservé comme colonne
+        return value.reset_index() if any(name is not None for name in value.index.names) else value
+    return pd.DataFrame([value])
+
+
+def _json_value(value: Any) -> Any:
+    """
+    @Description Convertit les valeurs NumPy et pandas pour json.dumps
+    """
+    import numpy as np
+    import pandas as pd
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (pd.Timestamp, datetime)):
+        return value.isoformat()
+    raise TypeError(f"Valeur non sérialisable : {value!r}")
+
+
+def format_report(report: Dict[str, Any], report_format: str, files: List[str]) -> Dict[str, str]:
+    """
+    @Description Met en forme les rapports
+
+    @Params {report} : Dict[str, Any] => Sections calculées par build_report
+    @Params {report_format} : str => text, json ou csv
+    @Params {files} : List[str] => Fichiers sources (rappelés dans l'en-tête)
+    @Return: Dict[str, str] => Nom de section -> texte (une seule entrée "" sauf en csv)
+    """
+    if report_format == "json":
+        content = {"generated_at": datetime.now().isoformat(timespec='seconds'), "files": files}
+        for name, value in report.items():
+            content[name] = value if isinstance(value, dict) else _as_frame(value).to_dict(orient="records")
+        return {"": json.dumps(content, ensure_ascii=False, indent=2, default=_json_value)}
+
+    if report_format == "csv":
+        return {name: _as_frame(value).to_csv(index=False) for name, value in report.items()}
+
+    lines = [
+        "=== Rapport d'analyse ESMEMarket ===",
+        f"Date d'analyse: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        f"Fichiers source: {', '.join(files)}",
+        "=" * 50,
+    ]
+    for name, value in report.items():
+        lines.append(f"\n=== {name} ===")
+        if isinstance(value, dict):
+            lines.extend(f"{key}: {item}" for key, item in value.items())
+        else:
+            lines.append(value.to_string())
+    return {"": "\n".join(lines) + "\n"}
+
+
+def write_report(sections: Dict[str, str], output: str = None) -> List[str]:
+    """
+    @Description Écrit les rapports sur la sortie standard ou dans des fichiers
+
+    @Params {sections} : Dict[str, str] => Textes retournés par format_report
+    @Params {output} : str => Fichier de sortie (optionnel) ; en csv, <nom>_<section>.csv pour chaque section
+    @Return: List[str] => Fichiers écrits
+    """
+    if output is None:
+        for name, text in sections.items():
+            if name:
+                sys.stdout.write(f"# {name}\n")
+            sys.stdout.write(text)
+        return []
+
+    path = Path(output)
+    written = []
+    for name, text in sections.items():
+        target = path if not name else path.with_name(f"{path.stem}_{name}{path.suffix or '.csv'}")
+        target.write_text(text, encoding='utf-8')
+        written.append(str(target))
+    return written
+
+
+def run_report(args) -> int:
+    """
+    @Description Exécute la sous-commande "report" : un chargement, tous les rapports demandés, aucune saisie
+
+    @Params {args} : argparse.Namespace => Arguments de la ligne de commande
+    @Return: int => Code de sortie (0 si succès)
+    """
+    try:
+        from core.data_loader import DataLoader
+        from core.data_processor import DataProcessor
+
+        files = expand_files(args.files)
+        periods = [parse_period(value) for value in args.revenue or []]
+        sections = {
+            "summary": args.summary, "best": args.best, "trends": args.trends,
+            "cities": args.cities, "states": args.states,
+        }
+        ## Sans section demandée : résumé, meilleur produit, tendances et chiffre d'affaires total
+        if not any(sections.values()) and not periods:
+            sections.update(summary=True, best=True, trends=True)
+            periods = [(None, None)]
+
+        ## Les messages de chargement vont sur la sortie d'erreur pour ne pas polluer le rapport
+        loader = DataLoader()
+        with contextlib.redirect_stdout(sys.stderr):
+            if len(files) == 1:
+                df = loader.load_csv(files[0])
+            else:
+                df = loader.load_files(files)
+        processor = DataProcessor(df, cube=loader.cube)
+
+        report = build_report(processor, periods=periods, **sections)
+        written = write_report(format_report(report, args.format, files), args.output)
+        for file in written:
+            print(f"Rapport écrit : {file}", file=sys.stderr)
+        return 0
+
+    except Exception as e:
+        print(f"Erreur lors de la génération du rapport: {str(e)}", file=sys.stderr)
+        return 1
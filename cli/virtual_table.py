@@ -0,0 +1,167 @@
+from tkinter import ttk
+import numpy as np
+import pandas as pd
+from core.indexes import take_rows
+
+
+def _column_order(series: pd.Series) -> np.ndarray:
+    """
+    @Description Calcule l'ordre croissant des lignes selon une colonne (valeurs manquantes en dernier)
+
+    @Params {series} : pd.Series => Colonne à trier
+    @Return: np.ndarray => Positions des lignes dans l'ordre croissant
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        ## Tri des catégories par libellé, puis des lignes par rang de leur catégorie
+        codes = series.cat.codes.to_numpy()
+        ranks = np.argsort(np.argsort(series.cat.categories.astype(str).to_numpy(), kind='stable'), kind='stable')
+        keys = np.where(codes >= 0, ranks[codes], len(ranks))
+        return np.argsort(keys, kind='stable')
+
+    values = series.to_numpy()
+    if values.dtype == object:
+        keys, _ = pd.factorize(values, sort=True)
+        keys = np.where(keys >= 0, keys, np.iinfo(keys.dtype).max)
+        return np.argsort(keys, kind='stable')
+    return np.argsort(values, kind='stable')
+
+
+class VirtualTable(ttk.Frame):
+    """
+    @Description Tableau à défilement virtuel : seules les lignes visibles existent dans le Treeview, leurs valeurs sont lues dans les données à chaque défilement
+    """
+
+    def __init__(self, parent, height: int = 20, **kwargs):
+        """
+        @Description Crée le tableau, ses barres de défilement et ses lignes visibles
+
+        @Params {parent} : Any => Widget parent
+        @Params {height} : int => Nombre de lignes visibles
+        """
+        super().__init__(parent, **kwargs)
+        self.height = height
+        self._df = None
+        ## Ordre d'affichage courant (None = ordre des données) et ordres de tri déjà calculés par colonne
+        self._order = None
+        self._orders = {}
+        self._sort_column = None
+        self._descending = False
+        self._offset = 0
+
+        self.tree = ttk.Treeview(self, selectmode='browse', height=height, show='headings')
+        self.tree.grid(row=0, column=0, sticky="nsew")
+
+        self.vsb = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self.vsb.grid(row=0, column=1, sticky="ns")
+        hsb = ttk.Scrollbar(self, orient="horizontal", command=self.tree.xview)
+        hsb.grid(row=1, column=0, sticky="ew")
+        self.tree.configure(xscrollcommand=hsb.set)
+
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        ## Molette : <MouseWheel> sous Windows et macOS, boutons 4 et 5 sous Linux
+        self.tree.bind("<MouseWheel>", lambda event: self.scroll(-1 if event.delta > 0 else 1, "units"))
+        self.tree.bind("<Button-4>", lambda event: self.scroll(-1, "units"))
+        self.tree.bind("<Button-5>", lambda event: self.scroll(1, "units"))
+
+    @property
+    def row_count(self) -> int:
+        """
+        @Description Nombre total de lignes du tableau
+        """
+        return 0 if self._df is None else len(self._df)
+
+    def set_data(self, df: pd.DataFrame) -> None:
+        """
+        @Description Affiche un DataFrame (les ordres de tri calculés sont conservés si c'est le même DataFrame)
+
+        @Params {df} : pd.DataFrame => Données à afficher
+        """
+        if df is not self._df:
+            self._orders = {}
+        self._df = df
+        self._order = None
+        self._sort_column = None
+        self._descending = False
+        self._offset = 0
+
+        self.tree.delete(*self.tree.get_children())
+        self.tree['columns'] = list(df.columns)
+        for column in df.columns:
+            self.tree.heading(column, text=column, command=lambda c=column: self.sort_by(c))
+            self.tree.column(column, width=100)
+
+        ## Lignes visibles créées une seule fois, puis réutilisées à chaque défilement
+        for slot in range(min(self.height, len(df))):
+            self.tree.insert("", "end", iid=str(slot))
+        self._refresh()
+
+    def sort_by(self, column: str, descending: bool = None) -> None:
+        """
+        @Description Trie l'affichage selon une colonne (un second clic sur la même colonne inverse l'ordre)
+
+        @Params {column} : str => Colonne de tri
+        @Params {descending} : bool => Ordre décroissant (optionnel, alterne par défaut)
+        """
+        if self._df is None:
+            return
+        if descending is None:
+            descending = not self._descending if column == self._sort_column else False
+
+        order = self._orders.get(column)
+        if order is None:
+            order = _column_order(self._df[column])
+            self._orders[column] = order
+
+        self._order = order[::-1] if descending else order
+        self._sort_column = column
+        self._descending = descending
+        for name in self._df.columns:
+            arrow = (" ▼" if descending else " ▲") if name == column else ""
+            self.tree.heading(name, text=f"{name}{arrow}")
+        self.scroll_to(0)
+
+    def scroll_to(self, offset: int) -> None:
+        """
+        @Description Affiche les lignes à partir d'une position
+
+        @Params {offset} : int => Position de la première ligne visible
+        """
+        self._offset = max(0, min(int(offset), self.row_count - self.height))
+        self._refresh()
+
+    def scroll(self, amount: int, what: str = "units") -> None:
+        """
+        @Description Fait défiler le tableau d'un nombre de lignes ou de pages
+
+        @Params {amount} : int => Nombre d'unités (négatif vers le haut)
+        @Params {what} : str => "units" (lignes) ou "pages"
+        """
+        step = self.height if what == "pages" else 1
+        self.scroll_to(self._offset + int(amount) * step)
+
+    def _on_scrollbar(self, action: str, *args) -> None:
+        """
+        @Description Traduit les commandes de la barre de défilement (moveto / scroll) en position
+        """
+        if action == "moveto":
+            self.scroll_to(float(args[0]) * self.row_count)
+        elif action == "scroll":
+            self.scroll(int(args[0]), args[1])
+
+    def _refresh(self) -> None:
+        """
+        @Description Met à jour les valeurs des lignes visibles et la barre de défilement
+        """
+        total = self.row_count
+        if total == 0:
+            self.vsb.set(0, 1)
+            return
+
+        end = min(self._offset + self.height, total)
+        positions = self._order[self._offset:end] if self._order is not None else slice(self._offset, end)
+        window = take_rows(self._df, positions)
+        for slot, row in enumerate(window.itertuples(index=False)):
+            self.tree.item(str(slot), values=["" if pd.isna(value) else str(value) for value in row])
+        self.vsb.set(self._offset / total, end / total)
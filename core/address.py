@@ -0,0 +1,58 @@
+from functools import lru_cache
+from typing import Optional, Tuple
+import numpy as np
+import pandas as pd
+
+## Colonnes dérivées de "Purchase Address" ajoutées au chargement (absentes des CSV sauvegardés)
+ADDRESS_COLUMNS = ["City", "State", "ZIP"]
+
+
+def _split_unique(addresses: pd.Series) -> pd.DataFrame:
+    """
+    @Description Découpe des adresses "rue, ville, ÉTAT CODE" en ville, état et code postal avec des opérations vectorisées
+
+    @Params {addresses} : pd.Series => Adresses au format texte
+    @Return: pd.DataFrame => Colonnes City, State et ZIP (NaN si l'adresse ne respecte pas le format)
+    """
+    parts = addresses.astype(str).str.rsplit(",", n=2, expand=True).reindex(columns=[0, 1, 2])
+    state_zip = parts[2].str.strip().str.split(" ", n=1, expand=True).reindex(columns=[0, 1])
+    return pd.DataFrame({
+        "City": parts[1].str.strip(),
+        "State": state_zip[0],
+        "ZIP": state_zip[1].str.strip(),
+    }, index=addresses.index).replace("", np.nan)
+
+
+def split_addresses(addresses: pd.Series) -> pd.DataFrame:
+    """
+    @Description Extrait la ville, l'état et le code postal des adresses de livraison | Seules les adresses distinctes sont analysées, puis le résultat est reporté sur chaque ligne par leurs codes.
+
+    @Params {addresses} : pd.Series => Colonne "Purchase Address" (texte ou catégorie)
+    @Return: pd.DataFrame => Colonnes City, State et ZIP en catégories, alignées sur l'index d'origine
+    """
+    codes, uniques = pd.factorize(addresses)
+    parsed = _split_unique(pd.Series(np.asarray(uniques, dtype=object)))
+
+    columns = {}
+    for column in ADDRESS_COLUMNS:
+        value_codes, values = pd.factorize(parsed[column])
+        ## Les adresses manquantes (code -1) restent manquantes
+        row_codes = np.where(codes >= 0, value_codes[codes] if len(value_codes) else -1, -1)
+        columns[column] = pd.Categorical.from_codes(row_codes, categories=values)
+    return pd.DataFrame(columns, index=addresses.index)
+
+
+@lru_cache(maxsize=4096)
+def parse_address(address: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """
+    @Description Extrait la ville, l'état et le code postal d'une seule adresse (mêmes règles que split_addresses, pour les mises à jour ligne par ligne)
+
+    @Params {address} : str => Adresse de livraison
+    @Return: Tuple[Optional[str], Optional[str], Optional[str]] => (ville, état, code postal), None si absent
+    """
+    parts = str(address).rsplit(",", 2)
+    if len(parts) < 3:
+        return (parts[1].strip() or None if len(parts) == 2 else None), None, None
+    state_zip = parts[2].strip().split(" ", 1)
+    zip_code = state_zip[1].strip() if len(state_zip) > 1 else ""
+    return parts[1].strip() or None, state_zip[0] or None, zip_code or None
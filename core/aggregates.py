@@ -0,0 +1,338 @@
+from typing import Any, Dict, Iterable, Optional
+import numpy as np
+import pandas as pd
+from core.address import parse_address, split_addresses
+
+
+def price_values(prices) -> np.ndarray:
+    """
+    @Description Convertit des prix unitaires en float64 pour les calculs de revenu | Les prix stockés en float32 (schéma compact) sont arrondis au centime pour retrouver la valeur saisie.
+
+    @Params {prices} : Any => Prix unitaires (Series ou tableau)
+    @Return: np.ndarray => Prix en float64
+    """
+    values = np.asarray(prices)
+    if values.dtype == np.float32:
+        return np.round(values.astype(np.float64), 2)
+    return values.astype(np.float64, copy=False)
+
+
+class SalesAggregates:
+    """
+    @Description Agrégats de ventes partiels (par produit, par mois, par heure, par ville) fusionnables entre eux | Permet de calculer les analyses de DataProcessor sans garder toutes les lignes en mémoire.
+    """
+
+    def __init__(self):
+        """
+        @Description Initialise des agrégats vides
+        """
+        self.rows = 0
+        self.total_revenue = 0.0
+        ## Produit -> [quantité totale, nombre de commandes, somme des prix unitaires]
+        self.products: Dict[Any, list] = {}
+        ## (année, mois) -> [nombre de commandes, quantité totale, revenu total]
+        self.monthly: Dict[tuple, list] = {}
+        ## heure -> [nombre de commandes, quantité totale, revenu total]
+        self.hourly: Dict[int, list] = {}
+        ## (année, mois, produit) -> [quantité totale, revenu total, nombre de commandes]
+        self.product_monthly: Dict[tuple, list] = {}
+        ## (ville, état) -> [nombre de commandes, quantité totale, revenu total]
+        self.locations: Dict[tuple, list] = {}
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "SalesAggregates":
+        """
+        @Description Calcule les agrégats d'un DataFrame de ventes validé
+
+        @Params {df} : pd.DataFrame => Données de ventes (un fichier complet ou un morceau)
+        @Return: SalesAggregates => Agrégats des lignes fournies
+        """
+        aggregates = cls()
+        if df.empty:
+            return aggregates
+
+        ## Revenu de chaque ligne calculé une seule fois, sans copier le DataFrame d'origine
+        quantity = df["Quantity Ordered"].to_numpy(dtype=np.int64)
+        price = price_values(df["Price Each"])
+        revenue = quantity * price
+        orders = np.ones(len(df), dtype=np.int64)
+        aggregates.add_cells(df["Order Date"].to_numpy(dtype="datetime64[h]"), df["Product"], orders, quantity, price, revenue)
+
+        if "City" in df.columns and "State" in df.columns:
+            aggregates.add_locations(df[["City", "State"]], orders, quantity, revenue)
+        elif "Purchase Address" in df.columns:
+            aggregates.add_locations(split_addresses(df["Purchase Address"]), orders, quantity, revenue)
+        return aggregates
+
+    def add_cells(self, hours: np.ndarray, products: Any, orders: np.ndarray, quantity: np.ndarray, price: np.ndarray, revenue: np.ndarray) -> None:
+        """
+        @Description Remplit les agrégats par produit, mois et heure à partir de lignes ou de cellules déjà agrégées (voir core.cube) | Les agrégats doivent être vides.
+
+        @Params {hours} : np.ndarray => Heure de chaque ligne (datetime64[h])
+        @Params {products} : Any => Produit de chaque ligne
+        @Params {orders} : np.ndarray => Nombre de lignes représentées (1 pour une ligne brute)
+        @Params {quantity} : np.ndarray => Quantité totale
+        @Params {price} : np.ndarray => Somme des prix unitaires
+        @Params {revenue} : np.ndarray => Revenu total
+        """
+        self.rows = int(orders.sum())
+        self.total_revenue = float(revenue.sum())
+
+        ## Clé entière combinée (heure, produit) : une seule réduction sur toutes les lignes
+        product_codes, products = pd.factorize(products)
+        hours = hours.astype(np.int64)
+        cell_ids, cell_keys = pd.factorize(hours * len(products) + product_codes)
+        size = len(cell_keys)
+
+        ## Décomposition des dates sur les cellules uniquement, pas sur chaque ligne
+        cell_dates = pd.DatetimeIndex((cell_keys // len(products)).astype("datetime64[h]"))
+        cells = pd.DataFrame({
+            "month": cell_dates.year.to_numpy(dtype=np.int64) * 12 + cell_dates.month.to_numpy(dtype=np.int64) - 1,
+            "hour": cell_dates.hour.to_numpy(dtype=np.int64),
+            "product": cell_keys % len(products),
+            "orders": np.bincount(cell_ids, weights=orders, minlength=size).astype(np.int64),
+            "quantity": np.bincount(cell_ids, weights=quantity, minlength=size).astype(np.int64),
+            "price": np.bincount(cell_ids, weights=price, minlength=size),
+            "revenue": np.bincount(cell_ids, weights=revenue, minlength=size),
+        })
+
+        ## Les vues sont des regroupements des cellules, bien moins nombreuses que les lignes
+        product_names = np.asarray(products, dtype=object)
+        for row in cells.groupby("product").sum().itertuples():
+            self.products[product_names[row.Index]] = [int(row.quantity), int(row.orders), float(row.price)]
+
+        for row in cells.groupby("month").sum().itertuples():
+            self.monthly[(int(row.Index) // 12, int(row.Index) % 12 + 1)] = [int(row.orders), int(row.quantity), float(row.revenue)]
+
+        for row in cells.groupby("hour").sum().itertuples():
+            self.hourly[int(row.Index)] = [int(row.orders), int(row.quantity), float(row.revenue)]
+
+        for row in cells.groupby(["month", "product"]).sum().itertuples():
+            month, code = row.Index
+            key = (int(month) // 12, int(month) % 12 + 1, product_names[code])
+            self.product_monthly[key] = [int(row.quantity), float(row.revenue), int(row.orders)]
+
+    def add_locations(self, location: pd.DataFrame, orders: np.ndarray, quantity: np.ndarray, revenue: np.ndarray) -> None:
+        """
+        @Description Remplit les agrégats par (ville, état) à partir de lignes ou de cellules (les lieux inconnus sont ignorés) | Les agrégats par lieu doivent être vides.
+
+        @Params {location} : pd.DataFrame => Colonnes City et State
+        @Params {orders} : np.ndarray => Nombre de lignes représentées
+        @Params {quantity} : np.ndarray => Quantité totale
+        @Params {revenue} : np.ndarray => Revenu total
+        """
+        ## Même principe que pour les cellules : une clé entière (ville, état) et une réduction par bincount
+        city_codes, cities = pd.factorize(location["City"])
+        state_codes, states = pd.factorize(location["State"])
+        known = (city_codes >= 0) & (state_codes >= 0)
+        keys = city_codes[known].astype(np.int64) * max(len(states), 1) + state_codes[known]
+        key_ids, key_values = pd.factorize(keys)
+        size = len(key_values)
+        counts = np.bincount(key_ids, weights=orders[known], minlength=size)
+        quantities = np.bincount(key_ids, weights=quantity[known], minlength=size)
+        revenues = np.bincount(key_ids, weights=revenue[known], minlength=size)
+        for i, key in enumerate(key_values):
+            location_key = (cities[key // max(len(states), 1)], states[key % max(len(states), 1)])
+            self.locations[location_key] = [int(counts[i]), int(quantities[i]), float(revenues[i])]
+
+    @classmethod
+    def from_chunks(cls, chunks: Iterable[pd.DataFrame]) -> "SalesAggregates":
+        """
+        @Description Agrège une suite de morceaux de données en fusionnant leurs agrégats partiels
+
+        @Params {chunks} : Iterable[pd.DataFrame] => Morceaux validés (ex: DataLoader.iter_csv)
+        @Return: SalesAggregates => Agrégats de l'ensemble des morceaux
+        """
+        aggregates = cls()
+        for chunk in chunks:
+            aggregates.merge(cls.from_frame(chunk))
+        return aggregates
+
+    def merge(self, other: "SalesAggregates") -> "SalesAggregates":
+        """
+        @Description Ajoute les agrégats d'un autre objet à celui-ci
+
+        @Params {other} : SalesAggregates => Agrégats partiels à fusionner
+        @Return: SalesAggregates => L'objet courant, mis à jour
+        """
+        self.rows += other.rows
+        self.total_revenue += other.total_revenue
+        for target, source in ((self.products, other.products), (self.monthly, other.monthly),
+                               (self.hourly, other.hourly), (self.product_monthly, other.product_monthly),
+                               (self.locations, other.locations)):
+            for key, values in source.items():
+                current = target.get(key)
+                if current is None:
+                    target[key] = list(values)
+                else:
+                    for i, value in enumerate(values):
+                        current[i] += value
+        return self
+
+    def add_row(self, product: Any, quantity: int, price: float, order_date: Any, address: Any = None) -> None:
+        """
+        @Description Ajoute une ligne de vente aux agrégats en temps constant
+
+        @Params {product} : Any => Nom du produit
+        @Params {quantity} : int => Quantité commandée
+        @Params {price} : float => Prix unitaire
+        @Params {order_date} : Any => Date de la commande
+        @Params {address} : Any => Adresse de livraison (agrégats par ville, ignorée si None)
+        """
+        self._apply(product, quantity, price, order_date, 1, address)
+
+    def remove_row(self, product: Any, quantity: int, price: float, order_date: Any, address: Any = None) -> None:
+        """
+        @Description Retire une ligne de vente des agrégats en temps constant (ex: avant sa modification)
+
+        @Params {product} : Any => Nom du produit
+        @Params {quantity} : int => Quantité commandée
+        @Params {price} : float => Prix unitaire
+        @Params {order_date} : Any => Date de la commande
+        @Params {address} : Any => Adresse de livraison (agrégats par ville, ignorée si None)
+        """
+        self._apply(product, quantity, price, order_date, -1, address)
+
+    def _apply(self, product: Any, quantity: int, price: float, order_date: Any, sign: int, address: Any = None) -> None:
+        """
+        @Description Applique la contribution d'une ligne (sign = 1 pour l'ajouter, -1 pour la retirer)
+        """
+        order_date = pd.Timestamp(order_date)
+        quantity, price = int(quantity), float(price_values(price))
+        revenue = quantity * price
+        month = (order_date.year, order_date.month)
+
+        self.rows += sign
+        self.total_revenue += sign * revenue
+        ## (agrégat, clé, contributions, position du nombre de lignes)
+        updates = (
+            (self.products, product, (quantity, 1, price), 1),
+            (self.monthly, month, (1, quantity, revenue), 0),
+            (self.hourly, order_date.hour, (1, quantity, revenue), 0),
+            (self.product_monthly, month + (product,), (quantity, revenue, 1), 2),
+        )
+        if address is not None and not pd.isna(address):
+            city, state, _ = parse_address(address)
+            if city is not None and state is not None:
+                updates += ((self.locations, (city, state), (1, quantity, revenue), 0),)
+        for target, key, values, count_position in updates:
+            current = target.setdefault(key, [0] * len(values))
+            for i, value in enumerate(values):
+                current[i] += sign * value
+            ## Supprimer les groupes qui ne contiennent plus aucune ligne
+            if current[count_position] == 0:
+                del target[key]
+
+    def get_sales_summary(self) -> pd.DataFrame:
+        """
+        @Description Calcule le résumé des ventes par produit (même format que DataProcessor.get_sales_summary)
+
+        @Return: pd.DataFrame => Statistiques de ventes par produit triées par quantité
+        """
+        products = sorted(self.products)
+        values = [self.products[product] for product in products]
+        sales_summary = pd.DataFrame({
+            "total_quantity": np.array([v[0] for v in values], dtype=np.int64),
+            "number_of_orders": np.array([v[1] for v in values], dtype=np.int64),
+            "average_price": np.array([v[2] / v[1] if v[1] else 0.0 for v in values], dtype=np.float64),
+        }, index=pd.Index(products, name="Product")).round(2)
+
+        sales_summary["total_revenue"] = (sales_summary["total_quantity"] * sales_summary["average_price"]).round(2)
+        return sales_summary.sort_values("total_quantity", ascending=False)
+
+    def get_best_selling_product(self) -> Optional[Dict[str, Any]]:
+        """
+        @Description Trouve le produit le plus vendu (même format que DataProcessor.get_best_selling_product)
+
+        @Return: Optional[Dict[str, Any]] => Informations du produit le plus vendu (None si aucune vente, ex: filtre sans résultat)
+        """
+        sales_summary = self.get_sales_summary()
+        if sales_summary.empty:
+            return None
+        best_product = sales_summary.index[0]
+        return {
+            "product": best_product,
+            "total_quantity": int(sales_summary.loc[best_product, "total_quantity"]),
+            "number_of_orders": int(sales_summary.loc[best_product, "number_of_orders"]),
+            "average_price": float(sales_summary.loc[best_product, "average_price"]),
+            "total_revenue": float(sales_summary.loc[best_product, "total_revenue"]),
+        }
+
+    def get_sales_trends(self) -> Dict[str, pd.DataFrame]:
+        """
+        @Description Construit les tendances mensuelles, horaires et par produit (même format que DataProcessor.get_sales_trends)
+
+        @Return: Dict[str, pd.DataFrame] => Dictionnaire contenant les différentes analyses de tendances
+        """
+        monthly = sorted(self.monthly)
+        monthly_trends = pd.DataFrame({
+            "Year": np.array([key[0] for key in monthly], dtype=np.int32),
+            "Month": np.array([key[1] for key in monthly], dtype=np.int32),
+            "number_of_orders": np.array([self.monthly[key][0] for key in monthly], dtype=np.int64),
+            "total_quantity": np.array([self.monthly[key][1] for key in monthly], dtype=np.int64),
+            "total_revenue": np.array([self.monthly[key][2] for key in monthly], dtype=np.float64),
+        }).round(2)
+
+        hours = sorted(self.hourly)
+        hourly_trends = pd.DataFrame({
+            "Hour": np.array(hours, dtype=np.int32),
+            "number_of_orders": np.array([self.hourly[hour][0] for hour in hours], dtype=np.int64),
+            "total_quantity": np.array([self.hourly[hour][1] for hour in hours], dtype=np.int64),
+            "total_revenue": np.array([self.hourly[hour][2] for hour in hours], dtype=np.float64),
+        }).round(2)
+
+        keys = sorted(self.product_monthly)
+        product_monthly_trends = pd.DataFrame({
+            "total_quantity": np.array([self.product_monthly[key][0] for key in keys], dtype=np.int64),
+            "total_revenue": np.array([self.product_monthly[key][1] for key in keys], dtype=np.float64),
+        }, index=pd.MultiIndex.from_tuples(keys, names=["Year", "Month", "Product"]) if keys
+            else pd.MultiIndex.from_arrays([[], [], []], names=["Year", "Month", "Product"])).round(2)
+
+        return {
+            'monthly': monthly_trends,
+            'hourly': hourly_trends,
+            'product_monthly': product_monthly_trends
+        }
+
+    def get_sales_by_city(self) -> pd.DataFrame:
+        """
+        @Description Calcule les ventes par ville (la ville est associée à son état : Portland, OR et Portland, ME sont distinctes)
+
+        @Return: pd.DataFrame => Commandes, quantité et revenu par (City, State), triés par revenu décroissant
+        """
+        keys = sorted(self.locations)
+        index = (pd.MultiIndex.from_tuples(keys, names=["City", "State"]) if keys
+                 else pd.MultiIndex.from_arrays([[], []], names=["City", "State"]))
+        sales = pd.DataFrame({
+            "number_of_orders": np.array([self.locations[key][0] for key in keys], dtype=np.int64),
+            "total_quantity": np.array([self.locations[key][1] for key in keys], dtype=np.int64),
+            "total_revenue": np.array([self.locations[key][2] for key in keys], dtype=np.float64),
+        }, index=index).round(2)
+        return sales.sort_values("total_revenue", ascending=False)
+
+    def get_sales_by_state(self) -> pd.DataFrame:
+        """
+        @Description Calcule les ventes par état à partir des agrégats par ville
+
+        @Return: pd.DataFrame => Commandes, quantité et revenu par State, triés par revenu décroissant
+        """
+        states: Dict[Any, list] = {}
+        for (_, state), values in self.locations.items():
+            current = states.setdefault(state, [0, 0, 0.0])
+            for i, value in enumerate(values):
+                current[i] += value
+        keys = sorted(states)
+        sales = pd.DataFrame({
+            "number_of_orders": np.array([states[key][0] for key in keys], dtype=np.int64),
+            "total_quantity": np.array([states[key][1] for key in keys], dtype=np.int64),
+            "total_revenue": np.array([states[key][2] for key in keys], dtype=np.float64),
+        }, index=pd.Index(keys, name="State", dtype=object)).round(2)
+        return sales.sort_values("total_revenue", ascending=False)
+
+    def calculate_total_revenue(self) -> float:
+        """
+        @Description Retourne le chiffre d'affaires total des lignes agrégées
+
+        @Return: float => Chiffre d'affaires total
+        """
+        return round(self.total_revenue, 2)
@@ -0,0 +1,215 @@
+from typing import Any, Dict, Optional, Tuple
+import hashlib
+import json
+import os
+import shutil
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+## Incrémenter lorsque le format du cache ou la validation des données change
+CACHE_VERSION = 3
+
+
+def cache_dir_for(file_path: str) -> Path:
+    """
+    @Description Retourne le dossier de cache associé à un fichier CSV (stocké à côté du fichier)
+
+    @Params {file_path} : str => Chemin vers le fichier CSV
+    @Return: Path => Chemin du dossier de cache
+    """
+    path = Path(file_path)
+    return path.parent / f".{path.name}.cache"
+
+
+def hash_file(file_path: str) -> str:
+    """
+    @Description Calcule l'empreinte du contenu d'un fichier par blocs
+
+    @Params {file_path} : str => Chemin vers le fichier
+    @Return: str => Empreinte hexadécimale du contenu
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def file_signature(file_path: str) -> Dict[str, Any]:
+    """
+    @Description Construit la clé d'un fichier : chemin, taille et date de modification
+
+    @Params {file_path} : str => Chemin vers le fichier
+    @Return: Dict[str, Any] => Signature du fichier
+    """
+    stat = os.stat(file_path)
+    return {"path": str(Path(file_path).resolve()), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _encode_column(series: pd.Series) -> Tuple[np.ndarray, Dict[str, Any]]:
+    """
+    @Description Convertit une colonne en tableau NumPy sérialisable et en métadonnées de reconstruction
+
+    @Params {series} : pd.Series => Colonne à encoder
+    @Return: Tuple[np.ndarray, Dict[str, Any]] => Tableau à sauvegarder et métadonnées de la colonne
+    """
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        return series.cat.codes.to_numpy(), {"kind": "category", "categories": series.cat.categories.tolist()}
+    if pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_datetime64_dtype(dtype):
+        return series.to_numpy(), {"kind": "array"}
+
+    ## Chaînes de caractères : codes entiers + valeurs uniques
+    codes, uniques = pd.factorize(series)
+    values = uniques.tolist()
+    if not all(isinstance(value, str) for value in values):
+        raise TypeError(f"Colonne {series.name} non prise en charge par le cache")
+    return codes.astype(np.int32), {"kind": "strings", "values": values, "dtype": str(dtype)}
+
+
+def _decode_column(values: np.ndarray, meta: Dict[str, Any]) -> Any:
+    """
+    @Description Reconstruit une colonne à partir de son tableau et de ses métadonnées
+
+    @Params {values} : np.ndarray => Tableau chargé depuis le cache
+    @Params {meta} : Dict[str, Any] => Métadonnées de la colonne
+    @Return: Any => Valeurs de la colonne (tableau ou Categorical)
+    """
+    if meta["kind"] == "category":
+        return pd.Categorical.from_codes(values, categories=meta["categories"])
+    if meta["kind"] == "strings":
+        ## Le code -1 (valeur manquante) pointe sur le None ajouté en fin de tableau
+        uniques = np.array(meta["values"] + [None], dtype=object)
+        return pd.array(uniques.take(values), dtype=meta["dtype"])
+    return values
+
+
+def write_frame(directory: Path, df: pd.DataFrame, meta: Dict[str, Any]) -> None:
+    """
+    @Description Écrit un DataFrame au format colonne (un fichier .npy par colonne) dans un dossier
+
+    @Params {directory} : Path => Dossier de destination (remplacé s'il existe)
+    @Params {df} : pd.DataFrame => Données à écrire
+    @Params {meta} : Dict[str, Any] => Métadonnées supplémentaires à stocker
+    """
+    tmp_dir = directory.with_name(directory.name + ".tmp")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    tmp_dir.mkdir(parents=True)
+
+    columns = []
+    for i, column in enumerate(df.columns):
+        values, column_meta = _encode_column(df[column])
+        np.save(tmp_dir / f"col_{i}.npy", values, allow_pickle=False)
+        columns.append({"name": column, **column_meta})
+    np.save(tmp_dir / "index.npy", df.index.to_numpy(dtype=np.int64), allow_pickle=False)
+
+    with open(tmp_dir / "meta.json", 'w', encoding='utf-8') as f:
+        json.dump({**meta, "version": CACHE_VERSION, "rows": len(df), "columns": columns}, f)
+
+    ## Remplacement du cache précédent une fois l'écriture terminée
+    shutil.rmtree(directory, ignore_errors=True)
+    tmp_dir.rename(directory)
+
+
+def read_meta(directory: Path) -> Optional[Dict[str, Any]]:
+    """
+    @Description Lit les métadonnées d'un dossier de cache
+
+    @Params {directory} : Path => Dossier de cache
+    @Return: Optional[Dict[str, Any]] => Métadonnées, ou None si absentes ou d'une autre version
+    """
+    try:
+        with open(directory / "meta.json", encoding='utf-8') as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return meta if meta.get("version") == CACHE_VERSION else None
+
+
+def read_frame(directory: Path, meta: Dict[str, Any]) -> pd.DataFrame:
+    """
+    @Description Reconstruit un DataFrame depuis un dossier écrit par write_frame
+
+    @Params {directory} : Path => Dossier de cache
+    @Params {meta} : Dict[str, Any] => Métadonnées lues par read_meta
+    @Return: pd.DataFrame => Données reconstruites
+    """
+    index = np.load(directory / "index.npy")
+    data = {
+        column["name"]: _decode_column(np.load(directory / f"col_{i}.npy"), column)
+        for i, column in enumerate(meta["columns"])
+    }
+    return pd.DataFrame(data, index=index)
+
+
+def load_cached_frame(file_path: str, directory: Path) -> Optional[pd.DataFrame]:
+    """
+    @Description Charge un DataFrame mis en cache pour un fichier si ce fichier n'a pas changé
+
+    @Params {file_path} : str => Chemin vers le fichier d'origine
+    @Params {directory} : Path => Dossier de cache
+    @Return: Optional[pd.DataFrame] => Données en cache, ou None si le cache est absent ou périmé
+    """
+    meta = read_meta(directory)
+    if meta is None:
+        return None
+
+    signature = file_signature(file_path)
+    if meta["path"] != signature["path"] or meta["size"] != signature["size"]:
+        return None
+
+    if meta["mtime_ns"] != signature["mtime_ns"]:
+        ## Fichier touché (copie, checkout...) : le contenu décide si le cache reste valide
+        if meta.get("hash") != hash_file(file_path):
+            return None
+        meta["mtime_ns"] = signature["mtime_ns"]
+        try:
+            with open(directory / "meta.json", 'w', encoding='utf-8') as f:
+                json.dump(meta, f)
+        except OSError:
+            pass
+
+    try:
+        return read_frame(directory, meta)
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def save_frame_cache(file_path: str, directory: Path, df: pd.DataFrame) -> bool:
+    """
+    @Description Enregistre un DataFrame calculé à partir d'un fichier, avec la signature de ce fichier
+
+    @Params {file_path} : str => Chemin vers le fichier d'origine
+    @Params {directory} : Path => Dossier de cache
+    @Params {df} : pd.DataFrame => Données à mettre en cache
+    @Return: bool => True si le cache a été écrit, False sinon
+    """
+    try:
+        meta = {**file_signature(file_path), "hash": hash_file(file_path)}
+        write_frame(directory, df, meta)
+        return True
+    except (OSError, TypeError, ValueError):
+        ## Le cache est facultatif : un dossier en lecture seule ne doit pas bloquer le chargement
+        return False
+
+
+def load_cached_csv(file_path: str) -> Optional[pd.DataFrame]:
+    """
+    @Description Charge les données validées d'un CSV depuis son cache si le fichier n'a pas changé
+
+    @Params {file_path} : str => Chemin vers le fichier CSV
+    @Return: Optional[pd.DataFrame] => Données en cache, ou None si le cache est absent ou périmé
+    """
+    return load_cached_frame(file_path, cache_dir_for(file_path))
+
+
+def save_csv_cache(file_path: str, df: pd.DataFrame) -> bool:
+    """
+    @Description Enregistre les données validées d'un CSV dans son cache
+
+    @Params {file_path} : str => Chemin vers le fichier CSV d'origine
+    @Params {df} : pd.DataFrame => Données validées à mettre en cache
+    @Return: bool => True si le cache a été écrit, False sinon
+    """
+    return save_frame_cache(file_path, cache_dir_for(file_path), df)
@@ -0,0 +1,277 @@
+from typing import Any, List, Optional
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from core.address import split_addresses
+from core.aggregates import SalesAggregates, price_values
+from core.cache import load_cached_frame, save_frame_cache
+
+## Dimensions et mesures d'une cellule du cube
+DIMENSIONS = ["Hour", "Product", "City", "State"]
+MEASURES = ["orders", "quantity", "revenue", "price_sum"]
+
+
+def cube_dir_for(file_path: str) -> Path:
+    """
+    @Description Retourne le dossier où le cube d'un fichier CSV est enregistré (stocké à côté du fichier)
+
+    @Params {file_path} : str => Chemin vers le fichier CSV
+    @Return: Path => Chemin du dossier du cube
+    """
+    path = Path(file_path)
+    return path.parent / f".{path.name}.cube"
+
+
+def _empty_cells() -> pd.DataFrame:
+    """
+    @Description Retourne un ensemble de cellules vide avec les colonnes du cube
+    """
+    return pd.DataFrame({
+        "Hour": pd.Series([], dtype="datetime64[s]"),
+        "Product": pd.Categorical([]),
+        "City": pd.Categorical([]),
+        "State": pd.Categorical([]),
+        "orders": pd.Series([], dtype=np.int64),
+        "quantity": pd.Series([], dtype=np.int64),
+        "revenue": pd.Series([], dtype=np.float64),
+        "price_sum": pd.Series([], dtype=np.float64),
+    })
+
+
+def _merge_cells(frames: List[pd.DataFrame], drop_empty: bool = True) -> pd.DataFrame:
+    """
+    @Description Regroupe des ensembles de cellules (mesures signées) en une cellule par clé, triées par heure
+
+    @Params {frames} : List[pd.DataFrame] => Ensembles de cellules
+    @Params {drop_empty} : bool => Supprimer les cellules sans commande (à conserver pour des mises à jour, dont les mesures peuvent changer à nombre de commandes constant)
+    @Return: pd.DataFrame => Cellules regroupées
+    """
+    merged = pd.concat([frame.astype({column: object for column in DIMENSIONS[1:]}) for frame in frames], ignore_index=True)
+    merged = merged.groupby(DIMENSIONS, sort=True, dropna=False)[MEASURES].sum().reset_index()
+    if drop_empty:
+        merged = merged[merged["orders"] != 0]
+    for column in DIMENSIONS[1:]:
+        merged[column] = merged[column].astype("category")
+    return merged.reset_index(drop=True)
+
+
+def _select(cells: pd.DataFrame, hours: np.ndarray, start=None, end=None, product: str = None, city: str = None, state: str = None) -> pd.DataFrame:
+    """
+    @Description Sélectionne dans des cellules triées par heure celles d'une plage d'heures [start, end) et, au choix, d'un produit, d'une ville ou d'un état
+    """
+    ## Les cellules sont triées par heure : la plage se trouve par recherche dichotomique
+    lo = 0 if start is None else int(np.searchsorted(hours, np.datetime64(pd.Timestamp(start)), side='left'))
+    hi = len(cells) if end is None else int(np.searchsorted(hours, np.datetime64(pd.Timestamp(end)), side='left'))
+    cells = cells.iloc[lo:max(lo, hi)]
+    for column, value in (("Product", product), ("City", city), ("State", state)):
+        if value is not None:
+            cells = cells[cells[column] == value]
+    return cells
+
+
+def _rollup_cells(cells: pd.DataFrame) -> SalesAggregates:
+    """
+    @Description Regroupe des cellules en agrégats par produit, mois, heure et ville
+    """
+    aggregates = SalesAggregates()
+    if cells.empty:
+        return aggregates
+
+    orders = cells["orders"].to_numpy()
+    quantity = cells["quantity"].to_numpy()
+    revenue = cells["revenue"].to_numpy()
+    aggregates.add_cells(cells["Hour"].to_numpy(dtype="datetime64[h]"), cells["Product"], orders, quantity, cells["price_sum"].to_numpy(), revenue)
+    ## Les cellules sans ville ni état reconnus sont ignorées, comme dans SalesAggregates.from_frame
+    aggregates.add_locations(cells[["City", "State"]], orders, quantity, revenue)
+    return aggregates
+
+
+def _decode(codes: np.ndarray, values: Any) -> pd.Categorical:
+    """
+    @Description Construit une colonne catégorielle à partir de codes décalés de 1 (0 = valeur manquante)
+    """
+    return pd.Categorical.from_codes(codes - 1, categories=pd.Index(values).astype(str) if len(values) else [])
+
+
+class SalesCube:
+    """
+    @Description Cube de ventes pré-agrégé : (heure, produit, ville, état) -> commandes, quantité, revenu, somme des prix | Les analyses sont des regroupements de cellules, bien moins nombreuses que les lignes.
+    """
+
+    ## Nombre de mises à jour en attente au-delà duquel elles sont fusionnées dans les cellules
+    PENDING_LIMIT = 1000
+
+    def __init__(self, cells: pd.DataFrame = None):
+        """
+        @Description Initialise un cube à partir de cellules déjà agrégées
+
+        @Params {cells} : pd.DataFrame => Cellules triées par heure (optionnel, cube vide par défaut)
+        """
+        self._cells = _empty_cells() if cells is None else cells.reset_index(drop=True)
+        self._hours = self._cells["Hour"].to_numpy()
+        ## Cellules des ajouts et modifications pas encore fusionnées (mesures signées)
+        self._pending: List[pd.DataFrame] = []
+        ## Cellules en attente regroupées entre elles, calculées à la première requête qui suit une mise à jour
+        self._delta: Optional[pd.DataFrame] = None
+
+    @staticmethod
+    def cells_from_frame(df: pd.DataFrame, sign: int = 1) -> pd.DataFrame:
+        """
+        @Description Agrège des lignes de ventes en cellules (une clé entière par cellule et une réduction par bincount)
+
+        @Params {df} : pd.DataFrame => Lignes de ventes validées
+        @Params {sign} : int => 1 pour des lignes ajoutées, -1 pour des lignes retirées
+        @Return: pd.DataFrame => Cellules triées par heure
+        """
+        if df.empty:
+            return _empty_cells()
+
+        quantity = df["Quantity Ordered"].to_numpy(dtype=np.int64)
+        price = price_values(df["Price Each"])
+        revenue = quantity * price
+
+        location = df[["City", "State"]] if "City" in df.columns and "State" in df.columns else split_addresses(df["Purchase Address"])
+        hours = df["Order Date"].to_numpy(dtype="datetime64[h]").astype(np.int64)
+        first_hour = int(hours.min())
+        ## Codes décalés de 1 pour réserver 0 aux villes et états manquants
+        product_codes, products = pd.factorize(df["Product"])
+        city_codes, cities = pd.factorize(location["City"])
+        state_codes, states = pd.factorize(location["State"])
+        sizes = (len(products), len(cities) + 1, len(states) + 1)
+
+        keys = (((hours - first_hour) * sizes[0] + product_codes) * sizes[1] + city_codes + 1) * sizes[2] + state_codes + 1
+        cell_ids, cell_keys = pd.factorize(keys, sort=True)
+        size = len(cell_keys)
+
+        cell_keys, state = np.divmod(cell_keys, sizes[2])
+        cell_keys, city = np.divmod(cell_keys, sizes[1])
+        hour, product = np.divmod(cell_keys, sizes[0])
+        return pd.DataFrame({
+            "Hour": (hour + first_hour).astype("datetime64[h]").astype("datetime64[s]"),
+            "Product": pd.Categorical.from_codes(product, categories=pd.Index(products).astype(str)),
+            "City": _decode(city, cities),
+            "State": _decode(state, states),
+            "orders": sign * np.bincount(cell_ids, minlength=size),
+            "quantity": sign * np.bincount(cell_ids, weights=quantity, minlength=size).astype(np.int64),
+            "revenue": sign * np.bincount(cell_ids, weights=revenue, minlength=size),
+            "price_sum": sign * np.bincount(cell_ids, weights=price, minlength=size),
+        })
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "SalesCube":
+        """
+        @Description Construit le cube de toutes les lignes d'un DataFrame de ventes
+
+        @Params {df} : pd.DataFrame => Données de ventes validées
+        @Return: SalesCube => Cube des ventes
+        """
+        return cls(cls.cells_from_frame(df))
+
+    @classmethod
+    def load(cls, file_path: str) -> Optional["SalesCube"]:
+        """
+        @Description Charge le cube enregistré à côté d'un fichier CSV s'il correspond au contenu actuel du fichier
+
+        @Params {file_path} : str => Chemin vers le fichier CSV
+        @Return: Optional[SalesCube] => Cube enregistré, ou None s'il est absent ou périmé
+        """
+        cells = load_cached_frame(file_path, cube_dir_for(file_path))
+        return None if cells is None else cls(cells)
+
+    def save(self, file_path: str) -> bool:
+        """
+        @Description Enregistre le cube à côté du fichier CSV dont il est issu
+
+        @Params {file_path} : str => Chemin vers le fichier CSV
+        @Return: bool => True si le cube a été écrit, False sinon
+        """
+        return save_frame_cache(file_path, cube_dir_for(file_path), self.cells)
+
+    @property
+    def cells(self) -> pd.DataFrame:
+        """
+        @Description Cellules du cube triées par heure (les mises à jour en attente y sont fusionnées au premier accès)
+        """
+        if self._pending:
+            self._consolidate()
+        return self._cells
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def add_frame(self, df: pd.DataFrame, sign: int = 1) -> None:
+        """
+        @Description Ajoute (ou retire avec sign = -1) la contribution de lignes de ventes au cube
+
+        @Params {df} : pd.DataFrame => Lignes ajoutées ou retirées
+        @Params {sign} : int => 1 pour ajouter les lignes, -1 pour les retirer
+        """
+        if df.empty:
+            return
+        self._pending.append(self.cells_from_frame(df, sign))
+        self._delta = None
+        if len(self._pending) >= self.PENDING_LIMIT:
+            self._consolidate()
+
+    def _consolidate(self) -> None:
+        """
+        @Description Fusionne les cellules en attente dans le cube et supprime les cellules devenues vides
+        """
+        self._cells = _merge_cells([self._cells] + self._pending)
+        self._hours = self._cells["Hour"].to_numpy()
+        self._pending = []
+        self._delta = None
+
+    def _parts(self, start=None, end=None, product: str = None, city: str = None, state: str = None) -> List[pd.DataFrame]:
+        """
+        @Description Sélectionne les cellules demandées dans le cube et dans les mises à jour en attente, sans les fusionner | Une requête qui suit un ajout ne regroupe que les cellules en attente, pas tout le cube.
+
+        @Return: List[pd.DataFrame] => Cellules du cube, puis cellules en attente correspondantes (mesures signées) s'il y en a
+        """
+        parts = [_select(self._cells, self._hours, start, end, product, city, state)]
+        if self._pending:
+            if self._delta is None:
+                self._delta = _merge_cells(self._pending, drop_empty=False)
+            parts.append(_select(self._delta, self._delta["Hour"].to_numpy(), start, end, product, city, state))
+        return parts
+
+    def slice(self, start=None, end=None, product: str = None, city: str = None, state: str = None) -> pd.DataFrame:
+        """
+        @Description Sélectionne les cellules d'une plage d'heures et, au choix, d'un produit, d'une ville ou d'un état
+
+        @Params {start} : Any => Première heure incluse (optionnel)
+        @Params {end} : Any => Heure de fin exclue (optionnel)
+        @Params {product} : str => Produit (optionnel)
+        @Params {city} : str => Ville (optionnel)
+        @Params {state} : str => État (optionnel)
+        @Return: pd.DataFrame => Cellules correspondantes
+        """
+        cells = self.cells
+        return _select(cells, self._hours, start, end, product, city, state)
+
+    def revenue_between(self, start=None, end=None) -> float:
+        """
+        @Description Calcule le chiffre d'affaires des heures complètes comprises dans [start, end) (mises à jour en attente comprises, sans fusion)
+
+        @Params {start} : Any => Première heure incluse (optionnel)
+        @Params {end} : Any => Heure de fin exclue (optionnel)
+        @Return: float => Chiffre d'affaires (non arrondi)
+        """
+        return float(sum(cells["revenue"].sum() for cells in self._parts(start, end)))
+
+    def rollup(self, start=None, end=None, product: str = None, city: str = None, state: str = None) -> SalesAggregates:
+        """
+        @Description Regroupe les cellules sélectionnées en agrégats par produit, mois, heure et ville (voir SalesAggregates) | Les mises à jour en attente sont regroupées à part puis fusionnées dans les agrégats.
+
+        @Params {start} : Any => Première heure incluse (optionnel)
+        @Params {end} : Any => Heure de fin exclue (optionnel)
+        @Params {product} : str => Produit (optionnel)
+        @Params {city} : str => Ville (optionnel)
+        @Params {state} : str => État (optionnel)
+        @Return: SalesAggregates => Agrégats des cellules sélectionnées
+        """
+        cells, *pending = self._parts(start, end, product, city, state)
+        aggregates = _rollup_cells(cells)
+        for delta in pending:
+            aggregates.merge(_rollup_cells(delta))
+        return aggregates
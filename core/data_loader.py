@@ -1,7 +1,231 @@
-## core/data_loader.py
-from typing import List
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import os
+import numpy as np
 import pandas as pd
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from core.address import ADDRESS_COLUMNS, split_addresses
+from core.cache import load_cached_csv, save_csv_cache
+from core.cube import SalesCube
+from core.aggregates import SalesAggregates
+from core.indexes import SalesIndexes, take_rows
+from core.instrumentation import count_rows, instrumentation, instrumented
+from core.journal import EditJournal
+
+REQUIRED_COLUMNS = ["Order ID", "Product", "Quantity Ordered", "Price Each", "Order Date", "Purchase Address"]
+ESSENTIAL_COLUMNS = ["Order ID", "Product", "Quantity Ordered", "Price Each"]
+
+## Formats de date candidats, du plus courant (exports de caisse) au moins courant
+DATE_FORMATS = ["%m/%d/%y %H:%M", "%m/%d/%Y %H:%M", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%d/%m/%Y %H:%M", "%Y-%m-%d"]
+
+
+def parse_order_dates(values: pd.Series, sample_size: int = 1000) -> Tuple[pd.Series, Dict[str, Any]]:
+    """
+    @Description Convertit les dates de commande en détectant le format dominant sur un échantillon | Seules les lignes qui ne respectent pas ce format passent par l'analyse mixte (lente).
+
+    @Params {values} : pd.Series => Dates au format texte
+    @Params {sample_size} : int => Nombre de valeurs utilisées pour détecter le format
+    @Return: Tuple[pd.Series, Dict[str, Any]] => Dates converties (NaT si invalides) et statistiques d'analyse
+    """
+    present = values.notna()
+    rows = int(present.sum())
+
+    ## Échantillon réparti sur toute la colonne pour détecter le format dominant
+    non_null = values[present]
+    sample = non_null.iloc[::max(1, len(non_null) // sample_size)].head(sample_size)
+    best_format, best_count = None, 0
+    for date_format in DATE_FORMATS:
+        count = int(pd.to_datetime(sample, format=date_format, errors='coerce').notna().sum())
+        if count > best_count:
+            best_format, best_count = date_format, count
+
+    if best_format is not None:
+        ## Analyse vectorisée de toute la colonne avec le format détecté
+        parsed = pd.to_datetime(values, format=best_format, errors='coerce')
+        slow = parsed.isna() & present
+        if slow.any():
+            parsed[slow] = pd.to_datetime(values[slow], format='mixed', errors='coerce')
+    else:
+        parsed = pd.to_datetime(values, format='mixed', errors='coerce')
+        slow = present
+
+    slow_rows = int(slow.sum())
+    stats = {
+        "format": best_format,
+        "rows": rows,
+        "fast_path": rows - slow_rows,
+        "slow_path": slow_rows,
+        "failed": int((parsed.isna() & present).sum()),
+        "parse_rate": (rows - slow_rows) / rows if rows else 1.0,
+    }
+    return parsed, stats
+
+
+def merge_date_stats(stats_list: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    @Description Fusionne les statistiques d'analyse des dates de plusieurs fichiers
+
+    @Params {stats_list} : List[Dict[str, Any]] => Statistiques de chaque fichier
+    @Return: Dict[str, Any] => Statistiques cumulées (formats détectés séparés par des virgules)
+    """
+    merged = {"format": ", ".join(sorted({stats["format"] for stats in stats_list if stats["format"]}))}
+    for key in ("rows", "fast_path", "slow_path", "failed"):
+        merged[key] = sum(stats[key] for stats in stats_list)
+    merged["parse_rate"] = merged["fast_path"] / merged["rows"] if merged["rows"] else 1.0
+    return merged
+
+
+def format_date_stats(stats: Dict[str, Any]) -> str:
+    """
+    @Description Formate les statistiques d'analyse des dates pour l'affichage
+
+    @Params {stats} : Dict[str, Any] => Statistiques retournées par parse_order_dates
+    @Return: str => Texte lisible contenant le taux d'analyse rapide
+    """
+    return (f"Dates : {stats['parse_rate'] * 100:.1f}% en analyse rapide (format {stats['format']}), "
+            f"{stats['slow_path']} lignes via l'analyse mixte, {stats['failed']} invalides")
+
+
+def _clean_sales_frame(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """
+    @Description Valide un DataFrame de ventes brut : colonnes requises, valeurs manquantes et conversion des types
+
+    @Params {df} : pd.DataFrame => Données brutes lues depuis le CSV
+    @Return: Tuple[pd.DataFrame, Dict[str, Any]] => DataFrame validé et statistiques d'analyse des dates
+    """
+    if not all(col in df.columns for col in REQUIRED_COLUMNS):
+        raise ValueError("Le CSV ne contient pas toutes les colonnes requises")
+
+    ## Supprimer les lignes où toutes les colonnes sont NaN
+    with instrumentation.stage("clean.dropna", len(df)) as stage:
+        df = df.dropna(how='all')
+
+        ## Supprimer les lignes avec des valeurs manquantes dans les colonnes essentielles
+        df = df.dropna(subset=ESSENTIAL_COLUMNS)
+        stage.rows_out = len(df)
+
+    ## Conversion des types avec gestion des erreurs
+    with instrumentation.stage("clean.to_numeric", len(df)) as stage:
+        df["Quantity Ordered"] = pd.to_numeric(df["Quantity Ordered"], errors='coerce')
+        df["Price Each"] = pd.to_numeric(df["Price Each"], errors='coerce')
+
+        ## Les lignes aux nombres invalides (ex: en-têtes répétés) sont écartées avant l'analyse des dates
+        df = df.dropna(subset=["Quantity Ordered", "Price Each"])
+        stage.rows_out = len(df)
+
+    ## Convertir les dates en gérant les formats invalides
+    with instrumentation.stage("clean.parse_dates", len(df)) as stage:
+        df["Order Date"], date_stats = parse_order_dates(df["Order Date"])
+
+        ## Supprimer les lignes avec des conversions échouées
+        df = df.dropna(subset=["Order Date"])
+
+        ## Convertir les quantités en entiers
+        df["Quantity Ordered"] = df["Quantity Ordered"].astype(int)
+        stage.rows_out = len(df)
+
+    ## Ville, état et code postal extraits une seule fois des adresses distinctes
+    with instrumentation.stage("clean.split_addresses", len(df)) as stage:
+        df = df.assign(**split_addresses(df["Purchase Address"]))
+        stage.rows_out = len(df)
+
+    return df, date_stats
+
+
+def compact_sales_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    @Description Convertit des données validées vers un schéma compact : catégories pour les textes répétés, entiers et flottants réduits
+
+    @Params {df} : pd.DataFrame => Données validées
+    @Return: pd.DataFrame => Nouveau DataFrame au schéma compact
+    """
+    df = df.copy(deep=False)
+    for column in ("Product", "Purchase Address"):
+        if not isinstance(df[column].dtype, pd.CategoricalDtype):
+            df[column] = df[column].astype("category")
+
+    quantity = df["Quantity Ordered"]
+    if len(quantity) == 0 or (quantity.min() >= np.iinfo(np.int32).min and quantity.max() <= np.iinfo(np.int32).max):
+        df["Quantity Ordered"] = quantity.astype(np.int32)
+    df["Price Each"] = df["Price Each"].astype(np.float32)
+
+    ## Order ID en int64 uniquement si tous les identifiants sont numériques
+    order_ids = pd.to_numeric(df["Order ID"], errors='coerce')
+    if order_ids.notna().all() and (order_ids % 1 == 0).all():
+        df["Order ID"] = order_ids.astype(np.int64)
+
+    return df
+
+
+def _read_sales_csv(file_path: str) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """
+    @Description Lit un fichier CSV de ventes et applique la validation (fonction de module pour pouvoir être exécutée dans un processus séparé)
+
+    @Params {file_path} : str => Chemin vers le fichier CSV
+    @Return: Tuple[pd.DataFrame, Dict[str, Any]] => DataFrame validé et statistiques d'analyse des dates
+    """
+    ## Lire le CSV en ignorant les lignes vides et en gérant les valeurs manquantes
+    with instrumentation.stage("read_csv") as stage:
+        df = pd.read_csv(
+            file_path,
+            skip_blank_lines=True,  ## Ignore les lignes complètement vides
+            na_values=['', 'nan', 'NaN', 'NULL'],  ## Valeurs considérées comme NaN
+            keep_default_na=True
+        )
+        stage.rows_out = len(df)
+    return _clean_sales_frame(df)
+
+
+def _load_sales_csv(file_path: str, use_cache: bool = True) -> Tuple[pd.DataFrame, Optional[Dict[str, Any]]]:
+    """
+    @Description Charge un fichier CSV de ventes validé, depuis le cache colonne s'il est à jour
+
+    @Params {file_path} : str => Chemin vers le fichier CSV
+    @Params {use_cache} : bool => Utiliser et alimenter le cache sur disque
+    @Return: Tuple[pd.DataFrame, Optional[Dict[str, Any]]] => DataFrame validé et statistiques des dates (None si lu depuis le cache)
+    """
+    if use_cache:
+        with instrumentation.stage("cache.load") as stage:
+            df = load_cached_csv(file_path)
+            stage.rows_out = count_rows(df)
+        if df is not None:
+            return df, None
+
+    df, date_stats = _read_sales_csv(file_path)
+    if use_cache:
+        with instrumentation.stage("cache.save", len(df)):
+            save_csv_cache(file_path, df)
+    return df, date_stats
+
+
+def _load_sales_csv_categorical(file_path: str, use_cache: bool = True, replay_journal: bool = True) -> Tuple[pd.DataFrame, Optional[Dict[str, Any]]]:
+    """
+    @Description Charge un fichier CSV de ventes, rejoue son journal et convertit les produits et lieux en catégories (réduit le volume échangé entre processus)
+
+    @Params {file_path} : str => Chemin vers le fichier CSV
+    @Params {use_cache} : bool => Utiliser et alimenter le cache sur disque
+    @Params {replay_journal} : bool => Rejouer le journal des modifications du fichier s'il existe
+    @Return: Tuple[pd.DataFrame, Optional[Dict[str, Any]]] => DataFrame validé avec les colonnes Product et lieux catégorielles et statistiques des dates
+    """
+    df, date_stats = _load_sales_csv(file_path, use_cache)
+    ## Comme pour load_csv, les modifications journalisées s'appliquent par-dessus le fichier de base
+    journal = EditJournal.for_csv(file_path)
+    if replay_journal and journal.exists():
+        with instrumentation.stage("journal.replay", len(df)) as stage:
+            df = journal.replay(df)
+            stage.rows_out = len(df)
+    ## Les lignes ajoutées par le journal peuvent rendre les colonnes de lieu non catégorielles
+    for column in ["Product"] + ADDRESS_COLUMNS:
+        df[column] = df[column].astype("category")
+    return df, date_stats
+
+
+def _loader_rows(loader: "DataLoader") -> Optional[int]:
+    """
+    @Description Nombre de lignes chargées (mesures de l'instrumentation)
+    """
+    return None if loader.data is None else len(loader.data)
+
 
 class DataLoader:
     """
@@ -10,59 +234,225 @@ class DataLoader:
     """
     def __init__(self):
         self.data = None
+        self.indexes = None
+        self.cube = None
+        self.date_parse_stats = None
+        ## Mémoire par colonne avant la dernière conversion au schéma compact
+        self._memory_before = None
 
-    def load_csv(self, file_path: str) -> pd.DataFrame:
+    @instrumented
+    def load_csv(self, file_path: str, use_cache: bool = True, compact: bool = False, replay_journal: bool = True) -> pd.DataFrame:
         """
-        @Description Charge un fichier CSV et valide son format
+        @Description Charge un fichier CSV et valide son format | Un cache binaire stocké à côté du fichier évite de relire un CSV inchangé.
 
         @Params {file_path} : str => Chemin vers le fichier CSV
+        @Params {use_cache} : bool => Utiliser et alimenter le cache sur disque (True par défaut)
+        @Params {compact} : bool => Convertir les données au schéma compact (voir compact)
+        @Params {replay_journal} : bool => Rejouer le journal des modifications du fichier s'il existe (True par défaut)
         @Return: pd.DataFrame => DataFrame contenant les données du CSV
         """
         if not Path(file_path).exists():
             raise FileNotFoundError(f"Le fichier {file_path} n'existe pas")
 
         try:
-            ## Lire le CSV en ignorant les lignes vides et en gérant les valeurs manquantes
-            df = pd.read_csv(
-                file_path,
-                skip_blank_lines=True,  ## Ignore les lignes complètement vides
-                na_values=['', 'nan', 'NaN', 'NULL'],  ## Valeurs considérées comme NaN
-                keep_default_na=True
-            )
+            df, date_stats = _load_sales_csv(file_path, use_cache)
+
+            if date_stats is None:
+                print(f"Données chargées depuis le cache : {len(df)} lignes valides")
+            else:
+                print(f"Données chargées : {len(df)} lignes valides sur {len(df) + df.isna().any(axis=1).sum()} lignes totales")
+                print(format_date_stats(date_stats))
 
-            required_columns = ["Order ID", "Product", "Quantity Ordered","Price Each", "Order Date", "Purchase Address"]
+            self.date_parse_stats = date_stats
+
+            ## Cube du fichier de base, enregistré à côté du fichier comme le cache
+            with instrumentation.stage("cube", len(df)) as stage:
+                cube = SalesCube.load(file_path) if use_cache else None
+                if cube is None:
+                    cube = SalesCube.from_frame(df)
+                    if use_cache:
+                        cube.save(file_path)
+                stage.rows_out = len(cube)
+
+            ## Les modifications journalisées s'appliquent par-dessus le fichier de base (et son cache)
+            journal = EditJournal.for_csv(file_path)
+            if replay_journal and journal.exists():
+                with instrumentation.stage("journal.replay", len(df)) as stage:
+                    df = journal.replay(df, cube)
+                    stage.rows_out = len(df)
+                print(f"Journal des modifications rejoué : {journal.path}")
+
+            self.data = df
+            self.cube = cube
+            self.indexes = SalesIndexes(df)
+            self._memory_before = None
+            if compact:
+                self.compact()
+            return self.data
+
+        except Exception as e:
+            raise Exception(f"Erreur lors du chargement du CSV: {str(e)}")
 
-            if not all(col in df.columns for col in required_columns):
-                raise ValueError("Le CSV ne contient pas toutes les colonnes requises")
+    @instrumented
+    def load_directory(self, directory: str = "data", pattern: str = "Sales_*.csv", max_workers: int = None, use_cache: bool = True, compact: bool = False, replay_journal: bool = True) -> pd.DataFrame:
+        """
+        @Description Charge en parallèle tous les fichiers CSV d'un dossier correspondant à un motif et les concatène
 
-            ## Supprimer les lignes où toutes les colonnes sont NaN
-            df = df.dropna(how='all')
+        @Params {directory} : str => Dossier contenant les fichiers CSV
+        @Params {pattern} : str => Motif glob des fichiers à charger (ex: Sales_*.csv), hors fichiers *_updated.csv
+        @Params {max_workers} : int => Nombre maximum de processus (optionnel, nombre de cœurs par défaut)
+        @Params {use_cache} : bool => Utiliser et alimenter le cache sur disque de chaque fichier
+        @Params {compact} : bool => Convertir les données au schéma compact (voir compact)
+        @Params {replay_journal} : bool => Rejouer le journal des modifications de chaque fichier s'il existe (True par défaut)
+        @Return: pd.DataFrame => DataFrame unique contenant les données de tous les fichiers
+        """
+        ## Les fichiers *_updated.csv (voir DataProcessor.compact_data) reprennent les ventes de leur fichier d'origine :
+        ## les charger avec lui compterait ces ventes deux fois
+        files = sorted(str(path) for path in Path(directory).glob(pattern) if path.is_file() and not path.stem.endswith("_updated"))
+        if not files:
+            raise FileNotFoundError(f"Aucun fichier ne correspond à {pattern} dans {directory}")
+        return self.load_files(files, max_workers, use_cache, compact, replay_journal)
 
-            ## Supprimer les lignes avec des valeurs manquantes dans les colonnes essentielles
-            essential_columns = ["Order ID", "Product", "Quantity Ordered", "Price Each"]
-            df = df.dropna(subset=essential_columns)
+    @instrumented
+    def load_files(self, files: List[str], max_workers: int = None, use_cache: bool = True, compact: bool = False, replay_journal: bool = True) -> pd.DataFrame:
+        """
+        @Description Charge en parallèle une liste de fichiers CSV et les concatène
 
-            ## Conversion des types avec gestion des erreurs
-            df["Quantity Ordered"] = pd.to_numeric(df["Quantity Ordered"], errors='coerce')
-            df["Price Each"] = pd.to_numeric(df["Price Each"], errors='coerce')
+        @Params {files} : List[str] => Chemins des fichiers CSV
+        @Params {max_workers} : int => Nombre maximum de processus (optionnel, nombre de cœurs par défaut)
+        @Params {use_cache} : bool => Utiliser et alimenter le cache sur disque de chaque fichier
+        @Params {compact} : bool => Convertir les données au schéma compact (voir compact)
+        @Params {replay_journal} : bool => Rejouer le journal des modifications de chaque fichier s'il existe (True par défaut)
+        @Return: pd.DataFrame => DataFrame unique contenant les données de tous les fichiers
+        """
+        if not files:
+            raise FileNotFoundError("Aucun fichier à charger")
+        for file in files:
+            if not Path(file).exists():
+                raise FileNotFoundError(f"Le fichier {file} n'existe pas")
 
-            ## Convertir les dates en gérant les formats invalides
-            df["Order Date"] = pd.to_datetime(df["Order Date"], format='mixed', errors='coerce')
+        try:
+            workers = min(len(files), max_workers or os.cpu_count() or 1)
+            if workers > 1:
+                ## Les fichiers sont indépendants : chaque processus en traite un
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    results = list(executor.map(_load_sales_csv_categorical, files, [use_cache] * len(files), [replay_journal] * len(files)))
+            else:
+                results = [_load_sales_csv_categorical(file, use_cache, replay_journal) for file in files]
+            frames = [frame for frame, _ in results]
+            parsed_stats = [date_stats for _, date_stats in results if date_stats is not None]
 
-            ## Supprimer les lignes avec des conversions échouées
-            df = df.dropna(subset=["Quantity Ordered", "Price Each", "Order Date"])
+            ## Partager le même type catégoriel entre tous les fichiers pour une concaténation sans conversion
+            for column in ["Product"] + ADDRESS_COLUMNS:
+                merged = pd.api.types.union_categoricals([frame[column] for frame in frames], ignore_order=True)
+                dtype = pd.CategoricalDtype(sorted(merged.categories))
+                for frame in frames:
+                    frame[column] = frame[column].astype(dtype)
 
-            ## Convertir les quantités en entiers
-            df["Quantity Ordered"] = df["Quantity Ordered"].astype(int)
+            df = pd.concat(frames, ignore_index=True)
 
-            print(f"Données chargées : {len(df)} lignes valides sur {len(df) + df.isna().any(axis=1).sum()} lignes totales")
+            print(f"Données chargées : {len(df)} lignes valides depuis {len(files)} fichiers")
+            for journal in (EditJournal.for_csv(file) for file in files if replay_journal):
+                if journal.exists():
+                    print(f"Journal des modifications rejoué : {journal.path}")
+            self.date_parse_stats = merge_date_stats(parsed_stats) if parsed_stats else None
+            if self.date_parse_stats:
+                print(format_date_stats(self.date_parse_stats))
 
             self.data = df
-            return df
+            self.indexes = SalesIndexes(df)
+            ## Cube construit à la demande par DataProcessor pour les données combinées
+            self.cube = None
+            self._memory_before = None
+            if compact:
+                self.compact()
+            return self.data
 
         except Exception as e:
-            raise Exception(f"Erreur lors du chargement du CSV: {str(e)}")
+            raise Exception(f"Erreur lors du chargement des CSV: {str(e)}")
+
+    @instrumented(rows_in=_loader_rows)
+    def compact(self) -> pd.DataFrame:
+        """
+        @Description Convertit les données chargées au schéma compact (produits et adresses en catégories, quantités int32, prix float32, Order ID int64)
+
+        @Return: pd.DataFrame => Données compactes
+        """
+        if self.data is None:
+            raise Exception("Aucune donnée n'a été chargée")
+        if self._memory_before is None:
+            self._memory_before = self.data.memory_usage(index=False, deep=True)
+        self.data = compact_sales_frame(self.data)
+        self.indexes = SalesIndexes(self.data)
+        return self.data
+
+    @instrumented(rows_in=_loader_rows)
+    def memory_report(self) -> pd.DataFrame:
+        """
+        @Description Compare la mémoire utilisée par colonne avant et après la conversion au schéma compact | Si les données n'ont pas été compactées, la colonne "après" est une estimation.
 
+        @Return: pd.DataFrame => Octets par colonne (bytes_before, bytes_after, ratio) avec une ligne Total
+        """
+        if self.data is None:
+            raise Exception("Aucune donnée n'a été chargée")
+        if self._memory_before is None:
+            before = self.data.memory_usage(index=False, deep=True)
+            after = compact_sales_frame(self.data).memory_usage(index=False, deep=True)
+        else:
+            before = self._memory_before
+            after = self.data.memory_usage(index=False, deep=True)
+
+        report = pd.DataFrame({"bytes_before": before, "bytes_after": after}).fillna(0).astype(np.int64)
+        report.loc["Total"] = report.sum()
+        report["ratio"] = (report["bytes_before"] / report["bytes_after"].where(report["bytes_after"] > 0)).round(2)
+        return report
+
+    def iter_csv(self, file_path: str, chunksize: int = 100_000) -> Iterator[pd.DataFrame]:
+        """
+        @Description Lit un fichier CSV par morceaux validés, sans charger tout le fichier en mémoire
+
+        @Params {file_path} : str => Chemin vers le fichier CSV
+        @Params {chunksize} : int => Nombre de lignes lues par morceau
+        @Return: Iterator[pd.DataFrame] => Générateur de morceaux validés
+        """
+        if not Path(file_path).exists():
+            raise FileNotFoundError(f"Le fichier {file_path} n'existe pas")
+
+        stats_list = []
+        with pd.read_csv(
+            file_path,
+            skip_blank_lines=True,
+            na_values=['', 'nan', 'NaN', 'NULL'],
+            keep_default_na=True,
+            chunksize=chunksize
+        ) as reader:
+            for chunk in reader:
+                chunk, date_stats = _clean_sales_frame(chunk)
+                stats_list.append(date_stats)
+                yield chunk
+
+        self.date_parse_stats = merge_date_stats(stats_list) if stats_list else None
+
+    @instrumented
+    def stream_aggregates(self, file_path: str, chunksize: int = 100_000) -> SalesAggregates:
+        """
+        @Description Calcule les agrégats de ventes d'un fichier en mode flux | La mémoire utilisée dépend de la taille des morceaux, pas de celle du fichier.
+
+        @Params {file_path} : str => Chemin vers le fichier CSV
+        @Params {chunksize} : int => Nombre de lignes lues par morceau
+        @Return: SalesAggregates => Agrégats (résumé, tendances, chiffre d'affaires) de tout le fichier
+        """
+        try:
+            aggregates = SalesAggregates.from_chunks(self.iter_csv(file_path, chunksize))
+            print(f"Données agrégées : {aggregates.rows} lignes valides")
+            return aggregates
+
+        except FileNotFoundError:
+            raise
+        except Exception as e:
+            raise Exception(f"Erreur lors de la lecture du CSV: {str(e)}")
+
+    @instrumented(rows_in=_loader_rows)
     def get_unique_products(self) -> List[str]:
         """
         @Description Récupère la liste des produits uniques
@@ -71,8 +461,21 @@ class DataLoader:
         """
         if self.data is None:
             raise Exception("Aucune donnée n'a été chargée")
-        return self.data["Product"].unique().tolist()
+        return self.indexes.products.keys()
+
+    @instrumented(rows_in=_loader_rows)
+    def filter_by_product(self, product: str) -> pd.DataFrame:
+        """
+        @Description Filtre les données pour un produit à l'aide de l'index des produits
+
+        @Params {product} : str => Nom du produit
+        @Return: pd.DataFrame => DataFrame filtré pour le produit donné
+        """
+        if self.data is None:
+            raise Exception("Aucune donnée n'a été chargée")
+        return take_rows(self.data, self.indexes.products.positions(product))
 
+    @instrumented(rows_in=_loader_rows)
     def filter_by_date(self, date: str) -> pd.DataFrame:
         """
         @Description Filtre les données pour une date spécifique
@@ -82,4 +485,5 @@ class DataLoader:
         """
         if self.data is None:
             raise Exception("Aucune donnée n'a été chargée")
-        return self.data[self.data["Order Date"].dt.date == pd.to_datetime(date).date()]
+        ## Recherche dichotomique dans l'index trié des dates au lieu d'une comparaison sur chaque ligne
+        return take_rows(self.data, self.indexes.time.day_positions(date))
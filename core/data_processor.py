@@ -1,50 +1,202 @@
 ## core/data_processor.py
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any
+from typing import Callable, Dict, Any, List, Optional, Tuple
+import shutil
+import numpy as np
 import pandas as pd
+from core.address import ADDRESS_COLUMNS, split_addresses
+from core.aggregates import SalesAggregates, price_values
+from core.cache import cache_dir_for
+from core.cube import SalesCube, cube_dir_for
+from core.indexes import SalesIndexes, normalize_order_id, take_rows
+from core.instrumentation import instrumentation, instrumented
+
+## Format des dates des exports : les fichiers écrits sont relus par l'analyse rapide des dates
+EXPORT_DATE_FORMAT = "%m/%d/%y %H:%M"
+
+
+def _copy_result(value: Any) -> Any:
+    """
+    @Description Copie un résultat d'analyse mémorisé (DataFrame, positions, agrégats, dictionnaire) | Seules les valeurs immuables (nombres, tranches de positions) sont partagées avec le cache.
+
+    @Params {value} : Any => Résultat à copier
+    @Return: Any => Copie indépendante du résultat
+    """
+    if isinstance(value, (pd.DataFrame, pd.Series, np.ndarray)):
+        return value.copy()
+    if isinstance(value, SalesAggregates):
+        ## Fusion dans des agrégats vides : chaque compteur est recopié
+        return SalesAggregates().merge(value)
+    if isinstance(value, dict):
+        return {key: _copy_result(item) for key, item in value.items()}
+    return value
+
+
+def _align_new_rows(data: pd.DataFrame, new_rows: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    @Description Aligne les types des nouvelles lignes sur ceux des données (catégories étendues, numériques réduits) pour que la concaténation conserve le schéma
+
+    @Params {data} : pd.DataFrame => Données existantes
+    @Params {new_rows} : pd.DataFrame => Lignes à ajouter
+    @Return: Tuple[pd.DataFrame, pd.DataFrame] => Données et nouvelles lignes aux types compatibles
+    """
+    new_rows = new_rows.reindex(columns=data.columns)
+    for column in data.columns:
+        dtype = data[column].dtype
+        try:
+            if isinstance(dtype, pd.CategoricalDtype):
+                missing = pd.Index(new_rows[column].dropna().unique()).difference(dtype.categories)
+                if len(missing):
+                    data = data.assign(**{column: data[column].cat.add_categories(missing)})
+                new_rows[column] = new_rows[column].astype(data[column].dtype)
+            elif pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+                values = pd.to_numeric(new_rows[column])
+                if pd.api.types.is_integer_dtype(dtype) and (values.isna().any() or (values % 1 != 0).any()):
+                    continue
+                new_rows[column] = values.astype(dtype)
+        except (ValueError, TypeError):
+            ## Valeurs incompatibles (ex: Order ID texte) : pandas choisira un type commun
+            continue
+    return data, new_rows
+
+
+def _processor_rows(processor: "DataProcessor") -> int:
+    """
+    @Description Nombre de lignes traitées, lignes en attente comprises, sans les fusionner (mesures de l'instrumentation)
+    """
+    return len(processor._data) + processor._pending_count
+
 
 class DataProcessor:
     """
     @Description Classe responsable du traitement et de l'analyse des données de vente
     """
 
-    def __init__(self, data: pd.DataFrame):
+    ## Nombre de lignes en attente au-delà duquel elles sont fusionnées dans les données
+    APPEND_BATCH_SIZE = 10_000
+    ## Nombre maximum de résultats mémorisés (les moins récemment utilisés sont oubliés en premier)
+    RESULT_CACHE_SIZE = 128
+
+    def __init__(self, data: pd.DataFrame, cube: SalesCube = None):
         """
         @Description Initialise le processeur de données
 
         @Params {data} : pd.DataFrame => DataFrame contenant les données de vente
+        @Params {cube} : SalesCube => Cube déjà construit pour ces données (optionnel, ex: DataLoader.cube)
         """
+        ## Compteur de version des données : toute modification invalide les résultats mémorisés
+        self.version = 0
+        self._results = OrderedDict()
+        self.journal = None
         self.data = data
+        self._cube = cube
 
-    def get_sales_summary(self) -> pd.DataFrame:
+    @property
+    def data(self) -> pd.DataFrame:
         """
-        @Description Calcule un résumé des ventes pour chaque produit
+        @Description Données de vente traitées (les lignes ajoutées en attente y sont fusionnées au premier accès)
+        """
+        if self._pending_count:
+            self._flush_pending()
+        return self._data
+
+    @data.setter
+    def data(self, data: pd.DataFrame) -> None:
+        ## Nouvelles données : les agrégats et les index seront recalculés à la prochaine utilisation
+        self._data = data
+        self._aggregates = None
+        self._cube = None
+        self._indexes = SalesIndexes(data)
+        ## Tampon d'ajout : colonne -> liste de valeurs des lignes pas encore fusionnées
+        self._pending = {}
+        self._pending_count = 0
+        self._bump_version()
+
+    @property
+    def indexes(self) -> SalesIndexes:
+        """
+        @Description Index des données (dates, produits, Order ID, seuils) | Les lignes ajoutées en attente sont d'abord fusionnées : leurs positions figurent dans les index.
+        """
+        if self._pending_count:
+            self._flush_pending()
+        return self._indexes
 
-        @Return: pd.DataFrame => DataFrame contenant les statistiques de ventes par produit
+    def _bump_version(self) -> None:
         """
-        sales_summary = self.data.groupby("Product").agg({
-            "Quantity Ordered": ["sum", "count"],  # sum pour quantité totale, count pour nombre de commandes
-            "Price Each": ["mean"]  # prix moyen unitaire
-        }).round(2)
+        @Description Incrémente la version des données, ce qui invalide les résultats mémorisés
+        """
+        self.version += 1
+        self._results.clear()
 
-        ## Aplatir les colonnes multi-index
-        sales_summary.columns = ["total_quantity", "number_of_orders", "average_price"]
+    def _memoize(self, name: str, compute: Callable, *args) -> Any:
+        """
+        @Description Retourne le résultat mémorisé d'une analyse pour la version courante des données, ou le calcule
 
-        ## Calculer le revenu total
-        sales_summary["total_revenue"] = (sales_summary["total_quantity"] * sales_summary["average_price"]).round(2)
+        @Params {name} : str => Nom de l'analyse
+        @Params {compute} : Callable => Fonction de calcul appelée avec *args en cas d'absence
+        @Return: Any => Copie du résultat (l'appelant peut la modifier sans altérer le cache, voir _copy_result)
+        """
+        key = (name,) + args
+        cached = self._results.get(key)
+        if cached is None or cached[0] != self.version:
+            cached = (self.version, compute(*args))
+            self._results[key] = cached
+            if len(self._results) > self.RESULT_CACHE_SIZE:
+                self._results.popitem(last=False)
+        else:
+            self._results.move_to_end(key)
+        return _copy_result(cached[1])
+
+    @property
+    def aggregates(self) -> SalesAggregates:
+        """
+        @Description Agrégats par produit et par période, calculés une fois puis mis à jour à chaque ajout ou modification
+        """
+        if self._aggregates is None:
+            with instrumentation.stage("DataProcessor.aggregates", _processor_rows(self)) as stage:
+                ## Regroupement des cellules du cube s'il existe déjà (ex: chargé avec le fichier), sinon des lignes
+                self._aggregates = self._cube.rollup() if self._cube is not None else SalesAggregates.from_frame(self.data)
+                stage.rows_out = self._aggregates.rows
+        return self._aggregates
+
+    @property
+    def cube(self) -> SalesCube:
+        """
+        @Description Cube (heure, produit, ville) des ventes, construit une fois puis mis à jour à chaque ajout ou modification
+        """
+        if self._cube is None:
+            with instrumentation.stage("DataProcessor.cube", _processor_rows(self)) as stage:
+                self._cube = SalesCube.from_frame(self.data)
+                stage.rows_out = len(self._cube)
+        return self._cube
 
-        ## Trier par quantité totale vendue
-        sales_summary = sales_summary.sort_values("total_quantity", ascending=False)
+    @instrumented(rows_in=_processor_rows)
+    def get_sales_summary(self) -> pd.DataFrame:
+        """
+        @Description Calcule un résumé des ventes pour chaque produit
 
-        return sales_summary
+        @Return: pd.DataFrame => DataFrame contenant les statistiques de ventes par produit
+        """
+        ## Lecture des agrégats maintenus : pas de groupby sur toutes les lignes
+        return self._memoize("sales_summary", lambda: self.aggregates.get_sales_summary())
 
-    def get_best_selling_product(self) -> Dict[str, Any]:
+    @instrumented(rows_in=_processor_rows)
+    def get_best_selling_product(self) -> Optional[Dict[str, Any]]:
         """
         @Description Trouve le produit le plus vendu avec des statistiques détaillées
 
-        @Return: Dict[str, Any] => Dictionnaire contenant les informations du produit le plus vendu
+        @Return: Optional[Dict[str, Any]] => Dictionnaire contenant les informations du produit le plus vendu (None si aucune vente)
+        """
+        return self._memoize("best_selling_product", self._compute_best_selling_product)
+
+    def _compute_best_selling_product(self) -> Optional[Dict[str, Any]]:
+        """
+        @Description Extrait le produit le plus vendu du résumé des ventes (mémorisé)
         """
         sales_summary = self.get_sales_summary()
+        if sales_summary.empty:
+            return None
         best_product = sales_summary.index[0]  ## Premier produit car déjà trié par quantité
 
         return {
@@ -55,50 +207,34 @@ class DataProcessor:
             "total_revenue": float(sales_summary.loc[best_product, "total_revenue"]),
         }
 
+    @instrumented(rows_in=_processor_rows)
     def get_sales_trends(self) -> Dict[str, pd.DataFrame]:
         """
         @Description Analyse les tendances de ventes selon différentes périodes
 
         @Return: Dict[str, pd.DataFrame] => Dictionnaire contenant les différentes analyses de tendances
         """
-        ## Créer une copie des données
-        df = self.data.copy()
-
-        ## Extraire différentes composantes de date
-        df['Year'] = df['Order Date'].dt.year
-        df['Month'] = df['Order Date'].dt.month
-        df['Day'] = df['Order Date'].dt.day
-        df['Hour'] = df['Order Date'].dt.hour
-
-        ## Tendances par mois
-        monthly_trends = df.groupby(['Year', 'Month']).agg({
-            'Order ID': 'count',  # Nombre de commandes
-            'Quantity Ordered': 'sum',  # Quantité totale
-            'Price Each': lambda x: (x * df.loc[x.index, 'Quantity Ordered']).sum()  # Revenu total
-        }).round(2).reset_index()
-        monthly_trends.columns = ['Year', 'Month', 'number_of_orders', 'total_quantity', 'total_revenue']
-
-        ## Tendances par heure
-        hourly_trends = df.groupby('Hour').agg({
-            'Order ID': 'count',
-            'Quantity Ordered': 'sum',
-            'Price Each': lambda x: (x * df.loc[x.index, 'Quantity Ordered']).sum()
-        }).round(2).reset_index()
-        hourly_trends.columns = ['Hour', 'number_of_orders', 'total_quantity', 'total_revenue']
-
-        ## Tendances par produit et par mois
-        product_monthly_trends = df.groupby(['Year', 'Month', 'Product']).agg({
-            'Quantity Ordered': 'sum',
-            'Price Each': lambda x: (x * df.loc[x.index, 'Quantity Ordered']).sum()
-        }).round(2)
-        product_monthly_trends.columns = ['total_quantity', 'total_revenue']
+        return self._memoize("sales_trends", lambda: self.aggregates.get_sales_trends())
 
-        return {
-            'monthly': monthly_trends,
-            'hourly': hourly_trends,
-            'product_monthly': product_monthly_trends
-        }
+    @instrumented(rows_in=_processor_rows)
+    def get_sales_by_city(self) -> pd.DataFrame:
+        """
+        @Description Calcule le nombre de commandes, la quantité et le chiffre d'affaires par ville
+
+        @Return: pd.DataFrame => Ventes par (City, State) triées par chiffre d'affaires
+        """
+        return self._memoize("sales_by_city", lambda: self.aggregates.get_sales_by_city())
 
+    @instrumented(rows_in=_processor_rows)
+    def get_sales_by_state(self) -> pd.DataFrame:
+        """
+        @Description Calcule le nombre de commandes, la quantité et le chiffre d'affaires par état
+
+        @Return: pd.DataFrame => Ventes par State triées par chiffre d'affaires
+        """
+        return self._memoize("sales_by_state", lambda: self.aggregates.get_sales_by_state())
+
+    @instrumented(rows_in=_processor_rows)
     def get_sales_by_threshold(self, min_quantity: int = None, max_quantity: int = None, min_price: float = None, max_price: float = None) -> pd.DataFrame:
         """
         @Description Filtre les ventes selon des seuils de quantité et de prix
@@ -109,19 +245,26 @@ class DataProcessor:
         @Params {max_price} : float => Prix maximum (optionnel)
         @Return: pd.DataFrame => DataFrame filtré selon les critères
         """
-        filtered_data = self.data.copy()
+        positions = self.get_threshold_positions(min_quantity, max_quantity, min_price, max_price)
+        return take_rows(self.data, positions)
 
-        if min_quantity is not None:
-            filtered_data = filtered_data[filtered_data['Quantity Ordered'] >= min_quantity]
-        if max_quantity is not None:
-            filtered_data = filtered_data[filtered_data['Quantity Ordered'] <= max_quantity]
-        if min_price is not None:
-            filtered_data = filtered_data[filtered_data['Price Each'] >= min_price]
-        if max_price is not None:
-            filtered_data = filtered_data[filtered_data['Price Each'] <= max_price]
+    @instrumented(rows_in=_processor_rows)
+    def get_threshold_positions(self, min_quantity: int = None, max_quantity: int = None, min_price: float = None, max_price: float = None):
+        """
+        @Description Retourne les positions des ventes respectant les seuils, sans construire de DataFrame | Permet de parcourir les résultats par morceaux.
 
-        return filtered_data
+        @Params {min_quantity} : int => Quantité minimum (optionnel)
+        @Params {max_quantity} : int => Quantité maximum (optionnel)
+        @Params {min_price} : float => Prix minimum (optionnel)
+        @Params {max_price} : float => Prix maximum (optionnel)
+        @Return: Positions => Tranche ou tableau trié des positions correspondantes
+        """
+        return self.indexes.thresholds.query(
+            self.data['Quantity Ordered'].to_numpy(), self.data['Price Each'].to_numpy(),
+            min_quantity, max_quantity, min_price, max_price
+        )
 
+    @instrumented(rows_in=_processor_rows)
     def calculate_total_revenue(self, start_date: str = None, end_date: str = None) -> float:
         """
         @Description Calcule le chiffre d'affaires total pour une période donnée
@@ -130,18 +273,178 @@ class DataProcessor:
         @Params {end_date} : str => Date de fin au format YYYY-MM-DD (optionnel)
         @Return: float => Chiffre d'affaires total
         """
-        filtered_data = self.data.copy()
-
-        if start_date:
-            filtered_data = filtered_data[filtered_data['Order Date'] >= pd.to_datetime(start_date)]
-        if end_date:
-            filtered_data = filtered_data[filtered_data['Order Date'] <= pd.to_datetime(end_date)]
+        return self._memoize("total_revenue", self._compute_total_revenue, start_date, end_date)
 
-        # Calculer le revenu total (quantité * prix pour chaque vente)
-        revenue = (filtered_data['Quantity Ordered'] * filtered_data['Price Each']).sum()
+    def _compute_total_revenue(self, start_date: str = None, end_date: str = None) -> float:
+        """
+        @Description Calcule le chiffre d'affaires total pour une période donnée (sans mémorisation)
+        """
+        if not start_date and not end_date:
+            return round(self.aggregates.total_revenue, 2)
+
+        ## Heures complètes lues dans le cube, lignes des heures partielles trouvées dans l'index des dates
+        hours, edges = self._split_range(start_date, end_date)
+        revenue = self.cube.revenue_between(*hours) if hours is not None else 0.0
+        for bounds in edges:
+            for rows in self._edge_rows(*bounds):
+                # Calculer le revenu total (quantité * prix pour chaque vente)
+                quantity = rows['Quantity Ordered'].to_numpy()
+                price = price_values(rows['Price Each'].to_numpy())
+                revenue += float((quantity * price).sum())
 
         return round(revenue, 2)
 
+    def _split_range(self, start_date=None, end_date=None, include_end: bool = True):
+        """
+        @Description Découpe une période en heures complètes (lues dans le cube) et en lignes des heures partielles aux bords
+
+        @Params {start_date} : Any => Date de début incluse (optionnel)
+        @Params {end_date} : Any => Date de fin (optionnel)
+        @Params {include_end} : bool => Inclure les ventes dont la date est égale à la date de fin
+        @Return: Tuple => (heures [début, fin) du cube ou None, bornes (début, fin, include_end) des périodes de bord)
+        """
+        start = pd.to_datetime(start_date) if start_date else None
+        end = pd.to_datetime(end_date) if end_date else None
+        first = start.ceil('h') if start is not None else None
+        last = end.floor('h') if end is not None else None
+
+        ## Période contenue dans une seule heure : uniquement des lignes
+        if first is not None and last is not None and first > last:
+            return None, [(start, end, include_end)]
+
+        edges = []
+        if start is not None and start < first:
+            edges.append((start, first, False))
+        if end is not None:
+            edges.append((last, end, include_end))
+        return (first, last), edges
+
+    def _edge_rows(self, start, end, include_end: bool) -> List[pd.DataFrame]:
+        """
+        @Description Retourne les lignes d'une période de bord sans fusionner le tampon d'ajout : index des dates sur les données, filtre direct des lignes en attente
+
+        @Params {start} : Any => Date de début incluse
+        @Params {end} : Any => Date de fin
+        @Params {include_end} : bool => Inclure les ventes dont la date est égale à la date de fin
+        @Return: List[pd.DataFrame] => Lignes des données, puis lignes en attente de la période s'il y en a
+        """
+        frames = [take_rows(self._data, self._indexes.time.range_positions(start, end, include_end))]
+        if self._pending_count:
+            pending = pd.DataFrame(self._pending)
+            dates = pending["Order Date"]
+            inside = (dates >= start) & ((dates <= end) if include_end else (dates < end))
+            frames.append(pending[inside.to_numpy()])
+        return frames
+
+    @instrumented(rows_in=_processor_rows)
+    def get_view(self, start_date=None, end_date=None, product: str = None, city: str = None, state: str = None, include_end: bool = True) -> SalesAggregates:
+        """
+        @Description Calcule les analyses d'un sous-ensemble des ventes (période, produit, ville, état) à partir du cube | Le résultat offre get_sales_summary, get_best_selling_product et get_sales_trends.
+
+        @Params {start_date} : Any => Date de début incluse (optionnel)
+        @Params {end_date} : Any => Date de fin (optionnel)
+        @Params {product} : str => Produit (optionnel)
+        @Params {city} : str => Ville (optionnel)
+        @Params {state} : str => État (optionnel)
+        @Params {include_end} : bool => Inclure les ventes dont la date est égale à la date de fin
+        @Return: SalesAggregates => Agrégats des ventes sélectionnées
+        """
+        hours, edges = self._split_range(start_date, end_date, include_end)
+        view = self.cube.rollup(*hours, product=product, city=city, state=state) if hours is not None else SalesAggregates()
+        for bounds in edges:
+            for rows in self._edge_rows(*bounds):
+                for column, value in (("Product", product), ("City", city), ("State", state)):
+                    if value is not None:
+                        rows = rows[rows[column] == value]
+                view.merge(SalesAggregates.from_frame(rows))
+        return view
+
+    @instrumented(rows_in=_processor_rows)
+    def get_filter_positions(self, date: str = None, product: str = None):
+        """
+        @Description Retourne les positions des ventes d'un jour et/ou d'un produit (mémorisées : revenir à un filtre récent ne recalcule rien)
+
+        @Params {date} : str => Jour au format YYYY-MM-DD (optionnel)
+        @Params {product} : str => Nom du produit (optionnel)
+        @Return: Positions => Tranche ou tableau trié des positions correspondantes
+        """
+        day = pd.Timestamp(date).normalize() if date else None
+        return self._memoize("filter_positions", self._compute_filter_positions, day, product or None)
+
+    def _compute_filter_positions(self, day=None, product: str = None):
+        """
+        @Description Calcule les positions d'un filtre jour/produit à l'aide des index (sans mémorisation)
+        """
+        if day is None:
+            return self.indexes.products.positions(product) if product else slice(0, len(self.data))
+
+        positions = self.indexes.time.day_positions(day)
+        if not product:
+            return positions
+        ## Les ventes du jour sont peu nombreuses : filtre direct du produit sur ce sous-ensemble
+        if isinstance(positions, slice):
+            positions = np.arange(positions.start, positions.stop)
+        return positions[self.data['Product'].to_numpy()[positions] == product]
+
+    @instrumented(rows_in=_processor_rows)
+    def get_filtered_view(self, date: str = None, product: str = None) -> SalesAggregates:
+        """
+        @Description Retourne les analyses des ventes d'un jour et/ou d'un produit, lues dans le cube et mémorisées
+
+        @Params {date} : str => Jour au format YYYY-MM-DD (optionnel)
+        @Params {product} : str => Nom du produit (optionnel)
+        @Return: SalesAggregates => Agrégats des ventes filtrées (get_sales_summary, get_sales_trends...)
+        """
+        day = pd.Timestamp(date).normalize() if date else None
+        return self._memoize("filtered_view", self._compute_filtered_view, day, product or None)
+
+    def _compute_filtered_view(self, day=None, product: str = None) -> SalesAggregates:
+        """
+        @Description Calcule les analyses d'un filtre jour/produit (sans mémorisation)
+        """
+        end = day + pd.Timedelta(days=1) if day is not None else None
+        return self.get_view(start_date=day, end_date=end, product=product, include_end=False)
+
+    @instrumented(rows_in=_processor_rows)
+    def filter_by_date(self, date: str) -> pd.DataFrame:
+        """
+        @Description Filtre les ventes pour une date spécifique à l'aide de l'index des dates
+
+        @Params {date} : str => Date au format YYYY-MM-DD
+        @Return: pd.DataFrame => Ventes de la journée
+        """
+        return take_rows(self.data, self.indexes.time.day_positions(date))
+
+    @instrumented(rows_in=_processor_rows)
+    def get_unique_products(self) -> List[str]:
+        """
+        @Description Récupère la liste des produits uniques, y compris ceux des ventes ajoutées
+
+        @Return: List[str] => Liste des noms de produits uniques
+        """
+        return self.indexes.products.keys()
+
+    @instrumented(rows_in=_processor_rows)
+    def filter_by_product(self, product: str) -> pd.DataFrame:
+        """
+        @Description Filtre les ventes d'un produit à l'aide de l'index des produits
+
+        @Params {product} : str => Nom du produit
+        @Return: pd.DataFrame => Ventes du produit
+        """
+        return take_rows(self.data, self.indexes.products.positions(product))
+
+    @instrumented(rows_in=_processor_rows)
+    def find_order(self, order_id: str) -> pd.DataFrame:
+        """
+        @Description Retrouve les lignes d'une commande via l'index des Order ID (saisie texte ou numérique)
+
+        @Params {order_id} : str => Identifiant de la commande
+        @Return: pd.DataFrame => Lignes de la commande (vide si introuvable)
+        """
+        return self.data.take(self.indexes.orders.positions(normalize_order_id(order_id)))
+
+    @instrumented(rows_in=_processor_rows)
     def modify_sales_entry(self, order_id: str, new_quantity = None, new_price = None, selected_index = None) -> bool:
         """
         @Description Modifie une entrée de vente existante
@@ -153,30 +456,71 @@ class DataProcessor:
         @Return: bool => True si la modification a réussi, False sinon
         """
         try:
+            key = normalize_order_id(order_id)
+            positions = self.indexes.orders.positions(key)
+            if len(positions) == 0:
+                return False
+
+            line = None
             if selected_index is not None:
                 # Vérifier que l'index existe et correspond au bon Order ID
-                if selected_index not in self.data.index or self.data.loc[selected_index, 'Order ID'] != order_id:
+                if selected_index not in self.data.index:
                     return False
-
-                if new_quantity:
-                    self.data.loc[selected_index, 'Quantity Ordered'] = int(new_quantity)
-                if new_price:
-                    self.data.loc[selected_index, 'Price Each'] = float(new_price)
-            else:
-                # Comportement original pour la rétrocompatibilité
-                mask = self.data['Order ID'] == order_id
-                if not mask.any():
+                position = self.data.index.get_loc(selected_index)
+                if position not in positions:
                     return False
+                line = int(np.searchsorted(positions, position))
+                positions = [position]
 
-                if new_quantity:
-                    self.data.loc[mask, 'Quantity Ordered'] = int(new_quantity)
-                if new_price:
-                    self.data.loc[mask, 'Price Each'] = float(new_price)
+            ## Journalisation avant application : la modification est conservée même sans sauvegarde explicite
+            if self.journal is not None:
+                self.journal.record_modify(key, line, new_quantity, new_price)
 
+            self._modify_positions(positions, new_quantity, new_price)
             return True
         except Exception:
             return False
 
+    def _modify_positions(self, positions, new_quantity, new_price) -> None:
+        """
+        @Description Applique une nouvelle quantité et/ou un nouveau prix aux lignes indiquées et met à jour agrégats et index
+
+        @Params {positions} : Any => Positions des lignes à modifier
+        @Params {new_quantity} : Any => Nouvelle quantité (ignorée si vide)
+        @Params {new_price} : Any => Nouveau prix (ignoré si vide)
+        """
+        self._apply_modifications([(positions, new_quantity, new_price)])
+
+    def _apply_modifications(self, changes: list) -> None:
+        """
+        @Description Applique une suite de modifications dans l'ordre avec une seule mise à jour du cube, des agrégats et des index | Une ligne modifiée plusieurs fois garde la dernière valeur.
+
+        @Params {changes} : list => Modifications (positions, nouvelle quantité, nouveau prix), valeurs vides ignorées
+        """
+        positions = np.unique(np.concatenate([np.asarray(change[0], dtype=np.int64) for change in changes]))
+        if len(positions) == 0:
+            return
+
+        ## Retirer l'ancienne contribution des lignes modifiées des agrégats
+        self._update_aggregates(positions, remove=True)
+        self._bump_version()
+
+        ## Nouvelles valeurs calculées sur une copie des lignes concernées, puis écrites en une affectation par colonne
+        data = self.data
+        for column, field, convert in (('Quantity Ordered', 1, int), ('Price Each', 2, float)):
+            values = data[column].to_numpy()[positions]
+            updated = False
+            for change in changes:
+                if change[field]:
+                    values[np.searchsorted(positions, change[0])] = convert(change[field])
+                    updated = True
+            if updated:
+                data.iloc[positions, data.columns.get_loc(column)] = values
+
+        self._update_aggregates(positions, remove=False)
+        self.indexes.mark_modified(positions)
+
+    @instrumented(rows_in=_processor_rows)
     def add_sales_entry(self, new_entry: pd.DataFrame) -> bool:
         """
         @Description Ajoute une nouvelle entrée de vente
@@ -184,30 +528,179 @@ class DataProcessor:
         @Params {new_entry} : pd.DataFrame => Nouvelle entrée à ajouter
         @Return: bool => True si l'ajout a réussi, False sinon
         """
+        return self.add_sales_entries(new_entry)
+
+    @instrumented(rows_in=_processor_rows)
+    def add_sales_entries(self, new_entries: pd.DataFrame) -> bool:
+        """
+        @Description Ajoute un lot de ventes en un seul appel (ex: import des ventes d'une journée) | Les lignes sont placées dans un tampon et fusionnées par lots, pas à chaque ajout.
+
+        @Params {new_entries} : pd.DataFrame => Ventes à ajouter (mêmes colonnes que les données)
+        @Return: bool => True si l'ajout a réussi, False sinon
+        """
         try:
-            self.data = pd.concat([self.data, new_entry], ignore_index=True)
+            if new_entries.empty:
+                return True
+            new_entries = new_entries.assign(**{"Order Date": pd.to_datetime(new_entries["Order Date"])})
+            if self.journal is not None:
+                self.journal.record_add(new_entries)
+            self._append_rows(new_entries)
             return True
         except Exception:
             return False
 
+    def _append_rows(self, new_entry: pd.DataFrame) -> None:
+        """
+        @Description Place des lignes dans le tampon d'ajout et met à jour le cube et les agrégats
+
+        @Params {new_entry} : pd.DataFrame => Lignes à ajouter
+        """
+        ## Les colonnes dérivées de l'adresse sont calculées pour les lignes qui ne les fournissent pas
+        if "City" in self._data.columns and "City" not in new_entry.columns and "Purchase Address" in new_entry.columns:
+            new_entry = new_entry.assign(**{column: values.to_numpy(dtype=object)
+                                            for column, values in split_addresses(new_entry["Purchase Address"]).items()})
+
+        for column in new_entry.columns:
+            self._pending.setdefault(column, [None] * self._pending_count).extend(new_entry[column].tolist())
+        self._pending_count += len(new_entry)
+        for values in self._pending.values():
+            values.extend([None] * (self._pending_count - len(values)))
+        self._bump_version()
+
+        ## Mise à jour du cube et des agrégats existants au lieu d'un recalcul complet
+        if self._cube is not None:
+            self._cube.add_frame(new_entry)
+        if self._aggregates is not None:
+            if len(new_entry) > 100:
+                self._aggregates.merge(SalesAggregates.from_frame(new_entry))
+            else:
+                addresses = new_entry['Purchase Address'] if 'Purchase Address' in new_entry.columns else [None] * len(new_entry)
+                for product, quantity, price, order_date, address in zip(new_entry['Product'], new_entry['Quantity Ordered'], new_entry['Price Each'], new_entry['Order Date'], addresses):
+                    self._aggregates.add_row(product, quantity, price, order_date, address)
+
+        if self._pending_count >= self.APPEND_BATCH_SIZE:
+            self._flush_pending()
+
+    def _flush_pending(self) -> None:
+        """
+        @Description Fusionne les lignes du tampon dans les données en une seule concaténation et met à jour les index
+        """
+        with instrumentation.stage("DataProcessor.flush_pending", self._pending_count) as stage:
+            new_rows = pd.DataFrame(self._pending)
+            self._pending = {}
+            self._pending_count = 0
+
+            data, new_rows = _align_new_rows(self._data, new_rows)
+            self._data = pd.concat([data, new_rows], ignore_index=True)
+            self._indexes.append(new_rows, self._data)
+            stage.rows_out = len(self._data)
+
+    def attach_journal(self, journal) -> None:
+        """
+        @Description Active l'enregistrement de chaque ajout et modification dans un journal (voir core.journal.EditJournal)
+
+        @Params {journal} : EditJournal => Journal dans lequel écrire les opérations
+        """
+        self.journal = journal
+
+    @instrumented(rows_in=_processor_rows)
+    def apply_journal(self, entries) -> None:
+        """
+        @Description Rejoue des opérations de journal (les ajouts consécutifs sont regroupés en une seule concaténation, les modifications appliquées en un seul lot)
+
+        @Params {entries} : Iterable[Dict[str, Any]] => Opérations lues par EditJournal.entries
+        """
+        pending = []
+        changes = []
+        for entry in entries:
+            if entry["op"] == "add":
+                pending.append(entry["row"])
+                continue
+            if pending:
+                self._append_journal_rows(pending)
+                pending = []
+            ## Les lignes visées sont résolues au moment de l'opération : les ajouts suivants
+            ## ne font qu'ajouter des lignes à la fin, les modifications peuvent donc être appliquées à la fin
+            positions = self.indexes.orders.positions(entry["order_id"])
+            if entry["line"] is not None:
+                if entry["line"] >= len(positions):
+                    continue
+                positions = [positions[entry["line"]]]
+            if len(positions):
+                changes.append((positions, entry["quantity"], entry["price"]))
+        if pending:
+            self._append_journal_rows(pending)
+        if changes:
+            self._apply_modifications(changes)
+
+    def _append_journal_rows(self, rows: list) -> None:
+        """
+        @Description Ajoute des lignes lues depuis le journal (dates converties depuis le format ISO)
+        """
+        new_rows = pd.DataFrame(rows)
+        new_rows["Order Date"] = pd.to_datetime(new_rows["Order Date"])
+        self._append_rows(new_rows)
+
+    def _update_aggregates(self, positions, remove: bool) -> None:
+        """
+        @Description Ajoute ou retire la contribution des lignes indiquées du cube et des agrégats (s'ils sont déjà calculés)
+
+        @Params {positions} : Any => Positions des lignes concernées
+        @Params {remove} : bool => True pour retirer les lignes, False pour les ajouter
+        """
+        rows = self.data.iloc[positions]
+        if self._cube is not None:
+            self._cube.add_frame(rows, sign=-1 if remove else 1)
+        if self._aggregates is None:
+            return
+        apply = self._aggregates.remove_row if remove else self._aggregates.add_row
+        addresses = rows['Purchase Address'] if 'Purchase Address' in rows.columns else [None] * len(rows)
+        for product, quantity, price, order_date, address in zip(rows['Product'], rows['Quantity Ordered'], rows['Price Each'], rows['Order Date'], addresses):
+            apply(product, quantity, price, order_date, address)
+
+    @instrumented(rows_in=_processor_rows)
     def save_data(self, original_filename: str) -> str:
         """
-        @Description Sauvegarde les données dans un fichier CSV avec le suffixe _updated | Si un fichier _updated existe déjà, il sera mis à jour.
+        @Description Sauvegarde les modifications | Avec un journal, les opérations sont déjà écrites au fil de l'eau : seul le journal est retourné. Sinon, écrit le fichier _updated complet.
 
         @Params {original_filename} : str => Nom du fichier original
-        @Return: str => Nom du fichier de sauvegarde créé/mis à jour
+        @Return: str => Nom du fichier contenant les modifications
         """
-        try:
-            # Extraire le nom de base du fichier sans extension
-            base_name = Path(original_filename).stem
-            if "_updated" not in base_name:
-                base_name = f"{base_name}_updated"
+        if self.journal is not None:
+            return str(self.journal.path)
+        return self.compact_data(original_filename)
 
-            # Construire le chemin complet du fichier
-            output_path = Path("data") / f"{base_name}.csv"
+    @instrumented(rows_in=_processor_rows)
+    def compact_data(self, original_filename: str) -> str:
+        """
+        @Description Écrit les données fusionnées dans un fichier CSV | Avec un journal, le fichier chargé est réécrit (cache et cube invalidés) puis le journal vidé : le prochain chargement du fichier retrouve toutes les modifications. Sans journal (ex: plusieurs fichiers chargés), écrit le fichier _updated, mis à jour s'il existe déjà.
 
-            # Sauvegarder les données
-            self.data.to_csv(output_path, index=False)
+        @Params {original_filename} : str => Nom du fichier original (celui dont le journal est attaché)
+        @Return: str => Nom du fichier écrit
+        """
+        try:
+            if self.journal is not None:
+                output_path = Path(original_filename)
+            else:
+                # Extraire le nom de base du fichier sans extension
+                base_name = Path(original_filename).stem
+                if "_updated" not in base_name:
+                    base_name = f"{base_name}_updated"
+
+                # Construire le chemin complet du fichier
+                output_path = Path("data") / f"{base_name}.csv"
+
+            # Sauvegarder les données (sans les colonnes dérivées de l'adresse, recalculées au chargement)
+            ## Écriture dans un fichier temporaire puis remplacement : une interruption ne tronque pas le fichier
+            temporary = output_path.with_name(f".{output_path.name}.tmp")
+            self.data.drop(columns=ADDRESS_COLUMNS, errors='ignore').to_csv(temporary, index=False, date_format=EXPORT_DATE_FORMAT)
+            temporary.replace(output_path)
+
+            ## Les opérations sont désormais dans le fichier de base : cache et cube de l'ancien contenu supprimés, journal vidé
+            if self.journal is not None:
+                for directory in (cache_dir_for(output_path), cube_dir_for(output_path)):
+                    shutil.rmtree(directory, ignore_errors=True)
+                self.journal.clear()
             return str(output_path)
 
         except Exception as e:
@@ -0,0 +1,377 @@
+from typing import Any, List, Union
+import numpy as np
+import pandas as pd
+
+## Positions de lignes : tranche contiguë (vue) ou tableau de positions triées
+Positions = Union[slice, np.ndarray]
+
+
+def normalize_order_ids(values: pd.Series) -> pd.Series:
+    """
+    @Description Normalise des Order ID en chaînes comparables, qu'ils soient lus comme nombres ou comme texte (176558, 176558.0, " 176558 ")
+
+    @Params {values} : pd.Series => Order ID bruts
+    @Return: pd.Series => Order ID sous forme de chaînes
+    """
+    if pd.api.types.is_numeric_dtype(values.dtype):
+        return values.astype("Int64").astype(str)
+    return values.astype(str).str.strip().str.replace(r"^(\d+)\.0+$", r"\1", regex=True)
+
+
+def normalize_order_id(value: Any) -> str:
+    """
+    @Description Normalise un Order ID saisi ou stocké (voir normalize_order_ids)
+
+    @Params {value} : Any => Order ID brut
+    @Return: str => Order ID sous forme de chaîne
+    """
+    return normalize_order_ids(pd.Series([value], dtype=object if isinstance(value, str) else None)).iloc[0]
+
+
+def take_rows(df: pd.DataFrame, positions: Positions) -> pd.DataFrame:
+    """
+    @Description Extrait des lignes par position : une tranche renvoie une vue, un tableau ne copie que les lignes trouvées
+
+    @Params {df} : pd.DataFrame => Données complètes
+    @Params {positions} : Positions => Positions retournées par un index
+    @Return: pd.DataFrame => Lignes correspondantes
+    """
+    if isinstance(positions, slice):
+        return df.iloc[positions]
+    return df.take(positions)
+
+
+class TimeIndex:
+    """
+    @Description Index trié des dates de commande pour des recherches par jour ou par période en O(log n)
+    """
+
+    def __init__(self, dates: pd.Series):
+        """
+        @Description Construit l'index à partir de la colonne Order Date
+
+        @Params {dates} : pd.Series => Dates de commande (datetime64)
+        """
+        self._values = dates.to_numpy()
+        self._pending = []
+        self._sort()
+
+    def _sort(self) -> None:
+        """
+        @Description Trie les dates ; si elles sont déjà dans l'ordre, aucune permutation n'est stockée
+        """
+        if len(self._values) < 2 or not (self._values[1:] < self._values[:-1]).any():
+            self._order = None
+            self._sorted = self._values
+        else:
+            self._order = np.argsort(self._values, kind='stable')
+            self._sorted = self._values[self._order]
+
+    def append(self, dates: pd.Series) -> None:
+        """
+        @Description Ajoute les dates de nouvelles lignes placées à la fin des données
+
+        @Params {dates} : pd.Series => Dates des lignes ajoutées
+        """
+        self._pending.append(pd.to_datetime(dates).to_numpy().astype(self._values.dtype))
+
+    def _flush(self) -> None:
+        """
+        @Description Intègre les dates ajoutées dans l'index avant une recherche
+        """
+        if not self._pending:
+            return
+        new_values = np.concatenate(self._pending)
+        self._pending = []
+        start = len(self._values)
+        self._values = np.concatenate([self._values, new_values])
+
+        if self._order is None and len(new_values) and not (np.diff(new_values) < np.timedelta64(0)).any() \
+                and (start == 0 or new_values[0] >= self._values[start - 1]):
+            ## Cas courant : les nouvelles ventes sont les plus récentes, l'ordre est conservé
+            self._sorted = self._values
+            return
+
+        ## Sinon fusion des nouvelles positions dans l'ordre existant (sans retrier l'ensemble)
+        order = np.arange(start) if self._order is None else self._order
+        new_order = np.argsort(new_values, kind='stable')
+        new_sorted = new_values[new_order]
+        insert_at = np.searchsorted(self._sorted, new_sorted, side='right')
+        self._order = np.insert(order, insert_at, new_order + start)
+        self._sorted = np.insert(self._sorted, insert_at, new_sorted)
+
+    def _key(self, value) -> np.datetime64:
+        """
+        @Description Convertit une date dans l'unité de l'index pour la recherche dichotomique
+        """
+        return np.datetime64(pd.Timestamp(value).to_datetime64()).astype(self._values.dtype)
+
+    def range_positions(self, start=None, end=None, include_end: bool = True) -> Positions:
+        """
+        @Description Retourne les positions des lignes dont la date est comprise dans l'intervalle
+
+        @Params {start} : Any => Date de début incluse (optionnel)
+        @Params {end} : Any => Date de fin (optionnel)
+        @Params {include_end} : bool => Inclure les lignes dont la date est égale à la date de fin
+        @Return: Positions => Tranche si les données sont triées par date, sinon positions triées
+        """
+        self._flush()
+        lo = 0 if start is None else int(np.searchsorted(self._sorted, self._key(start), side='left'))
+        hi = len(self._sorted) if end is None else int(np.searchsorted(self._sorted, self._key(end), side='right' if include_end else 'left'))
+        hi = max(lo, hi)
+        if self._order is None:
+            return slice(lo, hi)
+        return np.sort(self._order[lo:hi])
+
+    def day_positions(self, date) -> Positions:
+        """
+        @Description Retourne les positions des lignes d'une journée
+
+        @Params {date} : Any => Jour recherché (ex: YYYY-MM-DD)
+        @Return: Positions => Positions des lignes de ce jour
+        """
+        day = pd.Timestamp(date).normalize()
+        return self.range_positions(day, day + pd.Timedelta(days=1), include_end=False)
+
+
+class PositionIndex:
+    """
+    @Description Index inversé valeur -> positions des lignes (ex: produit), construit une fois puis complété à chaque ajout
+    """
+
+    def __init__(self, values: pd.Series):
+        """
+        @Description Construit l'index en une passe vectorisée (codes entiers + tri stable)
+
+        @Params {values} : pd.Series => Colonne à indexer
+        """
+        codes, uniques = pd.factorize(values)
+        valid = codes >= 0
+        self._keys = pd.Index(uniques)
+        ## Positions regroupées par code : celles du code c sont dans _order[_offsets[c]:_offsets[c + 1]]
+        self._order = np.flatnonzero(valid)[np.argsort(codes[valid], kind='stable')]
+        self._offsets = np.concatenate([[0], np.cumsum(np.bincount(codes[valid], minlength=len(uniques)))])
+        ## Positions des lignes ajoutées depuis la construction
+        self._appended = {}
+
+    def _base_positions(self, key: Any) -> np.ndarray:
+        """
+        @Description Positions d'une valeur dans les données initiales (tableau vide si absente)
+        """
+        try:
+            code = self._keys.get_loc(key)
+        except (KeyError, TypeError):
+            return self._order[:0]
+        return self._order[self._offsets[code]:self._offsets[code + 1]]
+
+    def positions(self, key: Any) -> np.ndarray:
+        """
+        @Description Retourne les positions (triées) des lignes ayant cette valeur
+
+        @Params {key} : Any => Valeur recherchée
+        @Return: np.ndarray => Positions des lignes correspondantes
+        """
+        base = self._base_positions(key)
+        appended = self._appended.get(key)
+        if appended:
+            return np.concatenate([base, np.asarray(appended, dtype=base.dtype)])
+        return base
+
+    def keys(self) -> List[Any]:
+        """
+        @Description Liste des valeurs distinctes, dans l'ordre de première apparition
+
+        @Return: List[Any] => Valeurs distinctes
+        """
+        return self._keys.tolist() + [key for key in self._appended if key not in self._keys]
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._appended or len(self._base_positions(key)) > 0
+
+    def append(self, values: pd.Series, start: int) -> None:
+        """
+        @Description Ajoute les valeurs de nouvelles lignes placées à partir de la position start
+
+        @Params {values} : pd.Series => Valeurs des lignes ajoutées
+        @Params {start} : int => Position de la première ligne ajoutée
+        """
+        for offset, key in enumerate(values):
+            if not pd.isna(key):
+                self._appended.setdefault(key, []).append(start + offset)
+
+
+def _cast_bound(bound, dtype):
+    """
+    @Description Convertit un seuil dans le type flottant de la colonne (ex: 11.95 en float32) pour des comparaisons exactes
+    """
+    if bound is None or not np.issubdtype(dtype, np.floating):
+        return bound
+    return dtype.type(bound)
+
+
+class ThresholdIndex:
+    """
+    @Description Index trié des quantités et des prix pour les recherches par seuils (bornes trouvées par dichotomie)
+    """
+
+    ## Proportion de lignes modifiées ou ajoutées au-delà de laquelle l'index est reconstruit
+    REBUILD_RATIO = 0.05
+
+    def __init__(self, quantity: np.ndarray, price: np.ndarray):
+        """
+        @Description Construit les tris des quantités et des prix
+
+        @Params {quantity} : np.ndarray => Quantités commandées
+        @Params {price} : np.ndarray => Prix unitaires
+        """
+        self._size = len(quantity)
+        self._columns = {}
+        for name, values in (("quantity", quantity), ("price", price)):
+            order = np.argsort(values, kind='stable')
+            self._columns[name] = (order, values[order])
+        ## Positions dont la valeur indexée n'est plus à jour (modifiées) ou absentes de l'index (ajoutées)
+        self._dirty = set()
+
+    def mark_dirty(self, positions) -> None:
+        """
+        @Description Signale des lignes modifiées ou ajoutées ; elles seront vérifiées directement lors des recherches
+
+        @Params {positions} : Any => Positions des lignes concernées
+        """
+        self._dirty.update(int(position) for position in positions)
+
+    def needs_rebuild(self) -> bool:
+        """
+        @Description Indique si trop de lignes sont hors index pour que les recherches restent efficaces
+        """
+        return len(self._dirty) > max(1000, self._size * self.REBUILD_RATIO)
+
+    def _range(self, name: str, low, high) -> tuple:
+        """
+        @Description Bornes [lo, hi) des valeurs comprises entre low et high dans le tri d'une colonne
+        """
+        order, sorted_values = self._columns[name]
+        lo = 0 if low is None else int(np.searchsorted(sorted_values, low, side='left'))
+        hi = len(sorted_values) if high is None else int(np.searchsorted(sorted_values, high, side='right'))
+        return lo, max(lo, hi)
+
+    def query(self, quantity: np.ndarray, price: np.ndarray, min_quantity=None, max_quantity=None, min_price=None, max_price=None) -> Positions:
+        """
+        @Description Retourne les positions des lignes respectant tous les seuils fournis
+
+        @Params {quantity} : np.ndarray => Quantités actuelles de toutes les lignes
+        @Params {price} : np.ndarray => Prix actuels de toutes les lignes
+        @Params {min_quantity} / {max_quantity} / {min_price} / {max_price} : Any => Seuils inclusifs (optionnels)
+        @Return: Positions => Positions triées des lignes correspondantes
+        """
+        values = {"quantity": quantity, "price": price}
+        bounds = {"quantity": (min_quantity, max_quantity), "price": (min_price, max_price)}
+        bounds = {name: tuple(_cast_bound(bound, values[name].dtype) for bound in pair)
+                  for name, pair in bounds.items() if pair != (None, None)}
+        if not bounds:
+            return slice(0, len(quantity))
+
+        ## La colonne la plus sélective fournit les candidats, l'autre est vérifiée sur ces candidats seulement
+        ranges = {name: self._range(name, *bound) for name, bound in bounds.items()}
+        best = min(ranges, key=lambda name: ranges[name][1] - ranges[name][0])
+        lo, hi = ranges[best]
+        candidates = self._columns[best][0][lo:hi]
+
+        dirty = np.fromiter(self._dirty, dtype=np.int64, count=len(self._dirty))
+        if len(dirty):
+            candidates = candidates[~np.isin(candidates, dirty)]
+            candidates = np.concatenate([candidates, dirty])
+
+        for name, (low, high) in bounds.items():
+            if name == best and not len(dirty):
+                continue
+            column = values[name][candidates]
+            keep = np.ones(len(candidates), dtype=bool)
+            if low is not None:
+                keep &= column >= low
+            if high is not None:
+                keep &= column <= high
+            candidates = candidates[keep]
+
+        return np.sort(candidates)
+
+
+class SalesIndexes:
+    """
+    @Description Regroupe les index construits sur un DataFrame de ventes (créés à la première utilisation)
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        """
+        @Description Associe les index à un DataFrame de ventes
+
+        @Params {data} : pd.DataFrame => Données indexées
+        """
+        self._data = data
+        self._time = None
+        self._products = None
+        self._orders = None
+        self._thresholds = None
+
+    @property
+    def time(self) -> TimeIndex:
+        """
+        @Description Index trié des dates de commande
+        """
+        if self._time is None:
+            self._time = TimeIndex(self._data["Order Date"])
+        return self._time
+
+    @property
+    def products(self) -> PositionIndex:
+        """
+        @Description Index inversé produit -> positions des lignes
+        """
+        if self._products is None:
+            self._products = PositionIndex(self._data["Product"])
+        return self._products
+
+    @property
+    def orders(self) -> PositionIndex:
+        """
+        @Description Index Order ID normalisé -> positions des lignes (une commande peut contenir plusieurs lignes)
+        """
+        if self._orders is None:
+            self._orders = PositionIndex(normalize_order_ids(self._data["Order ID"]))
+        return self._orders
+
+    @property
+    def thresholds(self) -> ThresholdIndex:
+        """
+        @Description Index trié des quantités et des prix, reconstruit lorsque trop de lignes ont changé
+        """
+        if self._thresholds is None or self._thresholds.needs_rebuild():
+            self._thresholds = ThresholdIndex(self._data["Quantity Ordered"].to_numpy(), self._data["Price Each"].to_numpy())
+        return self._thresholds
+
+    def mark_modified(self, positions) -> None:
+        """
+        @Description Met à jour les index après la modification de quantités ou de prix
+
+        @Params {positions} : Any => Positions des lignes modifiées
+        """
+        if self._thresholds is not None:
+            self._thresholds.mark_dirty(positions)
+
+    def append(self, new_rows: pd.DataFrame, data: pd.DataFrame) -> None:
+        """
+        @Description Met à jour les index après l'ajout de lignes à la fin des données
+
+        @Params {new_rows} : pd.DataFrame => Lignes ajoutées
+        @Params {data} : pd.DataFrame => Données complètes après l'ajout
+        """
+        start = len(self._data)
+        self._data = data
+        if self._time is not None:
+            self._time.append(new_rows["Order Date"])
+        if self._products is not None:
+            self._products.append(new_rows["Product"], start)
+        if self._orders is not None:
+            self._orders.append(normalize_order_ids(new_rows["Order ID"]), start)
+        if self._thresholds is not None:
+            self._thresholds.mark_dirty(range(start, len(data)))
@@ -0,0 +1,257 @@
+from typing import Any, Callable, Dict, List, Optional
+import fnmatch
+import functools
+import json
+import threading
+import time
+import tracemalloc
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+## Colonnes des mesures, dans l'ordre de la trace JSON lines
+RECORD_FIELDS = ["name", "parent", "depth", "started_at", "seconds", "rows_in", "rows_out", "peak_memory_bytes", "error"]
+
+
+def count_rows(value: Any) -> Optional[int]:
+    """
+    @Description Retourne le nombre de lignes d'un résultat (DataFrame, positions, agrégats), None s'il n'est pas tabulaire
+
+    @Params {value} : Any => Résultat d'une étape
+    @Return: Optional[int] => Nombre de lignes
+    """
+    if isinstance(value, (pd.DataFrame, pd.Series, np.ndarray, list)):
+        return len(value)
+    if isinstance(value, slice):
+        return max(0, value.stop - value.start)
+    rows = getattr(value, "rows", None)
+    return rows if isinstance(rows, int) else None
+
+
+class _NullStage:
+    """
+    @Description Étape sans mesure, utilisée lorsque l'instrumentation est désactivée
+    """
+    rows_out = None
+
+    def __enter__(self) -> "_NullStage":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> bool:
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class Stage:
+    """
+    @Description Mesure d'une étape : durée, lignes en entrée et en sortie, pic de mémoire allouée pendant l'étape (étapes imbriquées comprises)
+    """
+
+    def __init__(self, owner: "Instrumentation", name: str, rows_in: Optional[int] = None):
+        self._owner = owner
+        self.name = name
+        self.rows_in = rows_in
+        ## Renseigné par le code mesuré avant la fin de l'étape
+        self.rows_out = None
+
+    def __enter__(self) -> "Stage":
+        stack = self._owner._stack()
+        self.parent = stack[-1].name if stack else None
+        self.depth = len(stack)
+        if self._owner.memory:
+            current, peak = tracemalloc.get_traced_memory()
+            ## Le pic est remis à zéro pour l'étape : celui du parent jusqu'ici est conservé
+            if stack:
+                stack[-1]._peak = max(stack[-1]._peak, peak)
+            tracemalloc.reset_peak()
+            self._start_memory = self._peak = current
+        stack.append(self)
+        self._started_at = time.time()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> bool:
+        seconds = time.perf_counter() - self._start
+        stack = self._owner._stack()
+        stack.pop()
+        peak_bytes = None
+        if self._owner.memory:
+            peak = max(self._peak, tracemalloc.get_traced_memory()[1])
+            if stack:
+                stack[-1]._peak = max(stack[-1]._peak, peak)
+            peak_bytes = peak - self._start_memory
+        self._owner._record({
+            "name": self.name,
+            "parent": self.parent,
+            "depth": self.depth,
+            "started_at": self._started_at,
+            "seconds": seconds,
+            "rows_in": self.rows_in,
+            "rows_out": self.rows_out,
+            "peak_memory_bytes": peak_bytes,
+            "error": exc_type.__name__ if exc_type is not None else None,
+        })
+        return False
+
+
+class Instrumentation:
+    """
+    @Description Instrumentation à la demande du chargement et des analyses : une mesure par étape et par appel | Désactivée, chaque étape ne coûte qu'un test.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.memory = False
+        self.trace_path = None
+        self.records: List[Dict[str, Any]] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._owns_tracemalloc = False
+
+    def enable(self, trace_path: str = None, memory: bool = True) -> None:
+        """
+        @Description Active les mesures
+
+        @Params {trace_path} : str => Fichier JSON lines où chaque mesure est ajoutée dès la fin de son étape (optionnel)
+        @Params {memory} : bool => Mesurer le pic de mémoire avec tracemalloc (ralentit les étapes qui allouent beaucoup)
+        """
+        self.trace_path = Path(trace_path) if trace_path else None
+        self.memory = memory
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracemalloc = True
+        self.enabled = True
+
+    def disable(self) -> None:
+        """
+        @Description Désactive les mesures (les mesures déjà enregistrées sont conservées)
+        """
+        self.enabled = False
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+            self._owns_tracemalloc = False
+        self.memory = False
+
+    def reset(self) -> None:
+        """
+        @Description Oublie les mesures enregistrées
+        """
+        with self._lock:
+            self.records = []
+
+    def stage(self, name: str, rows_in: Optional[int] = None):
+        """
+        @Description Ouvre une étape mesurée, à utiliser avec with (renseigner rows_out sur l'objet retourné)
+
+        @Params {name} : str => Nom de l'étape (ex: clean.parse_dates)
+        @Params {rows_in} : int => Nombre de lignes en entrée (optionnel)
+        @Return: Stage => Étape mesurée, ou étape vide si l'instrumentation est désactivée
+        """
+        if not self.enabled:
+            return _NULL_STAGE
+        return Stage(self, name, rows_in)
+
+    def _stack(self) -> List[Stage]:
+        """
+        @Description Étapes ouvertes dans le thread courant (ex: chargement en arrière-plan de l'interface graphique)
+        """
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _record(self, record: Dict[str, Any]) -> None:
+        """
+        @Description Enregistre une mesure et l'ajoute à la trace
+        """
+        with self._lock:
+            self.records.append(record)
+            if self.trace_path is not None:
+                with open(self.trace_path, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def query(self, name: str = None, parent: str = None) -> pd.DataFrame:
+        """
+        @Description Retourne les mesures, filtrées par nom d'étape et/ou d'étape parente
+
+        @Params {name} : str => Motif du nom d'étape (ex: "DataProcessor.*", "clean.*")
+        @Params {parent} : str => Motif du nom de l'étape parente (optionnel)
+        @Return: pd.DataFrame => Une ligne par mesure, dans l'ordre de fin des étapes
+        """
+        with self._lock:
+            records = list(self.records)
+        if name is not None:
+            records = [record for record in records if fnmatch.fnmatchcase(record["name"], name)]
+        if parent is not None:
+            records = [record for record in records if record["parent"] and fnmatch.fnmatchcase(record["parent"], parent)]
+        return pd.DataFrame(records, columns=RECORD_FIELDS)
+
+    def summary(self, name: str = None) -> pd.DataFrame:
+        """
+        @Description Regroupe les mesures par étape : appels, durées, lignes (maximum sur les appels) et pic de mémoire
+
+        @Params {name} : str => Motif du nom d'étape (optionnel)
+        @Return: pd.DataFrame => Une ligne par étape, de la plus coûteuse à la moins coûteuse
+        """
+        records = self.query(name)
+        summary = records.groupby("name", sort=False).agg(
+            calls=("seconds", "size"),
+            total_seconds=("seconds", "sum"),
+            mean_seconds=("seconds", "mean"),
+            max_seconds=("seconds", "max"),
+            rows_in=("rows_in", "max"),
+            rows_out=("rows_out", "max"),
+            peak_memory_bytes=("peak_memory_bytes", "max"),
+            errors=("error", "count"),
+        )
+        return summary.sort_values("total_seconds", ascending=False)
+
+    def format_summary(self) -> str:
+        """
+        @Description Met en forme le résumé des mesures pour l'affichage (durées en ms, mémoire en Mo)
+
+        @Return: str => Tableau lisible
+        """
+        summary = self.summary()
+        if summary.empty:
+            return "Aucune mesure enregistrée."
+        table = pd.DataFrame({
+            "appels": summary["calls"],
+            "total (ms)": (summary["total_seconds"] * 1000).round(1),
+            "moyenne (ms)": (summary["mean_seconds"] * 1000).round(1),
+            "max (ms)": (summary["max_seconds"] * 1000).round(1),
+            "lignes entrée": summary["rows_in"].astype("Int64"),
+            "lignes sortie": summary["rows_out"].astype("Int64"),
+            "pic mémoire (Mo)": (summary["peak_memory_bytes"] / 1e6).round(1),
+        })
+        return table.to_string()
+
+
+## Instance partagée par DataLoader, DataProcessor et les interfaces
+instrumentation = Instrumentation()
+
+
+def instrumented(function: Callable = None, *, rows_in: Callable[[Any], Optional[int]] = None) -> Callable:
+    """
+    @Description Décorateur qui mesure chaque appel d'une méthode (nom de l'étape : Classe.méthode) lorsque l'instrumentation est active
+
+    @Params {function} : Callable => Méthode décorée (utilisation sans parenthèses : @instrumented)
+    @Params {rows_in} : Callable => Fonction qui retourne le nombre de lignes en entrée à partir de l'instance (optionnel)
+    @Return: Callable => Méthode mesurée
+    """
+    def decorate(function: Callable) -> Callable:
+        name = function.__qualname__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not instrumentation.enabled:
+                return function(*args, **kwargs)
+            with instrumentation.stage(name, rows_in(args[0]) if rows_in is not None else None) as stage:
+                result = function(*args, **kwargs)
+                stage.rows_out = count_rows(result)
+                return result
+        return wrapper
+
+    return decorate(function) if function is not None else decorate
@@ -0,0 +1,115 @@
+from typing import Any, Dict, Iterator
+import json
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from core.data_processor import DataProcessor
+
+
+def _to_json_value(value: Any) -> Any:
+    """
+    @Description Convertit une valeur de cellule (NumPy, Timestamp, NaN) en valeur JSON
+    """
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    if isinstance(value, (pd.Timestamp, np.datetime64)):
+        return pd.Timestamp(value).isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+class EditJournal:
+    """
+    @Description Journal des modifications en ajout seul (une ligne JSON par opération) | Chaque ajout ou modification coûte une écriture proportionnelle à sa taille, pas à celle des données.
+    """
+
+    def __init__(self, path: str):
+        """
+        @Description Associe le journal à un fichier JSON lines
+
+        @Params {path} : str => Chemin du fichier journal
+        """
+        self.path = Path(path)
+
+    @classmethod
+    def for_csv(cls, file_path: str) -> "EditJournal":
+        """
+        @Description Retourne le journal associé à un fichier CSV (stocké à côté : <nom>.journal.jsonl)
+
+        @Params {file_path} : str => Chemin du fichier CSV de base
+        @Return: EditJournal => Journal du fichier
+        """
+        path = Path(file_path)
+        return cls(path.with_name(f"{path.stem}.journal.jsonl"))
+
+    def exists(self) -> bool:
+        """
+        @Description Indique si le journal contient des opérations
+        """
+        return self.path.exists() and self.path.stat().st_size > 0
+
+    def _write(self, entries: list) -> None:
+        """
+        @Description Ajoute des opérations à la fin du journal
+        """
+        with open(self.path, 'a', encoding='utf-8') as f:
+            for entry in entries:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def record_add(self, rows: pd.DataFrame) -> None:
+        """
+        @Description Enregistre l'ajout de nouvelles lignes
+
+        @Params {rows} : pd.DataFrame => Lignes ajoutées
+        """
+        records = rows.to_dict(orient='records')
+        self._write([
+            {"op": "add", "row": {column: _to_json_value(value) for column, value in record.items()}}
+            for record in records
+        ])
+
+    def record_modify(self, order_id: str, line: int, new_quantity: Any, new_price: Any) -> None:
+        """
+        @Description Enregistre la modification d'une commande
+
+        @Params {order_id} : str => Order ID normalisé
+        @Params {line} : int => Rang de la ligne dans la commande (None pour toutes les lignes)
+        @Params {new_quantity} : Any => Nouvelle quantité (ou None)
+        @Params {new_price} : Any => Nouveau prix (ou None)
+        """
+        self._write([{
+            "op": "modify", "order_id": order_id, "line": line,
+            "quantity": _to_json_value(new_quantity), "price": _to_json_value(new_price),
+        }])
+
+    def entries(self) -> Iterator[Dict[str, Any]]:
+        """
+        @Description Parcourt les opérations enregistrées dans l'ordre
+
+        @Return: Iterator[Dict[str, Any]] => Opérations du journal
+        """
+        if not self.path.exists():
+            return
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def replay(self, df: pd.DataFrame, cube=None) -> pd.DataFrame:
+        """
+        @Description Rejoue les opérations du journal sur les données du fichier de base
+
+        @Params {df} : pd.DataFrame => Données du fichier de base
+        @Params {cube} : SalesCube => Cube des données de base, mis à jour avec les opérations (optionnel)
+        @Return: pd.DataFrame => Données avec les modifications appliquées
+        """
+        processor = DataProcessor(df, cube=cube)
+        processor.apply_journal(self.entries())
+        return processor.data
+
+    def clear(self) -> None:
+        """
+        @Description Vide le journal (après compaction dans un CSV fusionné)
+        """
+        self.path.unlink(missing_ok=True)
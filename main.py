@@ -1,18 +1,52 @@
 import argparse
-from cli.console import CLI
-from cli.interface import GUI
+import sys
+from cli.report import add_report_parser
 
-def main():
-    parser = argparse.ArgumentParser(description="Choisir le mode de l'application")
+## Les modes sont importés à la demande : la console n'importe ni tkinter ni matplotlib,
+## et --help ou un appel sans mode n'importe pas pandas
+
+def profiling_options(suppress: bool = False) -> argparse.ArgumentParser:
+    """
+    @Description Options de mesure, acceptées avant le mode comme après la sous-commande report
+
+    @Params {suppress} : bool => Sans valeur par défaut (sous-commande) : une option absente ne remplace pas celle donnée avant la sous-commande
+    @Return: argparse.ArgumentParser => Parseur parent contenant --profile et --trace
+    """
+    parser = argparse.ArgumentParser(add_help=False)
+    default = {"default": argparse.SUPPRESS} if suppress else {}
+    parser.add_argument("--profile", action="store_true", help="Mesurer chaque étape du chargement et des analyses (durée, lignes, pic de mémoire)", **default)
+    parser.add_argument("--trace", metavar="FICHIER", help="Écrire chaque mesure dans un fichier JSON lines (active --profile)", **default)
+    return parser
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Choisir le mode de l'application", parents=[profiling_options()])
     parser.add_argument("--cli", action="store_true", help="Lancer l'interface en mode console")
     parser.add_argument("--gui", action="store_true", help="Lancer l'interface graphique")
+    subparsers = parser.add_subparsers(dest="command")
+    add_report_parser(subparsers, parents=[profiling_options(suppress=True)])
+    return parser
+
+
+def main():
+    args = build_parser().parse_args()
 
-    args = parser.parse_args()
+    if args.profile or args.trace:
+        from core.instrumentation import instrumentation
+        instrumentation.enable(trace_path=args.trace)
 
-    if args.cli:
+    if args.command == "report":
+        from cli.report import run_report
+        code = run_report(args)
+        if args.profile:
+            print(f"\n=== Profil d'exécution ===\n{instrumentation.format_summary()}", file=sys.stderr)
+        raise SystemExit(code)
+    elif args.cli:
+        from cli.console import CLI
         cli = CLI()
         cli.run()
     elif args.gui:
+        from cli.interface import GUI
         gui = GUI()
         gui.run()
     else:
@@ -21,6 +55,8 @@ def main():
             "Utilisation :\n"
             "  python main.py --cli   # Pour lancer l'application en mode console\n"
             "  python main.py --gui   # Pour lancer l'application en mode graphique\n"
+            "  python main.py report --files data/*.csv --summary --format json   # Rapports sans interface\n"
+            "  python main.py --profile --cli   # Mesurer chaque étape (menu [P] pour afficher les mesures)\n"
         )
 
 
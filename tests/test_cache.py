@@ -0,0 +1,46 @@
+import os
+import pandas as pd
+from core.cache import cache_dir_for, load_cached_csv, save_csv_cache
+from core.data_loader import DataLoader
+
+ROWS = """Order ID,Product,Quantity Ordered,Price Each,Order Date,Purchase Address
+176558,USB-C Charging Cable,2,11.95,04/19/19 08:46,"917 1st St, Dallas, TX 75001"
+176559,Bose SoundSport Headphones,1,99.99,04/07/19 22:30,"682 Chestnut St, Boston, MA 02215"
+"""
+
+
+def _cached_file(tmp_path):
+    """
+    @Description Écrit un fichier de ventes et son cache, et retourne le chemin et les données validées
+    """
+    path = tmp_path / "Sales_April_2019.csv"
+    path.write_text(ROWS)
+    df = DataLoader().load_csv(str(path), use_cache=False)
+    assert save_csv_cache(str(path), df)
+    return path, df
+
+
+def test_cache_round_trip(tmp_path):
+    path, df = _cached_file(tmp_path)
+
+    cached = load_cached_csv(str(path))
+    pd.testing.assert_frame_equal(cached, df)
+    assert cache_dir_for(str(path)).is_dir()
+
+
+def test_cache_invalidated_when_content_changes(tmp_path):
+    path, _ = _cached_file(tmp_path)
+
+    path.write_text(ROWS.replace("11.95", "12.95"))
+    assert load_cached_csv(str(path)) is None
+    ## Le chargement relit le CSV puis remplace le cache
+    assert DataLoader().load_csv(str(path))["Price Each"].tolist() == [12.95, 99.99]
+    assert load_cached_csv(str(path))["Price Each"].tolist() == [12.95, 99.99]
+
+
+def test_cache_kept_when_file_only_touched(tmp_path):
+    path, df = _cached_file(tmp_path)
+
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+    pd.testing.assert_frame_equal(load_cached_csv(str(path)), df)
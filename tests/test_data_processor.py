@@ -0,0 +1,92 @@
+import pandas as pd
+import pytest
+from core.data_processor import DataProcessor
+
+
+def _processor() -> DataProcessor:
+    """
+    @Description Construit un processeur sur quelques ventes, agrégats et cube déjà calculés
+    """
+    data = pd.DataFrame({
+        "Order ID": ["176558", "176559", "176560"],
+        "Product": ["USB-C Charging Cable", "Bose SoundSport Headphones", "Google Phone"],
+        "Quantity Ordered": [2, 1, 1],
+        "Price Each": [11.95, 99.99, 600.0],
+        "Order Date": pd.to_datetime(["2019-04-19 08:46", "2019-04-07 22:30", "2019-04-12 14:38"]),
+        "Purchase Address": ["917 1st St, Dallas, TX 75001", "682 Chestnut St, Boston, MA 02215", "669 Spruce St, Los Angeles, CA 90001"],
+    })
+    processor = DataProcessor(data)
+    processor.aggregates
+    processor.cube
+    return processor
+
+
+def _new_entry() -> pd.DataFrame:
+    return pd.DataFrame({
+        "Order ID": ["X1"],
+        "Product": ["New Gadget"],
+        "Quantity Ordered": [3],
+        "Price Each": [20.0],
+        "Order Date": ["2019-04-12 15:05"],
+        "Purchase Address": ["12 Main St, Seattle, WA 98101"],
+    })
+
+
+def test_modify_after_add():
+    processor = _processor()
+    ## Index des commandes construit avant l'ajout : il doit voir la ligne en attente
+    processor.find_order("176558")
+    assert processor.add_sales_entry(_new_entry())
+
+    assert processor.modify_sales_entry("X1", new_quantity=5)
+    assert processor.find_order("X1")["Quantity Ordered"].tolist() == [5]
+    assert processor.aggregates.total_revenue == pytest.approx(DataProcessor(processor.data.copy()).aggregates.total_revenue)
+
+
+def test_indexes_see_added_rows():
+    processor = _processor()
+    assert len(processor.get_filter_positions(product="New Gadget")) == 0
+    processor.get_unique_products()
+    assert processor.add_sales_entry(_new_entry())
+
+    assert "New Gadget" in processor.get_unique_products()
+    assert len(processor.filter_by_product("New Gadget")) == 1
+    assert len(processor.get_filter_positions(product="New Gadget")) == 1
+    assert len(processor.get_filter_positions(date="2019-04-12", product="New Gadget")) == 1
+
+
+def test_range_revenue_after_add():
+    processor = _processor()
+    processor.calculate_total_revenue("2019-04-12 14:30", "2019-04-12 15:10")
+    assert processor.add_sales_entry(_new_entry())
+
+    ## Le chiffre d'affaires d'une période se calcule sans fusionner les lignes en attente dans les données
+    assert processor.calculate_total_revenue("2019-04-12 14:30", "2019-04-12 15:10") == pytest.approx(660.0)
+    assert processor.calculate_total_revenue("2019-04-12", "2019-04-13") == pytest.approx(660.0)
+    assert processor._pending_count == 1
+    assert processor.get_view("2019-04-12", "2019-04-13").total_revenue == pytest.approx(660.0)
+
+
+def test_filtered_view_without_sales():
+    processor = _processor()
+
+    view = processor.get_filtered_view(date="2019-04-13")
+    assert view.get_sales_summary().empty
+    assert view.get_best_selling_product() is None
+    assert processor.get_filtered_view(date="2019-04-12", product="Wired Headphones").get_best_selling_product() is None
+    assert processor.get_best_selling_product()["product"] == "USB-C Charging Cable"
+
+
+def test_memoized_results_are_copies():
+    processor = _processor()
+
+    positions = processor.get_filter_positions(date="2019-04-12", product="Google Phone")
+    positions[:] = 0
+    assert processor.get_filter_positions(date="2019-04-12", product="Google Phone").tolist() == [2]
+
+    view = processor.get_filtered_view(date="2019-04-12")
+    view.products["Google Phone"][0] = 99
+    view.total_revenue = 0.0
+    view = processor.get_filtered_view(date="2019-04-12")
+    assert view.products["Google Phone"][0] == 1
+    assert view.total_revenue == pytest.approx(600.0)
@@ -0,0 +1,134 @@
+import pandas as pd
+import pytest
+from core.data_loader import DataLoader
+from core.data_processor import DataProcessor
+from core.journal import EditJournal
+
+COLUMNS = ["Order ID", "Product", "Quantity Ordered", "Price Each", "Order Date", "Purchase Address"]
+
+APRIL = [
+    ["176558", "USB-C Charging Cable", "2", "11.95", "04/19/19 08:46", "917 1st St, Dallas, TX 75001"],
+    ["176559", "Bose SoundSport Headphones", "1", "99.99", "04/07/19 22:30", "682 Chestnut St, Boston, MA 02215"],
+    ["176560", "Google Phone", "1", "600", "04/12/19 14:38", "669 Spruce St, Los Angeles, CA 90001"],
+]
+MAY = [
+    ["194095", "Wired Headphones", "1", "11.99", "05/16/19 17:14", "669 2nd St, New York City, NY 10001"],
+    ["194096", "AA Batteries (4-pack)", "1", "3.84", "05/19/19 14:43", "844 Walnut St, Dallas, TX 75001"],
+]
+
+
+def _write_sales(path, rows) -> str:
+    """
+    @Description Écrit un fichier de ventes au format des exports
+    """
+    pd.DataFrame(rows, columns=COLUMNS).to_csv(path, index=False)
+    return str(path)
+
+
+def _new_entry() -> pd.DataFrame:
+    return pd.DataFrame({
+        "Order ID": ["X1"],
+        "Product": ["New Gadget"],
+        "Quantity Ordered": [3],
+        "Price Each": [20.0],
+        "Order Date": ["2019-04-12 15:05"],
+        "Purchase Address": ["12 Main St, Seattle, WA 98101"],
+    })
+
+
+def _edit_with_journal(file: str) -> float:
+    """
+    @Description Charge un fichier, modifie une commande et ajoute une vente (journalisées), et retourne le chiffre d'affaires obtenu
+    """
+    loader = DataLoader()
+    processor = DataProcessor(loader.load_csv(file, use_cache=False), cube=loader.cube)
+    processor.attach_journal(EditJournal.for_csv(file))
+    assert processor.modify_sales_entry("176558", new_quantity=5)
+    assert processor.add_sales_entry(_new_entry())
+    return processor.calculate_total_revenue()
+
+
+def test_journal_records_operations(tmp_path):
+    april = _write_sales(tmp_path / "Sales_April_2019.csv", APRIL)
+    _edit_with_journal(april)
+
+    modify, add = list(EditJournal.for_csv(april).entries())
+    assert modify == {"op": "modify", "order_id": "176558", "line": None, "quantity": 5, "price": None}
+    assert add["op"] == "add"
+    assert add["row"]["Order ID"] == "X1"
+    assert add["row"]["Order Date"] == "2019-04-12T15:05:00"
+
+
+def test_load_csv_replays_journal(tmp_path):
+    april = _write_sales(tmp_path / "Sales_April_2019.csv", APRIL)
+    ## Cache et cube écrits avant les modifications : le journal est rejoué par-dessus
+    DataLoader().load_csv(april)
+    revenue = _edit_with_journal(april)
+
+    loader = DataLoader()
+    processor = DataProcessor(loader.load_csv(april), cube=loader.cube)
+    assert len(processor.data) == len(APRIL) + 1
+    assert processor.calculate_total_revenue() == pytest.approx(revenue)
+    assert processor.calculate_total_revenue("2019-04-12 14:00", "2019-04-12 15:30") == pytest.approx(660.0)
+    assert processor.find_order("176558")["Quantity Ordered"].tolist() == [5]
+
+    df = DataLoader().load_csv(april, replay_journal=False)
+    assert len(df) == len(APRIL)
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_load_files_replays_each_journal(tmp_path, max_workers):
+    april = _write_sales(tmp_path / "Sales_April_2019.csv", APRIL)
+    may = _write_sales(tmp_path / "Sales_May_2019.csv", MAY)
+    april_revenue = _edit_with_journal(april)
+
+    df = DataLoader().load_files([april, may], max_workers=max_workers, use_cache=False)
+
+    assert len(df) == len(APRIL) + 1 + len(MAY)
+    assert DataProcessor(df).calculate_total_revenue() == pytest.approx(april_revenue + 11.99 + 3.84)
+    assert DataProcessor(df).find_order("176558")["Quantity Ordered"].tolist() == [5]
+    assert "New Gadget" in df["Product"].cat.categories
+    assert "Seattle" in df["City"].cat.categories
+
+
+def test_load_directory_replays_journal(tmp_path):
+    april = _write_sales(tmp_path / "Sales_April_2019.csv", APRIL)
+    _write_sales(tmp_path / "Sales_May_2019.csv", MAY)
+    april_revenue = _edit_with_journal(april)
+
+    df = DataLoader().load_directory(str(tmp_path), max_workers=1, use_cache=False)
+    assert DataProcessor(df).calculate_total_revenue() == pytest.approx(april_revenue + 11.99 + 3.84)
+
+    ## Sans rejeu, seules les ventes des fichiers de base sont chargées
+    df = DataLoader().load_directory(str(tmp_path), max_workers=1, use_cache=False, replay_journal=False)
+    assert len(df) == len(APRIL) + len(MAY)
+
+
+def test_compact_data_rewrites_loaded_file(tmp_path):
+    april = _write_sales(tmp_path / "Sales_April_2019.csv", APRIL)
+    ## Cache et cube du contenu d'origine
+    DataLoader().load_csv(april)
+    loader = DataLoader()
+    processor = DataProcessor(loader.load_csv(april), cube=loader.cube)
+    journal = EditJournal.for_csv(april)
+    processor.attach_journal(journal)
+    assert processor.modify_sales_entry("176558", new_quantity=5)
+    assert processor.add_sales_entry(_new_entry())
+    revenue = processor.calculate_total_revenue()
+
+    assert processor.compact_data(april) == april
+    assert not journal.exists()
+    assert not list(tmp_path.glob("*_updated.csv"))
+
+    ## Rechargement (cache compris) : les modifications compactées sont dans le fichier de base
+    loader = DataLoader()
+    reloaded = DataProcessor(loader.load_csv(april), cube=loader.cube)
+    assert len(reloaded.data) == len(APRIL) + 1
+    assert reloaded.calculate_total_revenue() == pytest.approx(revenue)
+    assert reloaded.find_order("176558")["Quantity Ordered"].tolist() == [5]
+
+    ## Les nouvelles opérations journalisées s'appliquent par-dessus les données compactées
+    reloaded.attach_journal(journal)
+    assert reloaded.modify_sales_entry("176559", new_price=89.99)
+    df = DataLoader().load_files([april], max_workers=1)
+    assert DataProcessor(df).calculate_total_revenue() == pytest.approx(revenue - 10.0)
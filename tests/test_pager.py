@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+from cli.pager import Pager
+
+
+def _data(rows: int = 45) -> pd.DataFrame:
+    return pd.DataFrame({"Order ID": [str(100000 + i) for i in range(rows)], "Quantity Ordered": np.arange(rows)})
+
+
+def test_pages_of_all_rows():
+    pager = Pager(_data(), page_size=20)
+
+    assert (pager.total, pager.page_count) == (45, 3)
+    assert pager.page_rows(0)["Quantity Ordered"].tolist() == list(range(20))
+    assert pager.page_rows(2)["Quantity Ordered"].tolist() == list(range(40, 45))
+    assert pager.format_page(2).startswith("Lignes 41-45 sur 45 (page 3/3)")
+
+
+def test_pages_of_positions():
+    pager = Pager(_data(), positions=np.array([3, 7, 30, 44]), page_size=3)
+
+    assert (pager.total, pager.page_count) == (4, 2)
+    assert pager.page_rows(1)["Quantity Ordered"].tolist() == [44]
+    assert Pager(_data(), positions=slice(10, 15)).page_rows(0)["Quantity Ordered"].tolist() == list(range(10, 15))
+
+
+def test_go_to_stays_within_pages():
+    pager = Pager(_data(), page_size=20)
+
+    pager.go_to(10)
+    assert pager.page == 2
+    pager.go_to(-1)
+    assert pager.page == 0
+
+
+def test_run_follows_commands(capsys):
+    commands = iter(["3", "p", "x", "q"])
+    Pager(_data(), page_size=20).run("Ventes", read=lambda prompt: next(commands))
+
+    output = capsys.readouterr().out
+    assert "=== Ventes : 45 lignes ===" in output
+    assert [line.split(" (")[0] for line in output.splitlines() if line.startswith("Lignes")] == [
+        "Lignes 1-20 sur 45", "Lignes 41-45 sur 45", "Lignes 21-40 sur 45", "Lignes 21-40 sur 45",
+    ]
+    assert "Commande invalide!" in output
+
+
+def test_run_single_page_does_not_wait():
+    Pager(_data(5)).run("Ventes", read=lambda prompt: (_ for _ in ()).throw(AssertionError("aucune saisie attendue")))
@@ -0,0 +1,57 @@
+import json
+import pytest
+from cli.report import expand_files, parse_period, run_report
+from main import build_parser
+
+ROWS = """Order ID,Product,Quantity Ordered,Price Each,Order Date,Purchase Address
+176558,USB-C Charging Cable,2,11.95,04/19/19 08:46,"917 1st St, Dallas, TX 75001"
+176559,Bose SoundSport Headphones,1,99.99,04/07/19 22:30,"682 Chestnut St, Boston, MA 02215"
+176560,Google Phone,1,600,05/12/19 14:38,"669 Spruce St, Los Angeles, CA 90001"
+"""
+
+
+def test_expand_files_skips_updated_copies(tmp_path):
+    for name in ("Sales_April_2019.csv", "Sales_April_2019_updated.csv", "Sales_May_2019.csv"):
+        (tmp_path / name).write_text("")
+
+    files = expand_files([str(tmp_path / "Sales_*.csv")])
+    assert files == [str(tmp_path / "Sales_April_2019.csv"), str(tmp_path / "Sales_May_2019.csv")]
+
+
+def test_expand_files_keeps_explicit_files_once(tmp_path):
+    for name in ("Sales_April_2019.csv", "Sales_April_2019_updated.csv"):
+        (tmp_path / name).write_text("")
+    updated = str(tmp_path / "Sales_April_2019_updated.csv")
+
+    files = expand_files([updated, str(tmp_path / "Sales_*.csv"), updated])
+    assert files == [updated, str(tmp_path / "Sales_April_2019.csv")]
+
+
+def test_parse_period():
+    assert parse_period("2019-04-01:2019-04-30") == ("2019-04-01", "2019-04-30")
+    assert parse_period(":2019-04-30") == (None, "2019-04-30")
+    with pytest.raises(ValueError):
+        parse_period("2019-04-01")
+
+
+def test_report_json(tmp_path, capsys):
+    (tmp_path / "Sales_April_2019.csv").write_text(ROWS)
+    output = tmp_path / "rapport.json"
+    args = build_parser().parse_args([
+        "report", "--files", str(tmp_path / "Sales_*.csv"), "--best", "--revenue", "2019-04-01:2019-04-30",
+        "--format", "json", "--output", str(output),
+    ])
+
+    assert run_report(args) == 0
+    report = json.loads(output.read_text(encoding="utf-8"))
+    assert report["best_selling_product"]["product"] == "USB-C Charging Cable"
+    assert report["revenue"] == [{"start": "2019-04-01", "end": "2019-04-30", "revenue": pytest.approx(123.89)}]
+    ## Messages de chargement sur la sortie d'erreur, rien sur la sortie standard
+    assert capsys.readouterr().out == ""
+
+
+def test_report_missing_file_fails(tmp_path, capsys):
+    args = build_parser().parse_args(["report", "--files", str(tmp_path / "absent.csv")])
+
+    assert run_report(args) == 1
+    assert "Erreur" in capsys.readouterr().err